@@ -5,6 +5,7 @@ Demonstrates how to enrich missing data and validate data quality
 """
 
 import pandas as pd
+import re
 import time
 from datetime import datetime
 
@@ -157,8 +158,9 @@ class DataQualityValidator:
         if not value or str(value).lower() in ['nan', 'unknown']:
             return False, "Missing revenue"
 
-        if not str(value).startswith('$') or not str(value).endswith('M'):
-            return False, f"Invalid format: {value} (should be $XXXm)"
+        # '$20M' for USD amounts, 'EUR 20M' (ISO code) for other currencies
+        if not re.match(r'^(\$|[A-Z]{3} )\d+(\.\d+)?M$', str(value)):
+            return False, f"Invalid format: {value} (should be $XXXM or CCC XXXM)"
 
         return True, None
 
@@ -315,9 +317,10 @@ def enrichment_example():
 # Quality Assurance Checks
 
 
-def qa_validation_example():
+def qa_validation_example(df=None):
     """
     Example of automated quality assurance checks
+    Pass a scored DataFrame to run the checks in memory
     """
     print(f"\n{'='*50}")
     print("QUALITY ASSURANCE VALIDATION")
@@ -325,7 +328,8 @@ def qa_validation_example():
 
     # Load the actual prioritized dataset for QA
     try:
-        df = pd.read_csv('../deliverables/prioritized_accounts.csv')
+        if df is None:
+            df = pd.read_csv('../deliverables/prioritized_accounts.csv')
 
         validator = DataQualityValidator()
 
@@ -370,6 +374,8 @@ def qa_validation_example():
         else:
             print(f"\n✅ Data quality meets standards")
 
+        return qa_results
+
     except FileNotFoundError:
         print("Prioritized accounts file not found - run main scoring script first")
 
@@ -8,15 +8,95 @@ This script provides initial exploration of the Diligent prospect dataset
 to understand data structure, quality, and fields for cleaning.
 """
 
+import importlib
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import warnings
 import os
 warnings.filterwarnings('ignore')
 
 
+def build_quality_assessment(df):
+    """Per-column missing counts, unique values and types for a loaded frame"""
+    # Missing data analysis
+    missing_data = df.isnull().sum()
+    missing_pct = (missing_data / len(df)) * 100
+
+    quality_df = pd.DataFrame({
+        'Column': df.columns,
+        'Missing_Count': missing_data.values,
+        'Missing_Percentage': missing_pct.values,
+        'Unique_Values': [df[col].nunique() for col in df.columns],
+        'Data_Type': df.dtypes.values
+    })
+
+    return quality_df.sort_values('Missing_Percentage', ascending=False)
+
+
+def print_field_categories(columns):
+    """Identify key fields for analysis"""
+    print("\n" + "="*50)
+    print("KEY FIELD CATEGORIES")
+    print("="*50)
+
+    company_fields = [col for col in columns if any(term in col.lower()
+                                                    for term in ['company', 'name', 'website', 'domain', 'sfdc'])]
+    firmographic_fields = [col for col in columns if any(term in col.lower()
+                                                         for term in ['industry', 'employee', 'revenue', 'tier', 'location', 'region'])]
+    gtm_fields = [col for col in columns if any(term in col.lower()
+                                                for term in ['interest', 'source', 'role', 'title', 'tech', 'intent', 'touch', 'status'])]
+
+    print("Company Info Fields:", company_fields)
+    print("Firmographic Fields:", firmographic_fields)
+    print("GTM Signal Fields:", gtm_fields)
+
+
+def stream_and_explore_data(chunksize=100_000):
+    """
+    Profile the dataset in a single chunked pass instead of loading it.
+    Returns the StreamingProfiler (with its top-K sketches and a 20-row
+    sample) and the quality assessment table.
+    """
+    streaming = importlib.import_module('streaming_profiler')
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(
+        script_dir, '..', 'data', 'Diligent_GTM_Engineer_Exercise_with_Instructions.xlsx')
+
+    try:
+        profiler = streaming.StreamingProfiler().profile_file(file_path, chunksize)
+        quality_df = profiler.quality_assessment()
+
+        print(f"\nDataset Shape: ({profiler.rows}, {len(profiler.columns)})")
+        print(f"Total Records: {profiler.rows}")
+
+        print("\n" + "="*50)
+        print("DATASET OVERVIEW")
+        print("="*50)
+
+        print("\nColumn Names and Types:")
+        for i, (col, column_profile) in enumerate(profiler.columns.items()):
+            print(f"{i+1:2d}. {col:<30} ({column_profile.data_type()})")
+
+        print("\n" + "="*50)
+        print("DATA QUALITY ASSESSMENT")
+        print("="*50)
+        print(quality_df.to_string(index=False))
+
+        print("\n" + "="*50)
+        print("SAMPLE DATA (First 5 rows)")
+        print("="*50)
+        print(profiler.sample.head().to_string())
+
+        print_field_categories(list(profiler.columns))
+
+        return profiler, quality_df
+
+    except Exception as e:
+        print(f"Error profiling data: {e}")
+        return None, None
+
+
 def load_and_explore_data():
     """Load the dataset and perform initial exploration"""
 
@@ -49,20 +129,7 @@ def load_and_explore_data():
         print("DATA QUALITY ASSESSMENT")
         print("="*50)
 
-        # Missing data analysis
-        missing_data = df.isnull().sum()
-        missing_pct = (missing_data / len(df)) * 100
-
-        quality_df = pd.DataFrame({
-            'Column': df.columns,
-            'Missing_Count': missing_data.values,
-            'Missing_Percentage': missing_pct.values,
-            'Unique_Values': [df[col].nunique() for col in df.columns],
-            'Data_Type': df.dtypes.values
-        })
-
-        quality_df = quality_df.sort_values(
-            'Missing_Percentage', ascending=False)
+        quality_df = build_quality_assessment(df)
         print(quality_df.to_string(index=False))
 
         print("\n" + "="*50)
@@ -70,21 +137,7 @@ def load_and_explore_data():
         print("="*50)
         print(df.head().to_string())
 
-        # Identify key fields for analysis
-        print("\n" + "="*50)
-        print("KEY FIELD CATEGORIES")
-        print("="*50)
-
-        company_fields = [col for col in df.columns if any(term in col.lower()
-                                                           for term in ['company', 'name', 'website', 'domain', 'sfdc'])]
-        firmographic_fields = [col for col in df.columns if any(term in col.lower()
-                                                                for term in ['industry', 'employee', 'revenue', 'tier', 'location', 'region'])]
-        gtm_fields = [col for col in df.columns if any(term in col.lower()
-                                                       for term in ['interest', 'source', 'role', 'title', 'tech', 'intent', 'touch', 'status'])]
-
-        print("Company Info Fields:", company_fields)
-        print("Firmographic Fields:", firmographic_fields)
-        print("GTM Signal Fields:", gtm_fields)
+        print_field_categories(df.columns)
 
         return df, quality_df
 
@@ -93,35 +146,45 @@ def load_and_explore_data():
         return None, None
 
 
-def analyze_key_fields(df):
-    """Analyze key fields that need cleaning/standardization"""
+def analyze_key_fields(df=None, profiler=None):
+    """Analyze key fields that need cleaning/standardization
+
+    Pass a StreamingProfiler instead of a DataFrame to report the values
+    from its top-K sketches without loading the data.
+    """
+    if profiler is not None:
+        columns = list(profiler.columns)
+        def value_counts(col): return profiler.top_values(col, n=50)
+    else:
+        columns = df.columns
+        def value_counts(col): return df[col].value_counts()
 
     print("\n" + "="*50)
     print("FIELD-SPECIFIC ANALYSIS")
     print("="*50)
 
     # Employee count analysis
-    if 'Employee Count' in df.columns:
+    if 'Employee Count' in columns:
         print("\nEmployee Count Values:")
-        print(df['Employee Count'].value_counts().head(10))
+        print(value_counts('Employee Count').head(10))
 
     # Revenue analysis
-    revenue_cols = [col for col in df.columns if 'revenue' in col.lower()]
+    revenue_cols = [col for col in columns if 'revenue' in col.lower()]
     for col in revenue_cols:
         print(f"\n{col} Values:")
-        print(df[col].value_counts().head(10))
+        print(value_counts(col).head(10))
 
     # Region analysis
-    region_cols = [col for col in df.columns if 'region' in col.lower()]
+    region_cols = [col for col in columns if 'region' in col.lower()]
     for col in region_cols:
         print(f"\n{col} Values:")
-        print(df[col].value_counts())
+        print(value_counts(col))
 
     # Industry analysis
-    industry_cols = [col for col in df.columns if 'industry' in col.lower()]
+    industry_cols = [col for col in columns if 'industry' in col.lower()]
     for col in industry_cols:
         print(f"\n{col} Values:")
-        print(df[col].value_counts().head(10))
+        print(value_counts(col).head(10))
 
 
 if __name__ == "__main__":
@@ -130,10 +193,11 @@ if __name__ == "__main__":
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
-    df, quality_df = load_and_explore_data()
+    # Single streaming pass; the dataset is never fully loaded
+    profiler, quality_df = stream_and_explore_data()
 
-    if df is not None:
-        analyze_key_fields(df)
+    if profiler is not None:
+        analyze_key_fields(profiler=profiler)
 
         # Save quality assessment
         quality_path = os.path.join(
@@ -144,7 +208,7 @@ if __name__ == "__main__":
         # Save sample of raw data for reference
         sample_path = os.path.join(
             script_dir, '..', 'analysis', 'sample_raw_data.csv')
-        df.head(20).to_csv(sample_path, index=False)
+        profiler.sample.to_csv(sample_path, index=False)
         print(f"Sample raw data saved to {sample_path}")
 
     print("\nExploration complete!")
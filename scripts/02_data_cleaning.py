@@ -8,23 +8,216 @@ This script cleans and standardizes the Diligent prospect dataset,
 including normalization of employee ranges, revenue values, regions, and dates.
 """
 
+import argparse
+import importlib
 import pandas as pd
 import numpy as np
 import re
+from contextlib import nullcontext
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+fx_rates = importlib.import_module('fx_rates')
+
+# Numeric column -> clean string column it is derived from
+NUMERIC_FIRMOGRAPHIC_SOURCES = {
+    'Revenue_USD': 'Revenue_Clean',
+    'Employee_Count_Min': 'Employee_Count_Clean',
+    'Employee_Count_Max': 'Employee_Count_Clean'
+}
+
+
+def revenue_label(millions, currency='USD'):
+    """Revenue_Clean label: '$300M' for USD, 'EUR 300M' for other currencies"""
+    if currency == 'USD':
+        return f"${int(millions)}M"
+    return f"{currency} {int(millions)}M"
+
+
+def revenue_millions(value):
+    """Revenue in millions of its source currency (NaN if unparseable)"""
+    if pd.isna(value) or str(value).lower() in ['nan', 'unknown', 'n/a', '']:
+        return np.nan
+
+    value_str = str(value).strip()
+
+    # Extract numeric value
+    # Handle formats: €20M, $20M, USD 250M, 5000000, 20,000,000 USD
+
+    # Remove currency symbols and convert to number
+    clean_value = re.sub(r'[€$,]', '', value_str)
+
+    # Handle different notations
+    if 'USD' in clean_value.upper():
+        clean_value = re.sub(r'USD', '', clean_value,
+                             flags=re.IGNORECASE).strip()
+
+    # Extract the numeric part
+    numeric_match = re.search(r'(\d+(?:\.\d+)?)', clean_value)
+    if not numeric_match:
+        return np.nan
+
+    number = float(numeric_match.group(1))
+
+    # Handle scale indicators: only a suffix right after the number, so
+    # currency codes such as GBP are not read as billions
+    scale_match = re.search(r'\d\s*([MB])\b', value_str.upper())
+    scale = scale_match.group(1) if scale_match else None
+    if scale == 'M':
+        return number
+    elif scale == 'B':
+        return number * 1000  # Convert billions to millions
+    elif len(str(int(number))) >= 7:  # 5000000 format
+        return number / 1000000
+    else:
+        return number
+
+
+def numeric_firmographics(df, fx_as_of=None):
+    """Revenue_USD (float32) and headcount bounds (Int32) from the clean strings
+
+    Revenue_Clean keeps the amount in its source currency (see
+    revenue_label); Revenue_USD is converted with the FX table using
+    Revenue_Currency, or else the currency detected from the raw Revenue
+    column or the label itself. The amount comes from the raw Revenue value
+    where it still matches the label, since the label is truncated to whole
+    millions ($1.5M reads '$1M').
+    """
+    labels = df['Revenue_Clean'].astype(str)
+    millions = labels.str.extract(r'^(?:\$|[A-Z]{3} )(\d+(?:\.\d+)?)M$', expand=False)
+    millions = pd.to_numeric(millions, errors='coerce')
+    if 'Revenue_Currency' in df.columns:
+        currency = df['Revenue_Currency']
+    elif 'Revenue' in df.columns:
+        currency = fx_rates.detect_currency(df['Revenue'])
+    else:
+        currency = fx_rates.detect_currency(labels)
+    if 'Revenue' in df.columns:
+        raw = df['Revenue'].map(revenue_millions).astype('float64')
+        raw_labels = pd.Series([revenue_label(amount, code) if pd.notna(amount) else None
+                                for amount, code in zip(raw, currency)], index=df.index)
+        millions = raw.where(raw_labels == labels, millions)
+    revenue = fx_rates.convert_to_usd(millions * 1_000_000, currency, fx_as_of)
+    revenue_usd = revenue.astype('float32')
+
+    # '500-1,000' -> (500, 1000), '1000+' -> (1000, <NA>), '800' -> (800, 800)
+    counts = df['Employee_Count_Clean'].astype(str).str.replace(',', '', regex=False)
+    bounds = counts.str.strip().str.extract(r'^(\d+)\s*(?:-\s*(\d+)|(\+))?$')
+    low = pd.to_numeric(bounds[0], errors='coerce')
+    high = pd.to_numeric(bounds[1], errors='coerce')
+    high = high.where(bounds[1].notna() | bounds[2].notna(), low)
+
+    return pd.DataFrame({
+        'Revenue_USD': revenue_usd,
+        'Employee_Count_Min': low.astype('Int32'),
+        'Employee_Count_Max': high.astype('Int32')
+    }, index=df.index)
+
+
+def with_numeric_firmographics(df, fx_as_of=None):
+    """df with the numeric columns, deriving them if an older file lacks them
+
+    With fx_as_of set they are always re-derived, so Revenue_USD uses the
+    FX rates in effect on that date rather than the ones it was cleaned with.
+    """
+    if fx_as_of is None and all(column in df.columns
+                                for column in NUMERIC_FIRMOGRAPHIC_SOURCES):
+        return df
+    df = df.copy()
+    numeric = numeric_firmographics(df, fx_as_of)
+    for column in NUMERIC_FIRMOGRAPHIC_SOURCES:
+        df[column] = numeric[column]
+    return df
+
+
+# Raw values that mean "no data" rather than a parse failure
+MISSING_VALUE_STRINGS = ['nan', 'unknown', 'n/a', '']
+
+# Quarantine reason codes (bit flags, so a row can carry several)
+QUARANTINE_REASONS = {
+    'INVALID_DATE': 1,
+    'UNPARSEABLE_REVENUE': 2,
+    'UNPARSEABLE_EMPLOYEE_COUNT': 4,
+    'INVALID_INTENT_SCORE': 8
+}
+
+
+def _has_raw_value(values):
+    present = values.notna()
+    text = values.astype(object).where(present, '').astype(str).str.strip().str.lower()
+    return present & ~text.isin(MISSING_VALUE_STRINGS)
+
+
+def parse_intent_scores(values):
+    """Numeric intent scores; '95%' style values are read as 95, anything
+    else non-numeric ('high', 'low') becomes NaN"""
+    numeric = pd.to_numeric(values, errors='coerce')
+    percent = values.astype(str).str.strip().str.extract(
+        r'^(\d+(?:\.\d+)?)\s*%$', expand=False)
+    return numeric.fillna(pd.to_numeric(percent, errors='coerce'))
+
+
+def quarantine_flags(df):
+    """
+    Reason-code bit flags per cleaned row (0 = well formed), from
+    vectorized masks over the cleaned columns:
+    - INVALID_DATE: a marketing touch that did not normalize to YYYY-MM-DD
+    - UNPARSEABLE_REVENUE: a raw revenue with no USD amount after cleaning
+    - UNPARSEABLE_EMPLOYEE_COUNT: a raw headcount with no numeric bounds
+    - INVALID_INTENT_SCORE: an intent score outside 0-100, or a raw
+      intent that is not a number or percentage ('high', 'low')
+    """
+    touch = df['Last_Marketing_Touch_Clean']
+    parsed = pd.to_datetime(touch, format='%Y-%m-%d', errors='coerce')
+    intent = df['Intent_Score_Clean']
+
+    masks = {
+        'INVALID_DATE': touch.notna() & parsed.isna(),
+        'UNPARSEABLE_REVENUE': _has_raw_value(df['Revenue']) & df['Revenue_USD'].isna(),
+        'UNPARSEABLE_EMPLOYEE_COUNT': (_has_raw_value(df['Employee Count']) &
+                                       df['Employee_Count_Min'].isna()),
+        'INVALID_INTENT_SCORE': ((intent.notna() & ~intent.between(0, 100)) |
+                                 (_has_raw_value(df['Intent Score']) & intent.isna()))
+    }
+
+    flags = np.zeros(len(df), dtype=np.uint8)
+    for reason, mask in masks.items():
+        flags |= np.where(mask.to_numpy(dtype=bool), QUARANTINE_REASONS[reason], 0).astype(np.uint8)
+    return flags
+
+
+def describe_quarantine_flags(flags):
+    """'INVALID_DATE|UNPARSEABLE_REVENUE' style labels, one per distinct flag value"""
+    labels = {
+        value: '|'.join(reason for reason, bit in QUARANTINE_REASONS.items() if value & bit)
+        for value in np.unique(flags)
+    }
+    return pd.Series(flags).map(labels).to_numpy()
+
 
 class DiligentDataCleaner:
-    def __init__(self, file_path):
+    def __init__(self, file_path, profiler=None):
         self.file_path = file_path
         self.df = None
         self.cleaned_df = None
-
-    def load_data(self):
-        """Load the dataset from Excel file"""
-        self.df = pd.read_excel(self.file_path, sheet_name='Dataset')
+        self.token_matrices = None
+        self.quarantine_df = None
+        self.quarantine_flags = None
+        self.profiler = profiler
+
+    def _stage(self, name):
+        """Profile a cleaning step when a StageProfiler is attached"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name, rows=len(self.cleaned_df))
+
+    def load_data(self, df=None):
+        """Load the dataset from Excel file, or use an in-memory DataFrame"""
+        if df is not None:
+            self.df = df
+        else:
+            self.df = pd.read_excel(self.file_path, sheet_name='Dataset')
         print(
             f"Loaded {len(self.df)} records with {len(self.df.columns)} columns")
         return self.df
@@ -58,39 +251,11 @@ class DiligentDataCleaner:
         return value_str.title()
 
     def normalize_revenue(self, value):
-        """Normalize revenue to USD millions format"""
-        if pd.isna(value) or str(value).lower() in ['nan', 'unknown', 'n/a', '']:
-            return 'Unknown'
-
-        value_str = str(value).strip()
-
-        # Extract numeric value and currency
-        # Handle formats: €20M, $20M, USD 250M, 5000000, 20,000,000 USD
-
-        # Remove currency symbols and convert to number
-        clean_value = re.sub(r'[€$,]', '', value_str)
-
-        # Handle different notations
-        if 'USD' in clean_value.upper():
-            clean_value = re.sub(r'USD', '', clean_value,
-                                 flags=re.IGNORECASE).strip()
-
-        # Extract the numeric part
-        numeric_match = re.search(r'(\d+(?:\.\d+)?)', clean_value)
-        if not numeric_match:
+        """Normalize revenue to millions in its source currency (see revenue_label, Revenue_USD)"""
+        millions = revenue_millions(value)
+        if pd.isna(millions):
             return 'Unknown'
-
-        number = float(numeric_match.group(1))
-
-        # Handle scale indicators
-        if 'M' in value_str.upper():
-            return f"${int(number)}M"
-        elif 'B' in value_str.upper():
-            return f"${int(number * 1000)}M"  # Convert billions to millions
-        elif len(str(int(number))) >= 7:  # 5000000 format
-            return f"${int(number / 1000000)}M"
-        else:
-            return f"${int(number)}M"
+        return revenue_label(millions, fx_rates.currency_of(str(value).strip()))
 
     def normalize_region(self, value):
         """Normalize region codes to standard format"""
@@ -195,63 +360,111 @@ class DiligentDataCleaner:
 
         return ', '.join(cleaned_tech) if cleaned_tech else None
 
-    def clean_data(self):
-        """Main data cleaning pipeline"""
+    def clean_data(self, fx_as_of=None):
+        """Main data cleaning pipeline
+
+        Revenue_USD is converted with the FX rates in effect on fx_as_of
+        (default: the latest rates in the FX table).
+        """
         print("Starting data cleaning pipeline...")
 
         # Create a copy for cleaning
         self.cleaned_df = self.df.copy()
 
         # Clean Employee Count
-        print("Cleaning Employee Count...")
-        self.cleaned_df['Employee_Count_Clean'] = self.cleaned_df['Employee Count'].apply(
-            self.normalize_employee_count)
+        with self._stage('Employee Count'):
+            print("Cleaning Employee Count...")
+            self.cleaned_df['Employee_Count_Clean'] = self.cleaned_df['Employee Count'].apply(
+                self.normalize_employee_count)
 
         # Clean Revenue
-        print("Cleaning Revenue...")
-        self.cleaned_df['Revenue_Clean'] = self.cleaned_df['Revenue'].apply(
-            self.normalize_revenue)
+        with self._stage('Revenue'):
+            print("Cleaning Revenue...")
+            self.cleaned_df['Revenue_Clean'] = self.cleaned_df['Revenue'].apply(
+                self.normalize_revenue)
+            self.cleaned_df['Revenue_Currency'] = fx_rates.detect_currency(
+                self.cleaned_df['Revenue'])
+
+        # Numeric revenue and headcount for range-based scoring
+        with self._stage('Numeric Firmographics'):
+            print("Deriving numeric Revenue_USD and headcount bounds...")
+            numeric = numeric_firmographics(self.cleaned_df, fx_as_of)
+            for column in NUMERIC_FIRMOGRAPHIC_SOURCES:
+                self.cleaned_df[column] = numeric[column]
 
         # Clean Region
-        print("Cleaning Region...")
-        self.cleaned_df['Region_Clean'] = self.cleaned_df['Region'].apply(
-            self.normalize_region)
+        with self._stage('Region'):
+            print("Cleaning Region...")
+            self.cleaned_df['Region_Clean'] = self.cleaned_df['Region'].apply(
+                self.normalize_region)
 
         # Clean Date
-        print("Cleaning Last Marketing Touch...")
-        self.cleaned_df['Last_Marketing_Touch_Clean'] = self.cleaned_df['Last Marketing Touch'].apply(
-            self.normalize_date)
+        with self._stage('Last Marketing Touch'):
+            print("Cleaning Last Marketing Touch...")
+            self.cleaned_df['Last_Marketing_Touch_Clean'] = self.cleaned_df['Last Marketing Touch'].apply(
+                self.normalize_date)
 
         # Clean Website
-        print("Cleaning Website...")
-        self.cleaned_df['Website_Clean'] = self.cleaned_df['Website'].apply(
-            self.normalize_website)
+        with self._stage('Website'):
+            print("Cleaning Website...")
+            self.cleaned_df['Website_Clean'] = self.cleaned_df['Website'].apply(
+                self.normalize_website)
 
         # Clean Tech Stack
-        print("Cleaning Tech Stack...")
-        self.cleaned_df['Tech_Stack_Clean'] = self.cleaned_df['Tech Stack Signals'].apply(
-            self.standardize_tech_stack)
+        with self._stage('Tech Stack'):
+            print("Cleaning Tech Stack...")
+            self.cleaned_df['Tech_Stack_Clean'] = self.cleaned_df['Tech Stack Signals'].apply(
+                self.standardize_tech_stack)
 
         # Handle missing SFDC IDs
-        print("Handling missing SFDC Account IDs...")
-        self.cleaned_df['SFDC_Account_ID_Clean'] = self.cleaned_df['SFDC Account ID'].fillna(
-            'Missing')
+        with self._stage('SFDC Account ID'):
+            print("Handling missing SFDC Account IDs...")
+            self.cleaned_df['SFDC_Account_ID_Clean'] = self.cleaned_df['SFDC Account ID'].fillna(
+                'Missing')
 
         # Clean Lead Owner (remove test users)
-        print("Cleaning Lead Owner...")
-        self.cleaned_df['Lead_Owner_Clean'] = self.cleaned_df['Lead Owner'].apply(
-            lambda x: 'Unassigned' if pd.isna(x) or 'test' in str(x).lower() or x == 'TBD' else x)
+        with self._stage('Lead Owner'):
+            print("Cleaning Lead Owner...")
+            self.cleaned_df['Lead_Owner_Clean'] = self.cleaned_df['Lead Owner'].apply(
+                lambda x: 'Unassigned' if pd.isna(x) or 'test' in str(x).lower() or x == 'TBD' else x)
 
         # Standardize Intent Score
-        print("Cleaning Intent Score...")
-        self.cleaned_df['Intent_Score_Clean'] = pd.to_numeric(
-            self.cleaned_df['Intent Score'], errors='coerce')
+        with self._stage('Intent Score'):
+            print("Cleaning Intent Score...")
+            self.cleaned_df['Intent_Score_Clean'] = parse_intent_scores(
+                self.cleaned_df['Intent Score'])
+
+        # Route rows that failed parsing to the quarantine lane
+        with self._stage('Quarantine'):
+            print("Quarantining unparseable records...")
+            flags = quarantine_flags(self.cleaned_df)
+            quarantined = flags > 0
+            self.quarantine_flags = flags[quarantined]
+            self.quarantine_df = self.cleaned_df[quarantined].copy()
+            self.quarantine_df['Quarantine_Reasons'] = describe_quarantine_flags(
+                self.quarantine_flags)
+            self.cleaned_df = self.cleaned_df[~quarantined].reset_index(drop=True)
+            print(f"Quarantined {len(self.quarantine_df)} records")
+
+        # Tokenize tech stack and certifications into multi-hot matrices
+        with self._stage('Token Matrices'):
+            print("Tokenizing Tech Stack and Compliance Certifications...")
+            token_matrix = importlib.import_module('token_matrix')
+            self.token_matrices = token_matrix.TokenMatrices.from_frame(self.cleaned_df)
 
         print("Data cleaning completed!")
         return self.cleaned_df
 
-    def generate_cleaning_report(self):
-        """Generate a report on data cleaning results"""
+    def generate_cleaning_report(self, output_path='data/cleaned_diligent_dataset.csv',
+                                 quality_history_dir=None,
+                                 quarantine_path='data/quarantined_records.csv'):
+        """Generate a report on data cleaning results (output_path=None skips saving)
+
+        With quality_history_dir set, the cleaned data's quality statistics
+        are checked for drift against earlier runs and saved for later ones.
+        Quarantined rows are written to quarantine_path alongside the
+        cleaned dataset.
+        """
         if self.cleaned_df is None:
             print("Please run clean_data() first")
             return
@@ -268,25 +481,68 @@ class DiligentDataCleaner:
             ('Website', 'Website_Clean')
         ]
 
+        # One mergeable statistics pass per frame instead of per-field scans
+        quality_stats = importlib.import_module('quality_stats')
+        before = quality_stats.compute_stats(
+            self.df[[original for original, _ in fields_to_compare]])
+        # Only the compared fields, plus the drift-watched ones when a history
+        # run needs them, rather than every column of the cleaned frame
+        after_columns = [cleaned for _, cleaned in fields_to_compare]
+        if quality_history_dir is not None:
+            after_columns += [column for column in quality_stats.DRIFT_WATCH_COLUMNS
+                              if column in self.cleaned_df.columns
+                              and column not in after_columns]
+        after = quality_stats.compute_stats(self.cleaned_df[after_columns])
+
         for original, cleaned in fields_to_compare:
             print(f"\n{original.upper()} CLEANING RESULTS:")
-            print(f"Original unique values: {self.df[original].nunique()}")
+            print(f"Original unique values: {before.columns[original].distinct.count()}")
             print(
-                f"Cleaned unique values: {self.cleaned_df[cleaned].nunique()}")
-            print(f"Original missing: {self.df[original].isna().sum()}")
+                f"Cleaned unique values: {after.columns[cleaned].distinct.count()}")
+            print(f"Original missing: {before.columns[original].missing}")
             print(
-                f"Cleaned missing/unknown: {(self.cleaned_df[cleaned].isna() | (self.cleaned_df[cleaned] == 'Unknown')).sum()}")
+                f"Cleaned missing/unknown: {after.columns[cleaned].unknown}")
+
+        self.report_quarantine()
+
+        if quality_history_dir is not None:
+            history = quality_stats.QualityHistory(quality_history_dir)
+            quality_stats.print_alerts(history.check_drift(after))
+            stats_path = history.save_run(after, source=self.file_path)
+            print(f"Quality statistics saved to: {stats_path}")
 
         # Save the cleaned dataset
-        output_path = 'data/cleaned_diligent_dataset.csv'
-        self.cleaned_df.to_csv(output_path, index=False)
-        print(f"\nCleaned dataset saved to: {output_path}")
+        if output_path is not None:
+            self.cleaned_df.to_csv(output_path, index=False)
+            print(f"\nCleaned dataset saved to: {output_path}")
+            if quarantine_path is not None:
+                self.quarantine_df.to_csv(quarantine_path, index=False)
+                print(f"Quarantined records saved to: {quarantine_path}")
 
         return self.cleaned_df
 
+    def report_quarantine(self):
+        """Print this run's quarantine volume by reason code"""
+        total = len(self.cleaned_df) + len(self.quarantine_df)
+        print("\nQUARANTINE RESULTS:")
+        print(f"Quarantined records: {len(self.quarantine_df)} "
+              f"({(len(self.quarantine_df) / total) * 100 if total else 0:.1f}%)")
+
+        counts = {reason: int(np.count_nonzero(self.quarantine_flags & bit))
+                  for reason, bit in QUARANTINE_REASONS.items()}
+        for reason, count in counts.items():
+            print(f"  {reason}: {count}")
+        return counts
+
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Clean the raw GTM dataset')
+    parser.add_argument('--fx-as-of',
+                        help='Convert revenue with the FX rates as of this date '
+                             '(default: latest)')
+    args = parser.parse_args()
+
     print("GTM Engineer Data Cleaning Pipeline")
     print("="*50)
 
@@ -296,7 +552,7 @@ def main():
 
     # Load and clean data
     cleaner.load_data()
-    cleaned_df = cleaner.clean_data()
+    cleaned_df = cleaner.clean_data(fx_as_of=args.fx_as_of)
     cleaner.generate_cleaning_report()
 
     print("\nData cleaning pipeline completed successfully!")
@@ -10,24 +10,195 @@ accounts for the Diligent sales team based on firmographic and behavioral signal
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+import importlib
+from contextlib import nullcontext
+from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+cleaning = importlib.import_module('02_data_cleaning')
+scoring_dashboard = importlib.import_module('scoring_dashboard')
+token_matrix = importlib.import_module('token_matrix')
+quantile_sketch = importlib.import_module('quantile_sketch')
+output_writer = importlib.import_module('output_writer')
+
+# Priority tier boundaries on the 0-100 Total_ICP_Score scale
+PRIORITY_TIER_BINS = [0, 40, 60, 80, 100]
+PRIORITY_TIER_LABELS = ['Low', 'Medium', 'High', 'Critical']
+
+# Scoring rules evaluated in one vectorized pass. For each factor a row gets
+# a compact rule code: 0 = default rule, 1..n = the first matching rule in
+# `rules`, n+1 = the `missing` rule. Points and explanation labels are
+# looked up from the code, so explanations cost one uint8 per factor.
+SCORING_RULES = {
+    # Firmographic fit (0-40 points)
+    'employee_count': {
+        'component': 'Firmographic_Score', 'column': 'Employee_Count_Min', 'match': 'at_least',
+        'default': (0, 'Employee count outside target ranges'),
+        'rules': [(15, '1000+ employees', 1000),
+                  (12, '500-999 employees', 500),
+                  (10, '200-499 employees', 200),
+                  (5, '50-199 employees', 50)]
+    },
+    'revenue': {
+        'component': 'Firmographic_Score', 'column': 'Revenue_USD', 'match': 'at_least',
+        'default': (0, 'Revenue outside target ranges'),
+        'rules': [(15, '$250M+ revenue', 250e6),
+                  (12, '$100M-250M revenue', 100e6),
+                  (8, '$20M-100M revenue', 20e6),
+                  (4, '$5M-20M revenue', 5e6)]
+    },
+    'industry': {
+        'component': 'Firmographic_Score', 'column': 'Industry', 'match': 'isin',
+        'default': (3, 'Other industry'),
+        'rules': [(10, 'Financial Services industry', ['Financial Services']),
+                  (10, 'Healthcare industry', ['Healthcare']),
+                  (10, 'Energy industry', ['Energy']),
+                  (10, 'Manufacturing industry', ['Manufacturing']),
+                  (10, 'Legal industry', ['Legal']),
+                  (7, 'Technology industry', ['Technology']),
+                  (7, 'Government industry', ['Government'])]
+    },
+    # Solution interest and role fit (0-25 points)
+    'solution_interest': {
+        'component': 'Solution_Fit_Score', 'column': 'Solution Interest', 'match': 'isin',
+        'default': (5, 'Other solution interest'),
+        'rules': [(15, 'Risk interest', ['Risk']),
+                  (12, 'Compliance interest', ['Compliance']),
+                  (10, 'Boards interest', ['Boards'])]
+    },
+    'contact_role': {
+        'component': 'Solution_Fit_Score', 'column': 'Contact Role/Title', 'match': 'contains',
+        'default': (3, 'Other contact role'),
+        'rules': [(10, 'Chief Risk Officer role', 'chief risk officer'),
+                  (10, 'Risk Manager role', 'risk manager'),
+                  (10, 'Board Secretary role', 'board secretary'),
+                  (10, 'General Counsel role', 'general counsel'),
+                  (10, 'Legal Counsel role', 'legal counsel'),
+                  (10, 'Compliance Officer role', 'compliance officer'),
+                  (7, 'Director of Security role', 'director of security'),
+                  (7, 'IT Director role', 'it director'),
+                  (7, 'CFO role', 'cfo'),
+                  (7, 'CISO role', 'ciso')]
+    },
+    # Intent and engagement signals (0-20 points)
+    'intent_score': {
+        'component': 'Intent_Signals_Score', 'column': 'Intent_Score_Clean', 'match': 'at_least',
+        'default': (3, 'Intent score below 40'),
+        'missing': (0, 'No intent score'),
+        'rules': [(10, 'Intent score 80+', 80),
+                  (8, 'Intent score 60-79', 60),
+                  (6, 'Intent score 40-59', 40)]
+    },
+    'lead_source': {
+        'component': 'Intent_Signals_Score', 'column': 'Lead Source', 'match': 'isin',
+        'default': (2, 'Other lead source'),
+        'rules': [(5, 'Referral lead', ['Referral']),
+                  (4, 'Event lead', ['Event']),
+                  (3, 'Web lead', ['Web'])]
+    },
+    'recency': {
+        'component': 'Intent_Signals_Score', 'column': 'Last_Marketing_Touch_Clean',
+        'match': 'days_since_at_most',
+        'default': (1, 'Last touch over 90 days ago'),
+        'missing': (0, 'No marketing touch'),
+        'rules': [(5, 'Touched in last 30 days', 30),
+                  (3, 'Touched in last 90 days', 90)]
+    },
+    # Technology and compliance readiness (0-15 points)
+    'tech_stack': {
+        'component': 'Tech_Compliance_Score', 'column': 'Tech_Stack_Clean', 'match': 'contains',
+        'default': (3, 'Other tech stack'),
+        'missing': (0, 'No tech stack data'),
+        'rules': [(8, 'Salesforce in stack', 'salesforce'),
+                  (8, 'ServiceNow in stack', 'servicenow'),
+                  (8, 'Workday in stack', 'workday'),
+                  (8, 'Okta in stack', 'okta'),
+                  (5, 'HubSpot in stack', 'hubspot'),
+                  (5, 'Marketo in stack', 'marketo'),
+                  (5, 'Pardot in stack', 'pardot')]
+    },
+    'certifications': {
+        'component': 'Tech_Compliance_Score', 'column': 'Compliance Certifications',
+        'match': 'contains',
+        'default': (2, 'Other certification'),
+        'missing': (0, 'No certification data'),
+        'rules': [(7, 'SOX', 'sox'),
+                  (7, 'PCI DSS', 'pci dss'),
+                  (7, 'ISO27001', 'iso27001'),
+                  (5, 'GDPR', 'gdpr'),
+                  (5, 'HIPAA', 'hipaa')]
+    }
+}
+
+SCORE_COMPONENTS = ['Firmographic_Score', 'Solution_Fit_Score',
+                    'Intent_Signals_Score', 'Tech_Compliance_Score']
+
+# Columns read by assign_icp_archetypes()
+ARCHETYPE_FIELDS = ['Employee_Count_Min', 'Employee_Count_Max', 'Revenue_USD', 'Industry',
+                    'Solution Interest', 'Contact Role/Title']
+
+
+def assign_priority_tiers(scores, thresholds=None):
+    """
+    Priority tiers for scores. `thresholds` is None for the fixed
+    PRIORITY_TIER_BINS, or a {tier: minimum score} dict, highest tier
+    first, as produced by quantile tiering (ICPScorer.tier_thresholds).
+    """
+    if thresholds is None:
+        return pd.cut(scores, bins=PRIORITY_TIER_BINS, labels=PRIORITY_TIER_LABELS,
+                      include_lowest=True)
+    tiers = quantile_sketch.assign_tiers(scores, thresholds, default=PRIORITY_TIER_LABELS[0])
+    if isinstance(scores, pd.Series):
+        return pd.Series(tiers, index=scores.index, name=scores.name)
+    return tiers
+
+
+def infer_tier_thresholds(scored_df):
+    """
+    Tier thresholds a scored frame was tiered with, for frames whose scorer
+    is gone (e.g. read back from CSV): None when Priority_Tier matches the
+    fixed bins, otherwise the lowest score seen in each tier above Low.
+    """
+    scores = scored_df['Total_ICP_Score'].to_numpy(dtype=np.float64)
+    tiers = scored_df['Priority_Tier'].astype(object).to_numpy()
+    fixed = np.asarray(assign_priority_tiers(scores), dtype=object)
+    if (fixed == tiers).all():
+        return None
+
+    thresholds = {}
+    floor = np.inf
+    for tier in PRIORITY_TIER_LABELS[:0:-1]:
+        in_tier = scores[tiers == tier]
+        # An empty tier gets its upper neighbour's floor, so no score lands in it
+        floor = min(floor, in_tier.min()) if len(in_tier) else floor
+        thresholds[tier] = float(floor)
+    return thresholds
+
 
 class ICPScorer:
-    def __init__(self, cleaned_data_path):
-        self.df = pd.read_csv(cleaned_data_path)
+    def __init__(self, cleaned_data, profiler=None, token_matrices=None):
+        # Accept either a path to the cleaned CSV or an in-memory DataFrame
+        if isinstance(cleaned_data, pd.DataFrame):
+            self.df = cleaned_data.copy()
+        else:
+            self.df = pd.read_csv(cleaned_data)
         self.scored_df = None
-
-        # Define ICP archetypes and scoring criteria
+        self.summary = None
+        self.explanation_codes = None
+        self.score_sketch = None
+        self.tier_thresholds = None
+        self.token_matrices = token_matrices
+        self.profiler = profiler
+
+        # Define ICP archetypes and scoring criteria. Employee and revenue
+        # fit are inclusive (min, max) ranges, None = unbounded: headcount on
+        # Employee_Count_Min/Max, revenue on Revenue_USD
         self.icp_archetypes = {
             'Enterprise_Risk_Management': {
                 'description': 'Large enterprises with complex risk management needs',
-                'ideal_employee_range': ['1000+', '500-1,000'],
-                'ideal_revenue': ['$100M', '$250M', '$1000M'],  # High revenue
+                'ideal_employee_range': (500, None),
+                'ideal_revenue': (100_000_000, None),  # High revenue
                 'target_industries': ['Financial Services', 'Healthcare', 'Energy', 'Manufacturing'],
                 'key_solutions': ['Risk'],
                 'high_value_roles': ['Chief Risk Officer', 'Risk Manager', 'Board Secretary'],
@@ -36,8 +207,8 @@ class ICPScorer:
             },
             'Mid_Market_Compliance': {
                 'description': 'Growing companies needing compliance frameworks',
-                'ideal_employee_range': ['200-500', '500-1,000'],
-                'ideal_revenue': ['$20M', '$100M'],
+                'ideal_employee_range': (200, 1000),
+                'ideal_revenue': (20_000_000, 100_000_000),
                 'target_industries': ['Technology', 'Financial Services', 'Healthcare', 'Legal'],
                 'key_solutions': ['Compliance'],
                 'high_value_roles': ['General Counsel', 'Legal Counsel', 'Compliance Officer'],
@@ -46,8 +217,8 @@ class ICPScorer:
             },
             'Board_Governance': {
                 'description': 'Organizations focused on board management and governance',
-                'ideal_employee_range': ['200-500', '500-1,000', '1000+'],
-                'ideal_revenue': ['$100M', '$250M', '$1000M'],
+                'ideal_employee_range': (200, None),
+                'ideal_revenue': (100_000_000, None),
                 'target_industries': ['Financial Services', 'Non-Profit', 'Legal', 'Government'],
                 'key_solutions': ['Boards'],
                 'high_value_roles': ['Board Secretary', 'Director of Security', 'General Counsel'],
@@ -56,204 +227,192 @@ class ICPScorer:
             }
         }
 
-    def calculate_firmographic_score(self, row):
-        """Calculate firmographic fit score (0-40 points)"""
-        score = 0
-
-        # Employee Count Score (0-15 points)
-        employee_count = row['Employee_Count_Clean']
-        if employee_count in ['1000+']:
-            score += 15
-        elif employee_count in ['500-1,000', '500-1000']:
-            score += 12
-        elif employee_count in ['200-500']:
-            score += 10
-        elif employee_count in ['50-200']:
-            score += 5
-
-        # Revenue Score (0-15 points)
-        revenue = row['Revenue_Clean']
-        if revenue in ['$1000M', '$250M']:
-            score += 15
-        elif revenue in ['$100M']:
-            score += 12
-        elif revenue in ['$20M']:
-            score += 8
-        elif revenue in ['$5M']:
-            score += 4
-
-        # Industry Score (0-10 points)
-        industry = row['Industry']
-        high_value_industries = ['Financial Services',
-                                 'Healthcare', 'Energy', 'Manufacturing', 'Legal']
-        if industry in high_value_industries:
-            score += 10
-        elif industry in ['Technology', 'Government']:
-            score += 7
+    def _stage(self, name):
+        """Profile a scoring component when a StageProfiler is attached"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name, rows=len(self.df))
+
+    def _factor_codes(self, df, factor, now, token_matrices=None):
+        """Vectorized rule codes (uint8) for one scoring factor"""
+        spec = SCORING_RULES[factor]
+        values = df[spec['column']]
+        thresholds = [rule[2] for rule in spec['rules']]
+
+        if (spec['match'] == 'contains' and token_matrices is not None and
+                spec['column'] in token_matrices and
+                token_matrices.n_rows(spec['column']) == len(df)):
+            # Keywords are matched against the vocabulary once, then each
+            # rule is a sparse matrix-vector product over the rows
+            conditions = [token_matrices.contains_keyword(spec['column'], v)
+                          for v in thresholds]
+        elif spec['match'] == 'isin':
+            conditions = [values.isin(v).to_numpy() for v in thresholds]
+        elif spec['match'] == 'contains':
+            text = values.astype(object).where(
+                values.notna(), 'nan').astype(str).str.lower()
+            conditions = [text.str.contains(v, regex=False).to_numpy()
+                          for v in thresholds]
+        elif spec['match'] == 'at_least':
+            numbers = pd.to_numeric(values, errors='coerce').astype('float64').to_numpy()
+            conditions = [numbers >= v for v in thresholds]
+        elif spec['match'] == 'days_since_at_most':
+            touched = pd.to_datetime(values, errors='coerce', format='mixed')
+            days_ago = (now - touched).dt.days.to_numpy()
+            conditions = [days_ago <= v for v in thresholds]
         else:
-            score += 3
+            raise ValueError(f"Unknown match type: {spec['match']}")
+
+        codes = np.select(conditions, list(range(1, len(thresholds) + 1)), default=0)
+        if 'missing' in spec:
+            codes = np.where(values.isna().to_numpy(), len(thresholds) + 1, codes)
+        return codes.astype(np.uint8)
+
+    @staticmethod
+    def _rule_points(factor):
+        """Points per rule code for a factor"""
+        spec = SCORING_RULES[factor]
+        points = [spec['default'][0]] + [rule[0] for rule in spec['rules']]
+        if 'missing' in spec:
+            points.append(spec['missing'][0])
+        return np.array(points, dtype=np.int16)
+
+    @staticmethod
+    def _rule_labels(factor):
+        """Explanation labels per rule code for a factor"""
+        spec = SCORING_RULES[factor]
+        labels = [spec['default'][1]] + [rule[1] for rule in spec['rules']]
+        if 'missing' in spec:
+            labels.append(spec['missing'][1])
+        return labels
+
+    def score_components(self, df, components=None, now=None, token_matrices=None):
+        """
+        Score components for every row of df in one vectorized pass.
+        Returns (component scores DataFrame, {factor: uint8 rule codes}).
+        token_matrices (row-aligned with df) replace string scans of the
+        tokenized fields.
+        """
+        components = components or SCORE_COMPONENTS
+        now = now or datetime.now()
+        df = cleaning.with_numeric_firmographics(df)
+
+        scores = pd.DataFrame(index=df.index)
+        codes = {}
+        for component in components:
+            with self._stage(component):
+                total = np.zeros(len(df), dtype=np.int16)
+                for factor, spec in SCORING_RULES.items():
+                    if spec['component'] != component:
+                        continue
+                    codes[factor] = self._factor_codes(df, factor, now, token_matrices)
+                    total += self._rule_points(factor)[codes[factor]]
+                scores[component] = total.astype(np.int64)
+
+        return scores, codes
+
+    @staticmethod
+    def _in_range(low_values, high_values, bounds):
+        """Rows whose [low, high] values lie within inclusive bounds (None =
+        unbounded); missing values never match"""
+        low, high = bounds
+        fits = low_values >= (low if low is not None else -np.inf)
+        if high is not None:
+            fits &= high_values <= high
+        return fits
+
+    def assign_icp_archetypes(self, df):
+        """Vectorized best-fit ICP archetype for every row of df"""
+        df = cleaning.with_numeric_firmographics(df)
+        role = df['Contact Role/Title'].astype(object).where(
+            df['Contact Role/Title'].notna(), 'nan').astype(str).str.lower()
+
+        # An open-ended headcount ('1000+') has no upper bound, and NaN
+        # fails every comparison
+        employees_min = df['Employee_Count_Min'].astype('float64').to_numpy()
+        employees_max = df['Employee_Count_Max'].astype('float64').to_numpy()
+        employees_max = np.where(np.isnan(employees_max) & ~np.isnan(employees_min),
+                                 np.inf, employees_max)
+        revenue = df['Revenue_USD'].astype('float64').to_numpy()
+
+        archetype_scores = []
+        for criteria in self.icp_archetypes.values():
+            score = np.zeros(len(df), dtype=np.int16)
+            score += 3 * self._in_range(employees_min, employees_max,
+                                        criteria['ideal_employee_range'])
+            score += 3 * self._in_range(revenue, revenue, criteria['ideal_revenue'])
+            score += 3 * df['Industry'].isin(criteria['target_industries']).to_numpy()
+            score += 4 * df['Solution Interest'].isin(criteria['key_solutions']).to_numpy()
+            role_fit = np.zeros(len(df), dtype=bool)
+            for hvr in criteria['high_value_roles']:
+                role_fit |= role.str.contains(hvr.lower(), regex=False).to_numpy()
+            score += 3 * role_fit
+            archetype_scores.append(score)
+
+        archetype_scores = np.column_stack(archetype_scores)
+        names = np.array(list(self.icp_archetypes), dtype=object)
+
+        # Highest scoring archetype (first on ties); only assign if score >= 6
+        best = archetype_scores.argmax(axis=1)
+        best_score = archetype_scores[np.arange(len(df)), best]
+        return pd.Series(np.where(best_score >= 6, names[best], 'Other'),
+                         index=df.index, dtype=object)
+
+    def _score_row(self, row, component):
+        scores, _ = self.score_components(pd.DataFrame([row]), [component])
+        return int(scores[component].iloc[0])
 
-        return score
+    def calculate_firmographic_score(self, row):
+        """Calculate firmographic fit score (0-40 points)"""
+        return self._score_row(row, 'Firmographic_Score')
 
     def calculate_solution_fit_score(self, row):
         """Calculate solution interest and role fit score (0-25 points)"""
-        score = 0
-
-        # Solution Interest Score (0-15 points)
-        solution_interest = row['Solution Interest']
-        if solution_interest == 'Risk':
-            score += 15  # Highest value solution
-        elif solution_interest == 'Compliance':
-            score += 12
-        elif solution_interest == 'Boards':
-            score += 10
-        else:
-            score += 5
-
-        # Contact Role Score (0-10 points)
-        role = str(row['Contact Role/Title']).lower()
-        high_value_roles = ['chief risk officer', 'risk manager', 'board secretary',
-                            'general counsel', 'legal counsel', 'compliance officer']
-        medium_value_roles = ['director of security',
-                              'it director', 'cfo', 'ciso']
-
-        if any(hvr in role for hvr in high_value_roles):
-            score += 10
-        elif any(mvr in role for mvr in medium_value_roles):
-            score += 7
-        else:
-            score += 3
-
-        return score
+        return self._score_row(row, 'Solution_Fit_Score')
 
     def calculate_intent_signals_score(self, row):
         """Calculate intent and engagement signals score (0-20 points)"""
-        score = 0
-
-        # Intent Score (0-10 points)
-        intent_score = row['Intent_Score_Clean']
-        if pd.notna(intent_score):
-            if intent_score >= 80:
-                score += 10
-            elif intent_score >= 60:
-                score += 8
-            elif intent_score >= 40:
-                score += 6
-            else:
-                score += 3
-
-        # Lead Source Score (0-5 points)
-        lead_source = row['Lead Source']
-        if lead_source == 'Referral':
-            score += 5
-        elif lead_source == 'Event':
-            score += 4
-        elif lead_source == 'Web':
-            score += 3
-        else:
-            score += 2
-
-        # Recency Score (0-5 points)
-        last_touch = row['Last_Marketing_Touch_Clean']
-        if pd.notna(last_touch):
-            try:
-                touch_date = pd.to_datetime(last_touch)
-                days_ago = (datetime.now() - touch_date).days
-                if days_ago <= 30:
-                    score += 5
-                elif days_ago <= 90:
-                    score += 3
-                else:
-                    score += 1
-            except:
-                score += 1
-
-        return score
+        return self._score_row(row, 'Intent_Signals_Score')
 
     def calculate_tech_compliance_score(self, row):
         """Calculate technology and compliance readiness score (0-15 points)"""
-        score = 0
-
-        # Technology Stack Score (0-8 points)
-        tech_stack = str(row['Tech_Stack_Clean']).lower()
-        enterprise_tech = ['salesforce', 'servicenow', 'workday', 'okta']
-        mid_market_tech = ['hubspot', 'marketo', 'pardot']
-
-        if any(et in tech_stack for et in enterprise_tech):
-            score += 8
-        elif any(mt in tech_stack for mt in mid_market_tech):
-            score += 5
-        elif tech_stack != 'nan':
-            score += 3
-
-        # Compliance Certifications Score (0-7 points)
-        certifications = str(row['Compliance Certifications']).lower()
-        high_value_certs = ['sox', 'pci dss', 'iso27001']
-        medium_value_certs = ['gdpr', 'hipaa']
-
-        if any(hvc in certifications for hvc in high_value_certs):
-            score += 7
-        elif any(mvc in certifications for mvc in medium_value_certs):
-            score += 5
-        elif certifications != 'nan':
-            score += 2
-
-        return score
+        return self._score_row(row, 'Tech_Compliance_Score')
 
     def assign_icp_archetype(self, row):
         """Assign the best-fit ICP archetype based on characteristics"""
-        # Score each archetype
-        archetype_scores = {}
-
-        for archetype_name, criteria in self.icp_archetypes.items():
-            score = 0
-
-            # Employee range fit
-            if row['Employee_Count_Clean'] in criteria['ideal_employee_range']:
-                score += 3
+        return self.assign_icp_archetypes(pd.DataFrame([row])).iloc[0]
 
-            # Revenue fit
-            if row['Revenue_Clean'] in criteria['ideal_revenue']:
-                score += 3
+    def calculate_total_icp_score(self, explain=False, tiering='fixed', sketch=None,
+                                  model=None):
+        """Calculate comprehensive ICP scores for all accounts
 
-            # Industry fit
-            if row['Industry'] in criteria['target_industries']:
-                score += 3
+        With explain=True the per-factor rule codes behind each score are
+        kept (one uint8 per factor per row) for explain_account().
 
-            # Solution interest fit
-            if row['Solution Interest'] in criteria['key_solutions']:
-                score += 4
+        tiering='quantile' assigns tiers by score percentile
+        (quantile_sketch.QUANTILE_TIER_SHARES) instead of the fixed bins.
+        Pass a sketch loaded from an earlier run to keep thresholds stable;
+        this run's scores are added to it.
 
-            # Role fit
-            role = str(row['Contact Role/Title']).lower()
-            if any(hvr in role for hvr in [r.lower() for r in criteria['high_value_roles']]):
-                score += 3
-
-            archetype_scores[archetype_name] = score
+        With a learned_scorer.LogisticScorer as `model`, its win probability
+        (from the same rule codes) is added as Model_Win_Probability and
+        Model_ICP_Score; Total_ICP_Score and the tiers stay rule-based.
+        """
+        print("Calculating ICP scores...")
 
-        # Return the highest scoring archetype
-        best_archetype = max(archetype_scores, key=archetype_scores.get)
-        best_score = archetype_scores[best_archetype]
+        # Numeric revenue/headcount columns for data cleaned before they existed
+        self.df = cleaning.with_numeric_firmographics(self.df)
 
-        # Only assign if score is meaningful (>=6)
-        if best_score >= 6:
-            return best_archetype
-        else:
-            return 'Other'
-
-    def calculate_total_icp_score(self):
-        """Calculate comprehensive ICP scores for all accounts"""
-        print("Calculating ICP scores...")
+        # Tokenize tech stack and certifications unless cleaning already did
+        if self.token_matrices is None:
+            with self._stage('Token_Matrices'):
+                self.token_matrices = token_matrix.TokenMatrices.from_frame(self.df)
 
         # Calculate component scores
-        self.df['Firmographic_Score'] = self.df.apply(
-            self.calculate_firmographic_score, axis=1)
-        self.df['Solution_Fit_Score'] = self.df.apply(
-            self.calculate_solution_fit_score, axis=1)
-        self.df['Intent_Signals_Score'] = self.df.apply(
-            self.calculate_intent_signals_score, axis=1)
-        self.df['Tech_Compliance_Score'] = self.df.apply(
-            self.calculate_tech_compliance_score, axis=1)
+        component_scores, codes = self.score_components(
+            self.df, token_matrices=self.token_matrices)
+        for component in SCORE_COMPONENTS:
+            self.df[component] = component_scores[component]
 
         # Calculate total score (0-100)
         self.df['Total_ICP_Score'] = (
@@ -264,24 +423,59 @@ class ICPScorer:
         )
 
         # Assign ICP archetypes
-        self.df['ICP_Archetype'] = self.df.apply(
-            self.assign_icp_archetype, axis=1)
+        with self._stage('ICP_Archetype'):
+            self.df['ICP_Archetype'] = self.assign_icp_archetypes(self.df)
 
         # Create priority tiers
-        self.df['Priority_Tier'] = pd.cut(
-            self.df['Total_ICP_Score'],
-            bins=[0, 40, 60, 80, 100],
-            labels=['Low', 'Medium', 'High', 'Critical'],
-            include_lowest=True
-        )
+        with self._stage('Priority_Tier'):
+            if tiering == 'quantile':
+                self.score_sketch = sketch or quantile_sketch.KLLSketch()
+                self.score_sketch.update(self.df['Total_ICP_Score'].to_numpy())
+                self.tier_thresholds = quantile_sketch.tier_thresholds(self.score_sketch)
+            else:
+                self.tier_thresholds = None
+            self.df['Priority_Tier'] = assign_priority_tiers(
+                self.df['Total_ICP_Score'], self.tier_thresholds)
+
+        if model is not None:
+            with self._stage('Model_Score'):
+                probability, model_score = model.score(codes)
+                self.df['Model_Win_Probability'] = probability.round(4)
+                self.df['Model_ICP_Score'] = model_score
+
+        self.explanation_codes = (
+            pd.DataFrame(codes, index=self.df.index) if explain else None)
 
         self.scored_df = self.df.copy()
+        self.summary = None
         print("ICP scoring completed!")
 
         return self.scored_df
 
-    def generate_prioritization_report(self):
-        """Generate prioritization analysis and recommendations"""
+    def explain_account(self, position):
+        """
+        Render the score explanation for one account (by row position),
+        e.g. ['+15 Risk interest', '+10 Board Secretary role', '+7 SOX'].
+        """
+        if self.explanation_codes is None:
+            print("Please run calculate_total_icp_score(explain=True) first")
+            return None
+
+        row_codes = self.explanation_codes.iloc[position]
+        explanation = []
+        for factor, code in row_codes.items():
+            points = int(self._rule_points(factor)[code])
+            if points:
+                explanation.append(f"+{points} {self._rule_labels(factor)[code]}")
+        return explanation
+
+    def generate_prioritization_report(self, write_outputs=True, output_formats=('.csv',)):
+        """
+        Generate prioritization analysis and recommendations. The accounts
+        are ranked once; the top 50 printed here and the top 100 deliverable
+        are both taken from that order. output_formats are the file
+        extensions to write each deliverable in (see output_writer).
+        """
         if self.scored_df is None:
             print("Please run calculate_total_icp_score() first")
             return
@@ -290,31 +484,29 @@ class ICPScorer:
         print("ICP PRIORITIZATION REPORT")
         print("="*60)
 
+        summary = self.get_summary()
+
         # Overall score distribution
         print("\nSCORE DISTRIBUTION:")
-        print(
-            f"Average ICP Score: {self.scored_df['Total_ICP_Score'].mean():.1f}")
-        print(
-            f"Median ICP Score: {self.scored_df['Total_ICP_Score'].median():.1f}")
-        print(
-            f"Top 10% Threshold: {self.scored_df['Total_ICP_Score'].quantile(0.9):.1f}")
+        print(f"Average ICP Score: {summary.mean_score:.1f}")
+        print(f"Median ICP Score: {summary.median_score:.1f}")
+        print(f"Top 10% Threshold: {summary.top_decile_threshold:.1f}")
 
         # Priority tier breakdown
         print("\nPRIORITY TIER DISTRIBUTION:")
-        priority_dist = self.scored_df['Priority_Tier'].value_counts()
-        for tier, count in priority_dist.items():
+        for tier, count in summary.tier_counts.items():
             percentage = (count / len(self.scored_df)) * 100
             print(f"{tier}: {count} accounts ({percentage:.1f}%)")
 
         # ICP archetype distribution
         print("\nICP ARCHETYPE DISTRIBUTION:")
-        archetype_dist = self.scored_df['ICP_Archetype'].value_counts()
-        for archetype, count in archetype_dist.items():
+        for archetype, count in summary.archetype_counts.items():
             percentage = (count / len(self.scored_df)) * 100
             print(f"{archetype}: {count} accounts ({percentage:.1f}%)")
 
         # Top 50 accounts for sales prioritization
-        top_accounts = self.scored_df.nlargest(50, 'Total_ICP_Score')[
+        order = output_writer.score_order(self.scored_df)
+        top_accounts = self.scored_df.take(order[:50])[
             ['Company Name', 'Industry', 'Employee_Count_Clean', 'Revenue_Clean',
              'Solution Interest', 'Contact Role/Title', 'ICP_Archetype',
              'Total_ICP_Score', 'Priority_Tier', 'Region_Clean']
@@ -323,77 +515,49 @@ class ICPScorer:
         print("\nTOP 50 PRIORITY ACCOUNTS:")
         print(top_accounts.to_string(index=False, max_colwidth=20))
 
-        # Save prioritized accounts
-        output_path = 'deliverables/prioritized_accounts.csv'
-        self.scored_df.to_csv(output_path, index=False)
-        print(f"\nFull prioritized dataset saved to: {output_path}")
+        if not write_outputs:
+            return top_accounts
 
-        # Save top 100 for sales team
-        top_100_path = 'deliverables/top_100_priority_accounts.csv'
-        self.scored_df.nlargest(100, 'Total_ICP_Score').to_csv(
-            top_100_path, index=False)
-        print(f"Top 100 priority accounts saved to: {top_100_path}")
+        # Save the full prioritized dataset and the top 100 for the sales team
+        outputs = {}
+        for extension in output_formats:
+            outputs[f'deliverables/prioritized_accounts{extension}'] = None
+            outputs[f'deliverables/top_100_priority_accounts{extension}'] = 100
+        print()
+        for path in output_writer.write_deliverables(self.scored_df, outputs, order=order):
+            label = 'Top 100 priority accounts' if outputs[path] else 'Full prioritized dataset'
+            print(f"{label} saved to: {path}")
 
         return top_accounts
 
-    def create_scoring_visualization(self):
-        """Create visualizations for scoring analysis"""
+    def get_summary(self):
+        """Aggregates shared by the report and the dashboard, computed once"""
+        if self.summary is None:
+            self.summary = scoring_dashboard.ScoringSummary(self.scored_df)
+        return self.summary
+
+    def create_scoring_visualization(self, output_path='deliverables/icp_scoring_dashboard.png',
+                                     dpi=300, show=False):
+        """Create visualizations for scoring analysis
+
+        Renders headlessly with the Agg backend from the precomputed summary;
+        pass show=True to also open an interactive window.
+        """
         if self.scored_df is None:
             print("Please run calculate_total_icp_score() first")
             return
 
-        # Create figure with subplots
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('ICP Scoring Analysis Dashboard',
-                     fontsize=16, fontweight='bold')
-
-        # 1. Score distribution histogram
-        axes[0, 0].hist(self.scored_df['Total_ICP_Score'], bins=20,
-                        alpha=0.7, color='skyblue', edgecolor='black')
-        axes[0, 0].axvline(self.scored_df['Total_ICP_Score'].mean(
-        ), color='red', linestyle='--', label='Mean')
-        axes[0, 0].set_title('Total ICP Score Distribution')
-        axes[0, 0].set_xlabel('ICP Score')
-        axes[0, 0].set_ylabel('Number of Accounts')
-        axes[0, 0].legend()
-
-        # 2. Priority tier distribution
-        priority_counts = self.scored_df['Priority_Tier'].value_counts()
-        axes[0, 1].pie(priority_counts.values,
-                       labels=priority_counts.index, autopct='%1.1f%%', startangle=90)
-        axes[0, 1].set_title('Priority Tier Distribution')
-
-        # 3. ICP Archetype vs Score
-        archetype_scores = self.scored_df.groupby(
-            'ICP_Archetype')['Total_ICP_Score'].mean().sort_values(ascending=False)
-        axes[1, 0].bar(range(len(archetype_scores)),
-                       archetype_scores.values, color='lightcoral')
-        axes[1, 0].set_title('Average Score by ICP Archetype')
-        axes[1, 0].set_xlabel('ICP Archetype')
-        axes[1, 0].set_ylabel('Average ICP Score')
-        axes[1, 0].set_xticks(range(len(archetype_scores)))
-        axes[1, 0].set_xticklabels(archetype_scores.index, rotation=45)
-
-        # 4. Score components breakdown
-        score_components = ['Firmographic_Score', 'Solution_Fit_Score',
-                            'Intent_Signals_Score', 'Tech_Compliance_Score']
-        component_means = [self.scored_df[comp].mean()
-                           for comp in score_components]
-        axes[1, 1].bar(range(len(score_components)),
-                       component_means, color='lightgreen')
-        axes[1, 1].set_title('Average Score by Component')
-        axes[1, 1].set_xlabel('Score Component')
-        axes[1, 1].set_ylabel('Average Score')
-        axes[1, 1].set_xticks(range(len(score_components)))
-        axes[1, 1].set_xticklabels([comp.replace('_', '\n')
-                                   for comp in score_components], rotation=45)
-
-        plt.tight_layout()
-        plt.savefig('deliverables/icp_scoring_dashboard.png',
-                    dpi=300, bbox_inches='tight')
-        plt.show()
-
-        print("Scoring visualization saved to deliverables/icp_scoring_dashboard.png")
+        summary = self.get_summary()
+        scoring_dashboard.render_dashboard(summary, output_path, dpi=dpi)
+
+        if show:
+            # Imported here so scoring-only runs don't pay pyplot's import cost
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(15, 12))
+            scoring_dashboard.draw_dashboard(fig, summary)
+            plt.show()
+
+        print(f"Scoring visualization saved to {output_path}")
 
 
 def main():
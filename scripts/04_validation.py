@@ -8,8 +8,13 @@ import pandas as pd
 import os
 
 
-def validate_deliverables():
-    """Validate all project deliverables are present and correct"""
+def validate_deliverables(df=None, check_files=True, check_dashboard=True):
+    """Validate all project deliverables are present and correct
+
+    When a scored DataFrame is passed it is validated in memory instead of
+    re-reading prioritized_accounts.csv from disk. check_dashboard=False
+    skips the dashboard PNG for runs that do not render it.
+    """
 
     print("GTM Engineer Analysis - Final Validation")
     print("="*50)
@@ -19,19 +24,22 @@ def validate_deliverables():
         'data/cleaned_diligent_dataset.csv',
         'deliverables/prioritized_accounts.csv',
         'deliverables/top_100_priority_accounts.csv',
-        'deliverables/Executive_Summary.md',
-        'deliverables/icp_scoring_dashboard.png'
+        'deliverables/Executive_Summary.md'
     ]
+    if check_dashboard:
+        files_to_check.append('deliverables/icp_scoring_dashboard.png')
 
-    print("\nFILE VALIDATION:")
-    for file_path in files_to_check:
-        exists = os.path.exists(file_path)
-        status = "✓ EXISTS" if exists else "✗ MISSING"
-        print(f"{status}: {file_path}")
+    if check_files:
+        print("\nFILE VALIDATION:")
+        for file_path in files_to_check:
+            exists = os.path.exists(file_path)
+            status = "✓ EXISTS" if exists else "✗ MISSING"
+            print(f"{status}: {file_path}")
 
     # Load and validate data
     try:
-        df = pd.read_csv('deliverables/prioritized_accounts.csv')
+        if df is None:
+            df = pd.read_csv('deliverables/prioritized_accounts.csv')
         print(f"\n✓ Dataset loaded successfully: {len(df)} records")
 
         # Validate key columns
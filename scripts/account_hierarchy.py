@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Parent/Child Account Hierarchy Rollup
+Author: GTM Engineer Candidate
+Date: September 2025
+
+This script groups scored accounts under their `Parent Company` and rolls
+child ICP scores up to the buying-group level (max score, weighted mean
+score and child counts per priority tier). The parent->children graph is
+built once; rollups are maintained incrementally so a single child's score
+change does not require a full recompute. The buying groups feed lead
+routing (lead_routing.py --by-buying-group).
+"""
+
+import argparse
+import importlib
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+scoring = importlib.import_module('03_icp_scoring')
+
+# Placeholder values in `Parent Company` that mean "no parent"
+NO_PARENT_VALUES = ['—', '-', 'none', 'n/a', 'unknown', 'nan', '']
+
+
+class AccountHierarchy:
+    """
+    Parent -> children graph over a scored dataset with rolled-up scores.
+
+    Children are row positions in `scored_df`. Accounts without a parent
+    form their own single-member buying group keyed by `Company Name`.
+    Tiers for changed scores and buying groups use the frame's own tier
+    thresholds (ICPScorer.tier_thresholds, inferred from the frame if unset).
+
+    Weighted_ICP_Score weights each child by `weight_column` (values below
+    1 count as 1), or equally when it is None, i.e. the mean child score.
+    A weight column that can change (e.g. Employee_Count_Min after
+    enrichment) must be passed to update_child_score as new_weight.
+    """
+
+    def __init__(self, scored_df, weight_column=None, tier_thresholds='infer'):
+        self.df = scored_df.reset_index(drop=True)
+        self.weight_column = weight_column
+        self.tier_labels = list(scoring.PRIORITY_TIER_LABELS)
+        self.tier_thresholds = (scoring.infer_tier_thresholds(self.df)
+                                if tier_thresholds == 'infer' else tier_thresholds)
+
+        self.parent_names = None
+        self.child_parent = None      # parent code per child row
+        self.child_order = None       # child rows grouped by parent
+        self.child_offsets = None     # slice bounds into child_order
+
+        self.scores = None
+        self.weights = None
+        self.tier_codes = None
+
+        self.sum_weights = None
+        self.sum_weighted_scores = None
+        self.max_scores = None
+        self.tier_counts = None
+
+        self.build_graph()
+        self.compute_rollup()
+
+    def build_graph(self):
+        """Build the parent->children index once from `Parent Company`"""
+        parent = self.df['Parent Company']
+        missing = parent.isna() | parent.astype(str).str.strip().str.lower().isin(
+            NO_PARENT_VALUES)
+        group_key = parent.where(~missing, self.df['Company Name'])
+
+        codes, names = pd.factorize(group_key, sort=False)
+        self.child_parent = codes.astype(np.int64)
+        self.parent_names = pd.Index(names, name='Parent_Account')
+
+        # CSR-style adjacency: children of parent p are
+        # child_order[child_offsets[p]:child_offsets[p + 1]]
+        self.child_order = np.argsort(self.child_parent, kind='stable')
+        counts = np.bincount(self.child_parent, minlength=len(names))
+        self.child_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        print(f"Built hierarchy: {len(names)} buying groups "
+              f"over {len(self.df)} accounts")
+
+    def compute_rollup(self):
+        """Compute all parent aggregates in a single vectorized pass"""
+        n_parents = len(self.parent_names)
+
+        self.scores = self.df['Total_ICP_Score'].to_numpy(dtype=np.float64, copy=True)
+        if self.weight_column is None:
+            self.weights = np.ones(len(self.df))
+        else:
+            self.weights = self._weight(self.df[self.weight_column].astype('float64'))
+        self.tier_codes = self._tier_codes(self.df['Priority_Tier'])
+
+        self.sum_weights = np.bincount(
+            self.child_parent, weights=self.weights, minlength=n_parents)
+        self.sum_weighted_scores = np.bincount(
+            self.child_parent, weights=self.weights * self.scores,
+            minlength=n_parents)
+
+        self.max_scores = np.full(n_parents, -np.inf)
+        np.maximum.at(self.max_scores, self.child_parent, self.scores)
+
+        self.tier_counts = np.zeros(
+            (n_parents, len(self.tier_labels)), dtype=np.int64)
+        np.add.at(self.tier_counts, (self.child_parent, self.tier_codes), 1)
+
+    @staticmethod
+    def _weight(values):
+        """Child weights: missing or below 1 counts as 1"""
+        return pd.Series(values, dtype='float64').fillna(1).clip(lower=1).to_numpy(copy=True)
+
+    def _tier_codes(self, tiers):
+        """Map tier labels to integer positions in PRIORITY_TIER_LABELS"""
+        tiers = pd.Categorical(tiers, categories=self.tier_labels)
+        codes = tiers.codes.astype(np.int64)
+        if (codes < 0).any():
+            # Fall back to the tier thresholds for rows without a valid tier
+            derived = scoring.assign_priority_tiers(self.scores, self.tier_thresholds).codes
+            codes = np.where(codes < 0, derived, codes).astype(np.int64)
+        return codes
+
+    def _tier_for_score(self, score):
+        """Priority tier code for a single score using the tier thresholds"""
+        return int(scoring.assign_priority_tiers(
+            np.array([score], dtype=np.float64), self.tier_thresholds).codes[0])
+
+    def children_of(self, parent_name):
+        """Row positions of the children of a parent account"""
+        p = self.parent_names.get_loc(parent_name)
+        return self.child_order[self.child_offsets[p]:self.child_offsets[p + 1]]
+
+    def update_child_score(self, child, new_score, new_tier=None, new_weight=None):
+        """
+        Apply a single child's score (and, with a weight column, weight)
+        change to its parent rollup.
+
+        Sums and tier counts are updated in O(1); the max is only
+        recomputed over the parent's own children when the previous
+        maximum is lowered.
+        """
+        p = self.child_parent[child]
+        old_score = self.scores[child]
+        old_weight = self.weights[child]
+        weight = old_weight
+        if new_weight is not None and self.weight_column is not None:
+            weight = self._weight([new_weight])[0]
+
+        new_code = (self.tier_labels.index(new_tier) if new_tier is not None
+                    else self._tier_for_score(new_score))
+
+        self.sum_weights[p] += weight - old_weight
+        self.sum_weighted_scores[p] += weight * new_score - old_weight * old_score
+        self.weights[child] = weight
+        self.tier_counts[p, self.tier_codes[child]] -= 1
+        self.tier_counts[p, new_code] += 1
+
+        self.scores[child] = new_score
+        self.tier_codes[child] = new_code
+
+        if new_score >= self.max_scores[p]:
+            self.max_scores[p] = new_score
+        elif old_score == self.max_scores[p]:
+            siblings = self.child_order[
+                self.child_offsets[p]:self.child_offsets[p + 1]]
+            self.max_scores[p] = self.scores[siblings].max()
+
+        return self.parent_names[p]
+
+    def get_rollup(self):
+        """Return the account-level rollup as a DataFrame"""
+        rollup = pd.DataFrame({
+            'Child_Count': np.diff(self.child_offsets),
+            'Max_ICP_Score': self.max_scores,
+            'Weighted_ICP_Score': (self.sum_weighted_scores /
+                                   self.sum_weights).round(1),
+        }, index=self.parent_names)
+
+        for i, tier in enumerate(self.tier_labels):
+            rollup[f'{tier}_Children'] = self.tier_counts[:, i]
+
+        rollup['Account_Priority_Tier'] = scoring.assign_priority_tiers(
+            rollup['Max_ICP_Score'], self.tier_thresholds)
+
+        return rollup.sort_values(
+            ['Max_ICP_Score', 'Weighted_ICP_Score'], ascending=False)
+
+    def attach_to_accounts(self):
+        """Attach buying-group rollup columns back onto each child row"""
+        accounts = self.df.copy()
+        accounts['Buying_Group'] = self.parent_names[self.child_parent]
+        accounts['Buying_Group_Max_Score'] = self.max_scores[self.child_parent]
+        accounts['Buying_Group_Weighted_Score'] = (
+            self.sum_weighted_scores / self.sum_weights)[self.child_parent].round(1)
+        accounts['Buying_Group_Priority_Tier'] = scoring.assign_priority_tiers(
+            self.max_scores, self.tier_thresholds)[self.child_parent]
+        return accounts
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Roll scored accounts up to buying groups')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--weight-column',
+                        help='Weight children by this column in Weighted_ICP_Score '
+                             '(default: equal weights)')
+    args = parser.parse_args()
+
+    print("GTM Engineer Account Hierarchy Rollup")
+    print("="*50)
+
+    scored_df = pd.read_csv(args.input)
+    hierarchy = AccountHierarchy(scored_df, weight_column=args.weight_column)
+    rollup = hierarchy.get_rollup()
+
+    print("\nTOP 15 BUYING GROUPS:")
+    print(rollup.head(15).to_string())
+
+    output_path = 'deliverables/account_hierarchy_rollup.csv'
+    rollup.to_csv(output_path)
+    print(f"\nAccount rollup saved to: {output_path}")
+
+    return rollup
+
+
+if __name__ == "__main__":
+    main()
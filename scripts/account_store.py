@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Embedded Scored Account Store
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Loads the scored accounts into an indexed SQLite file with prepared views
+for the tier, archetype and region breakdowns, so ad-hoc questions from
+sales leadership are SQL queries instead of pandas scripts over
+prioritized_accounts.csv. The store is rebuilt in
+a temp file and renamed into place, like the other deliverables.
+"""
+
+import argparse
+import importlib
+import sqlite3
+import time
+
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+output_writer = importlib.import_module('output_writer')
+
+DEFAULT_STORE_PATH = 'deliverables/prioritized_accounts.sqlite'
+TABLE = 'accounts'
+
+ROLLUP_TABLE = 'score_rollup'
+ROLLUP_DIMENSIONS = ['Region_Clean', 'Priority_Tier', 'ICP_Archetype']
+
+# Indexes for filtered top-N and ID lookups on the account table
+INDEXES = {
+    'idx_accounts_score': ['Total_ICP_Score'],
+    'idx_accounts_tier_score': ['Priority_Tier', 'Total_ICP_Score'],
+    'idx_accounts_region_score': ['Region_Clean', 'Total_ICP_Score'],
+    'idx_accounts_id': ['SFDC_Account_ID_Clean']
+}
+
+# The breakdown views aggregate the rollup (one row per region, tier and
+# archetype combination, built at load time) rather than the account table,
+# so they read a few hundred rows however many accounts are loaded
+_AGGREGATES = """SUM(accounts) AS accounts,
+       ROUND(SUM(score_sum) * 1.0 / SUM(accounts), 1) AS avg_score,
+       MIN(min_score) AS min_score,
+       MAX(max_score) AS max_score"""
+
+_TIER_RANK = 'CASE tier ' + ' '.join(
+    f"WHEN '{tier}' THEN {rank}"
+    for rank, tier in enumerate(reversed(scoring.PRIORITY_TIER_LABELS))) + ' END'
+
+VIEWS = {
+    'tier': f"""SELECT tier, {_AGGREGATES}
+FROM {ROLLUP_TABLE} GROUP BY tier ORDER BY {_TIER_RANK}""",
+    'archetype': f"""SELECT archetype, {_AGGREGATES}
+FROM {ROLLUP_TABLE} GROUP BY archetype ORDER BY accounts DESC""",
+    'region': f"""SELECT region, {_AGGREGATES}
+FROM {ROLLUP_TABLE} GROUP BY region ORDER BY accounts DESC""",
+    'region_tier': f"""SELECT region, tier, {_AGGREGATES}
+FROM {ROLLUP_TABLE} GROUP BY region, tier ORDER BY region, {_TIER_RANK}"""
+}
+
+TOP_ACCOUNT_COLUMNS = ['Company Name', 'Industry', 'Region_Clean', 'ICP_Archetype',
+                       'Total_ICP_Score', 'Priority_Tier']
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _create_indexes_and_views(conn):
+    columns = {row[1] for row in conn.execute(f'PRAGMA table_info({TABLE})')}
+    for name, index_columns in INDEXES.items():
+        if set(index_columns) <= columns:
+            conn.execute(f'CREATE INDEX {name} ON {TABLE} '
+                         f'({", ".join(map(_quote, index_columns))})')
+
+    region, tier, archetype = map(_quote, ROLLUP_DIMENSIONS)
+    conn.execute(f"""CREATE TABLE {ROLLUP_TABLE} AS
+SELECT {region} AS region, {tier} AS tier, {archetype} AS archetype,
+       COUNT(*) AS accounts, SUM("Total_ICP_Score") AS score_sum,
+       MIN("Total_ICP_Score") AS min_score, MAX("Total_ICP_Score") AS max_score
+FROM {TABLE} GROUP BY {region}, {tier}, {archetype}""")
+    for name, sql in VIEWS.items():
+        conn.execute(f'CREATE VIEW {name}_breakdown AS {sql}')
+    conn.execute('ANALYZE')
+
+
+def load_scored(scored, store_path=DEFAULT_STORE_PATH, chunksize=100_000):
+    """
+    Build the store from a scored DataFrame or CSV path. CSVs are read in
+    chunks, so the full dataset is never held in pandas. Returns the row count.
+    """
+    if isinstance(scored, pd.DataFrame):
+        chunks = (scored.iloc[start:start + chunksize]
+                  for start in range(0, len(scored), chunksize))
+    else:
+        chunks = pd.read_csv(scored, chunksize=chunksize,
+                             dtype={'SFDC_Account_ID_Clean': str})
+
+    rows = 0
+    with output_writer.atomic_path(store_path) as tmp_path:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute('PRAGMA journal_mode = OFF')
+            conn.execute('PRAGMA synchronous = OFF')
+            for chunk in chunks:
+                chunk = chunk.copy()
+                # Categoricals (Priority_Tier) are stored as their labels
+                for column in chunk.select_dtypes('category').columns:
+                    chunk[column] = chunk[column].astype(object)
+                chunk.to_sql(TABLE, conn, if_exists='append', index=False)
+                rows += len(chunk)
+            _create_indexes_and_views(conn)
+            conn.commit()
+        finally:
+            conn.close()
+    return rows
+
+
+class AccountStore:
+    """Read-only queries against a store built by load_scored"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+
+    def close(self):
+        self.conn.close()
+
+    def query(self, sql, params=()):
+        """Run a SQL query and return the result as a DataFrame"""
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def breakdown(self, view):
+        """One of the prepared views: tier, archetype, region, region_tier"""
+        if view not in VIEWS:
+            raise ValueError(f"Unknown view: {view} (expected one of {list(VIEWS)})")
+        return self.query(f'SELECT * FROM {view}_breakdown')
+
+    def top_accounts(self, n=10, tier=None, region=None, archetype=None):
+        """Highest-scoring accounts, optionally filtered"""
+        filters = {'Priority_Tier': tier, 'Region_Clean': region, 'ICP_Archetype': archetype}
+        where = [f'{_quote(column)} = ?' for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
+        sql = (f'SELECT {", ".join(map(_quote, TOP_ACCOUNT_COLUMNS))} FROM {TABLE}'
+               + (f' WHERE {" AND ".join(where)}' if where else '')
+               + ' ORDER BY "Total_ICP_Score" DESC LIMIT ?')
+        return self.query(sql, params + [n])
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Query the scored account store')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH)
+    parser.add_argument('--load', help='Scored CSV to (re)build the store from')
+    parser.add_argument('--view', choices=list(VIEWS), help='Print a prepared breakdown')
+    parser.add_argument('--top', type=int, help='Print the top N accounts')
+    parser.add_argument('--tier', help='Filter --top by Priority_Tier')
+    parser.add_argument('--region', help='Filter --top by Region_Clean')
+    parser.add_argument('--archetype', help='Filter --top by ICP_Archetype')
+    parser.add_argument('--sql', help='Run an ad-hoc SQL query (table: accounts)')
+    args = parser.parse_args()
+
+    print("GTM Engineer Account Store")
+    print("="*50)
+
+    if args.load:
+        start = time.perf_counter()
+        rows = load_scored(args.load, args.store)
+        print(f"Loaded {rows} accounts into {args.store} "
+              f"in {time.perf_counter() - start:.1f}s")
+
+    store = AccountStore(args.store)
+    queries = []
+    if args.view:
+        queries.append((f"{args.view.upper()} BREAKDOWN", lambda: store.breakdown(args.view)))
+    if args.top:
+        queries.append((f"TOP {args.top} ACCOUNTS", lambda: store.top_accounts(
+            args.top, args.tier, args.region, args.archetype)))
+    if args.sql:
+        queries.append(("QUERY RESULT", lambda: store.query(args.sql)))
+
+    for title, run_query in queries:
+        start = time.perf_counter()
+        result = run_query()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"\n{title} ({len(result)} rows, {elapsed_ms:.1f} ms):")
+        print(result.to_string(index=False, max_colwidth=30))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Scoring Backtest
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Measures how well Total_ICP_Score separates Won from Lost accounts (Open
+accounts have no outcome yet and are left out) and compares many scoring
+weight configurations at once. The scoring rule codes of the labeled
+accounts are computed once and collapsed into distinct rule-code profiles
+with their Won/Lost counts; a weight configuration is a points vector over
+the rule slots, so all configurations are scored with one matrix product
+over the profiles and AUC, precision@N and lift are computed column-wise.
+Millions of historical leads reduce to a few thousand profiles.
+"""
+
+import argparse
+import importlib
+import itertools
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+cleaning = importlib.import_module('02_data_cleaning')
+
+OUTCOME_LABELS = {'Won': 1, 'Lost': 0}
+DEFAULT_TOP_N = [50, 100, 200]
+DEFAULT_MULTIPLIERS = [0.5, 1.0, 1.5]
+DEFAULT_CACHE_PATH = 'analysis/backtest_features.npz'
+DEFAULT_RESULTS_PATH = 'analysis/backtest_results.csv'
+
+FACTORS = list(scoring.SCORING_RULES)
+
+
+def _slot_offsets():
+    """Start of each factor's rule codes in the flattened slot vector"""
+    sizes = [len(scoring.ICPScorer._rule_points(factor)) for factor in FACTORS]
+    return np.concatenate([[0], np.cumsum(sizes)])
+
+
+class BacktestFeatures:
+    """Distinct rule-code profiles of the labeled accounts with Won/Lost counts"""
+
+    def __init__(self, profile_codes, won, lost, source=''):
+        self.profile_codes = np.asarray(profile_codes, dtype=np.uint8)
+        self.won = np.asarray(won, dtype=np.int64)
+        self.lost = np.asarray(lost, dtype=np.int64)
+        self.source = str(source)
+        self.offsets = _slot_offsets()
+
+    @classmethod
+    def from_frame(cls, df, now=None, token_matrices=None):
+        """Rule codes for every row of a cleaned frame, reduced to profiles"""
+        labels = df['Status'].map(OUTCOME_LABELS).to_numpy()
+        labeled = ~pd.isna(labels)
+
+        scorer = scoring.ICPScorer(df.iloc[:0])
+        _, codes = scorer.score_components(df, now=now, token_matrices=token_matrices)
+        codes = np.column_stack([codes[factor][labeled] for factor in FACTORS])
+        outcomes = labels[labeled].astype(np.int8)
+
+        # Mixed-radix key per row, so the profiles are a 1-D unique
+        radix = np.diff(_slot_offsets()).astype(np.int64)
+        keys = np.zeros(len(codes), dtype=np.int64)
+        for i, size in enumerate(radix):
+            keys = keys * size + codes[:, i]
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        won = np.bincount(inverse, weights=outcomes, minlength=len(first))
+        total = np.bincount(inverse, minlength=len(first))
+        return cls(codes[first], won, total - won)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as features:
+            if list(features['factors']) != FACTORS:
+                raise ValueError(f"{path} was built for different scoring factors")
+            return cls(features['profile_codes'], features['won'], features['lost'],
+                       features['source'])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(tmp_path, profile_codes=self.profile_codes, won=self.won,
+                            lost=self.lost, factors=np.array(FACTORS),
+                            source=np.array(self.source))
+        os.replace(tmp_path, path)
+
+    @property
+    def n_accounts(self):
+        return int(self.won.sum() + self.lost.sum())
+
+    def one_hot(self):
+        """Profiles x rule slots indicator matrix"""
+        matrix = np.zeros((len(self.profile_codes), self.offsets[-1]), dtype=np.float64)
+        rows = np.arange(len(self.profile_codes))
+        for i in range(len(FACTORS)):
+            matrix[rows, self.offsets[i] + self.profile_codes[:, i]] = 1.0
+        return matrix
+
+    def scores(self, weights):
+        """Profile scores for a (slots x configurations) weight matrix"""
+        return self.one_hot() @ weights
+
+
+def baseline_weights():
+    """Points per rule slot of the current SCORING_RULES"""
+    return np.concatenate([scoring.ICPScorer._rule_points(factor) for factor in FACTORS]
+                          ).astype(np.float64)
+
+
+def component_weight_grid(multipliers=DEFAULT_MULTIPLIERS):
+    """
+    One configuration per combination of per-component multipliers on the
+    baseline points. Returns (configuration names, slots x configs matrix).
+    """
+    base = baseline_weights()
+    offsets = _slot_offsets()
+    slot_component = np.empty(len(base), dtype=object)
+    for i, factor in enumerate(FACTORS):
+        slot_component[offsets[i]:offsets[i + 1]] = scoring.SCORING_RULES[factor]['component']
+
+    names, columns = [], []
+    for combo in itertools.product(multipliers, repeat=len(scoring.SCORE_COMPONENTS)):
+        scale = dict(zip(scoring.SCORE_COMPONENTS, combo))
+        names.append(' '.join(f"{component.split('_')[0]}x{m:g}"
+                              for component, m in scale.items()))
+        columns.append(base * np.array([scale[c] for c in slot_component]))
+    return names, np.column_stack(columns)
+
+
+def _tie_groups(ranked):
+    """Per position of a column-sorted score matrix, the first and last
+    position of its run of equal scores"""
+    n = len(ranked)
+    index = np.broadcast_to(np.arange(n)[:, None], ranked.shape)
+    group_start = np.ones(ranked.shape, dtype=bool)
+    group_start[1:] = ranked[1:] != ranked[:-1]
+    group_end = np.ones(ranked.shape, dtype=bool)
+    group_end[:-1] = group_start[1:]
+    start = np.maximum.accumulate(np.where(group_start, index, 0), axis=0)
+    end = np.minimum.accumulate(np.where(group_end, index, n - 1)[::-1], axis=0)[::-1]
+    return start, end
+
+
+def _before(cumulative, positions):
+    """Cumulative count strictly before each position"""
+    previous = np.take_along_axis(cumulative, np.maximum(positions - 1, 0), axis=0)
+    return np.where(positions > 0, previous, 0)
+
+
+def auc(scores, won, lost):
+    """
+    ROC AUC per column of profile scores, counting ties as half: the share
+    of (Won, Lost) pairs where the Won account scores higher.
+    """
+    order = np.argsort(scores, axis=0, kind='stable')
+    start, end = _tie_groups(np.take_along_axis(scores, order, axis=0))
+    pos, neg = won[order], lost[order]
+
+    cumulative_neg = np.cumsum(neg, axis=0)
+    neg_below = _before(cumulative_neg, start)
+    neg_tied = np.take_along_axis(cumulative_neg, end, axis=0) - neg_below
+    pairs = won.sum() * lost.sum()
+    if not pairs:
+        return np.full(scores.shape[1], np.nan)
+    return (pos * (neg_below + 0.5 * neg_tied)).sum(axis=0) / pairs
+
+
+def precision_at(scores, won, lost, top_n):
+    """
+    Won share of the N highest-scoring accounts per column. Accounts tied
+    on score at the cutoff count pro rata (the expected value of breaking
+    the tie at random).
+    """
+    order = np.argsort(-scores, axis=0, kind='stable')
+    start, end = _tie_groups(np.take_along_axis(scores, order, axis=0))
+    cumulative_total = np.cumsum((won + lost)[order], axis=0)
+    cumulative_pos = np.cumsum(won[order], axis=0)
+
+    n = min(top_n, int(cumulative_total[-1, 0]))
+    # Position holding the N-th account, then the tie group around it
+    cut = np.minimum((cumulative_total < n).sum(axis=0), len(order) - 1)[None, :]
+    first = np.take_along_axis(start, cut, axis=0)
+    last = np.take_along_axis(end, cut, axis=0)
+
+    before_total = _before(cumulative_total, first)
+    before_pos = _before(cumulative_pos, first)
+    group_total = np.take_along_axis(cumulative_total, last, axis=0) - before_total
+    group_pos = np.take_along_axis(cumulative_pos, last, axis=0) - before_pos
+    hits = before_pos + (n - before_total) * group_pos / np.maximum(group_total, 1)
+    return (hits / max(n, 1))[0]
+
+
+def evaluate(features, weights, names, top_n=DEFAULT_TOP_N):
+    """AUC, precision@N and lift@N for every configuration (column of weights)"""
+    weights = np.asarray(weights, dtype=np.float64).reshape(len(baseline_weights()), -1)
+    scores = features.scores(weights)
+    base_rate = features.won.sum() / max(features.n_accounts, 1)
+
+    results = pd.DataFrame({'Configuration': names,
+                            'AUC': auc(scores, features.won, features.lost)})
+    for n in top_n:
+        precision = precision_at(scores, features.won, features.lost, n)
+        results[f'Precision@{n}'] = precision
+        results[f'Lift@{n}'] = precision / base_rate if base_rate else np.nan
+    return results.round(4)
+
+
+def _source_signature(cleaned_path, now, fx_as_of=None):
+    """Identifies the input file version, scoring date and FX date a cache was built from"""
+    stat = os.stat(cleaned_path)
+    return (f"{os.path.abspath(cleaned_path)}:{stat.st_size}:{stat.st_mtime_ns}:"
+            f"{now:%Y-%m-%d}:{fx_as_of or 'cleaned'}")
+
+
+def load_features(cleaned_path, cache_path=None, rebuild=False, now=None, fx_as_of=None):
+    """
+    Backtest features from the cache, or built from the cleaned CSV when
+    the cache is missing or was built from another file version or date.
+    With fx_as_of, Revenue_USD is re-converted with the FX rates as of that date.
+    """
+    now = now or datetime.now()
+    signature = _source_signature(cleaned_path, now, fx_as_of)
+    if cache_path and os.path.exists(cache_path) and not rebuild:
+        features = BacktestFeatures.load(cache_path)
+        if features.source == signature:
+            return features
+
+    df = cleaning.with_numeric_firmographics(pd.read_csv(cleaned_path), fx_as_of)
+    features = BacktestFeatures.from_frame(df, now=now)
+    features.source = signature
+    if cache_path:
+        features.save(cache_path)
+    return features
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Backtest ICP scoring against Won/Lost outcomes')
+    parser.add_argument('--input', default='data/cleaned_diligent_dataset.csv')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH,
+                        help='Cached rule-code profiles, rebuilt when the input changes')
+    parser.add_argument('--rebuild', action='store_true')
+    parser.add_argument('--as-of', help='Scoring date for the recency rule (default: now)')
+    parser.add_argument('--fx-as-of',
+                        help='Re-convert revenue with the FX rates as of this date')
+    parser.add_argument('--multipliers', type=float, nargs='+', default=DEFAULT_MULTIPLIERS,
+                        help='Per-component multipliers on the baseline points')
+    parser.add_argument('--top-n', type=int, nargs='+', default=DEFAULT_TOP_N)
+    parser.add_argument('--output', default=DEFAULT_RESULTS_PATH)
+    args = parser.parse_args()
+
+    print("GTM Engineer Scoring Backtest")
+    print("="*50)
+
+    now = datetime.fromisoformat(args.as_of) if args.as_of else None
+    features = load_features(args.input, args.cache, args.rebuild, now, args.fx_as_of)
+    print(f"Labeled accounts: {features.n_accounts} "
+          f"({int(features.won.sum())} Won, {int(features.lost.sum())} Lost) "
+          f"in {len(features.profile_codes)} rule-code profiles")
+
+    names, weights = component_weight_grid(args.multipliers)
+    results = evaluate(features, weights, names, args.top_n)
+    baseline = evaluate(features, baseline_weights(), ['Current rules'], args.top_n)
+
+    print("\nCURRENT RULES:")
+    print(baseline.to_string(index=False))
+    print(f"\nTOP 10 OF {len(results)} WEIGHT CONFIGURATIONS BY AUC:")
+    print(results.sort_values('AUC', ascending=False).head(10).to_string(index=False))
+
+    results.to_csv(args.output, index=False)
+    print(f"\nBacktest results saved to: {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Pipeline Benchmark Suite
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Generates synthetic leads that reproduce the messy value distributions of
+the sample dataset and benchmarks cleaning, ICP scoring and data quality
+validation at increasing row counts. Throughput and memory for every stage
+are appended to a JSON Lines results file keyed by git commit so runs can
+be compared between commits.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(SCRIPT_DIR, '..', 'deliverables'))
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_RESULTS_PATH = 'analysis/benchmark_results.jsonl'
+
+# Value pools and weights observed in the 1,000-row sample (None = missing)
+VALUE_POOLS = {
+    'Industry': (['Retail', 'Financial Services', 'Technology', 'Manufacturing',
+                  'Healthcare', 'Non-Profit', 'Legal', 'Energy', 'Education',
+                  'Government'], None),
+    'Sub-Industry': (['Higher Ed', 'Biotech', 'Banking', 'Insurance', 'SaaS',
+                      'Utilities', 'Hospitals', 'Law Firm', 'Oil & Gas',
+                      'Federal', 'E-commerce', 'Charity', 'Automotive',
+                      'Semiconductors'], None),
+    'Employee Count': ([None, '500-1,000', '1000+', '200-500', '50-200',
+                        '500 to 1000', 'five hundred', 'approx 800'],
+                       [195, 136, 125, 118, 115, 105, 104, 102]),
+    'Revenue': ([None, '$20M', '€20M', '$5M', '5000000', 'unknown', '$100M',
+                 'USD 250M', '20,000,000 USD', '$1B'],
+                [192, 102, 98, 97, 92, 89, 83, 83, 82, 82]),
+    'Region': (['DACH', 'AMS', 'Unknown', 'UKI', 'FR', None, 'MDO', 'EMEA', 'APAC'],
+               [121, 119, 116, 115, 114, 112, 108, 103, 92]),
+    'HQ Location': ([None, 'NY', 'San Francisco, USA', 'London, UK', 'Berlin',
+                     'Paris, France', 'Singapore', 'Toronto', 'Sydney', 'Dubai',
+                     'Chicago, IL', 'Austin, TX', 'Munich', 'Tokyo', 'Boston'],
+                    [68] + [66] * 14),
+    'Solution Interest': (['Risk', 'Compliance', 'Audit', 'Boards'],
+                          [261, 256, 244, 239]),
+    'Lead Source': (['Partner', 'Inbound', 'Web', 'Purchased', 'Referral', 'Event'],
+                    [179, 178, 167, 167, 156, 153]),
+    'Contact Role/Title': (['Head of Compliance', 'General Counsel', 'Board Secretary',
+                            'VP Finance', 'CFO', 'Legal Counsel', 'IT Director',
+                            'Director of Security', 'Chief Risk Officer', 'CIO',
+                            'Audit Manager'],
+                           [105, 104, 102, 98, 92, 89, 87, 86, 81, 80, 76]),
+    'Annual Board Meetings': ([None, '4', '6', '3-4', '12', 'quarterly', '2',
+                               'monthly', '5', '8', '10', 'unknown', '1'],
+                              [82] + [76] * 12),
+    'Intent Score': ([None, '17', '92', '48', '61', '85', '32', '95%', 'high', '55',
+                      '100', 'medium', 'low', '5', '73'],
+                     [125, 76, 76, 75, 74, 70, 62, 61, 61, 60, 60, 55, 53, 50, 42]),
+    'Lead Owner': ([None, 'Chen Wu', 'TBD', 'Alex Lee', 'Priya Patel', 'Test User',
+                    '—', 'John Smith', 'Jane Doe'],
+                   [199, 107, 106, 102, 102, 102, 101, 91, 90]),
+    'Account Tier': ([None, 'SMB', 'C', 'A', 'Enterprise', 'Tier 1', 'Tier 2',
+                      'Tier 3', 'B', 'MM'],
+                     [119, 112, 110, 108, 105, 99, 96, 94, 80, 77]),
+    'Status': (['Open', 'Lost', 'Won'], [338, 335, 327]),
+}
+
+COMPANY_BASES = ['LexCorp', 'Axiom Space', 'Clampett Oil', 'Stark Industries',
+                 'Wonka Tech', 'Blue Sun Corp', 'Tyrell Corp', 'Black Mesa',
+                 'Oscorp', 'Massive Dynamic', 'Sterling Cooper', 'Tricell Pharma',
+                 'Zorg Industries', 'Pied Piper', 'Shinra Electric', 'Cyberdyne Systems',
+                 'Gringotts Bank', 'Aperture Science', 'Gekko & Co', 'Wayne Enterprises']
+DOMAIN_SUFFIXES = ['.com', '.net', '.co', '.io', '.org']
+TECH_TOOLS = ['Salesforce', 'SFDC', 'Workday', 'ServiceNow', 'Okta', 'HubSpot',
+              'Marketo', 'Pardot', 'Snowflake', 'Google Workspace', 'Azure AD',
+              'Oracle', 'O365', 'SAP', 'Databricks', 'Eloqua', 'unknown']
+TECH_DELIMITERS = [', ', '; ', ' | ', ' & ', ',', ';']
+CERTIFICATIONS = ['ISO27001', 'SOX', 'PCI DSS', 'HIPAA', 'GDPR']
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+
+
+def _sample(rng, values, weights, n):
+    """Sample n values from a pool with optional relative weights"""
+    probs = None
+    if weights is not None:
+        probs = np.asarray(weights, dtype=float)
+        probs /= probs.sum()
+    codes = rng.choice(len(values), size=n, p=probs)
+    return np.array(values, dtype=object)[codes]
+
+
+def _build_combo_pool(rng, tokens, delimiters, size, max_tokens):
+    """Pre-build multi-valued strings (e.g. tech stacks) with mixed delimiters"""
+    pool = []
+    for _ in range(size):
+        k = rng.integers(1, max_tokens + 1)
+        picks = rng.choice(tokens, size=k, replace=False)
+        delimiter = delimiters[rng.integers(len(delimiters))]
+        pool.append(delimiter.join(picks))
+    return pool
+
+
+def _messy_dates(rng, n):
+    """Last-touch dates in the mixed formats seen in the sample"""
+    days = rng.integers(0, 270, size=n)
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(days, unit='D')
+    fmt = rng.integers(0, 4, size=n)
+
+    out = np.empty(n, dtype=object)
+    iso = dates.strftime('%Y-%m-%d')
+    slash = dates.strftime('%m/%d/%y')
+    out[fmt == 0] = iso[fmt == 0]
+    out[fmt == 1] = slash[fmt == 1]
+
+    # 7/1/25 style without zero padding
+    short = (pd.Series(dates.month.astype(str)) + '/' +
+             pd.Series(dates.day.astype(str)) + '/' +
+             pd.Series((dates.year % 100).astype(str))).to_numpy()
+    out[fmt == 2] = short[fmt == 2]
+
+    # April 04, 2025 style
+    long_form = (pd.Series(np.array(MONTH_NAMES, dtype=object)[dates.month - 1]) +
+                 ' ' + pd.Series(dates.strftime('%d')) + ', ' +
+                 pd.Series(dates.year.astype(str))).to_numpy()
+    out[fmt == 3] = long_form[fmt == 3]
+    return out
+
+
+def generate_synthetic_leads(n_rows, seed=42):
+    """
+    Generate a raw lead dataset with the same columns and messy value
+    distributions as the 'Dataset' sheet.
+    """
+    rng = np.random.default_rng(seed)
+
+    base = np.array(COMPANY_BASES, dtype=object)[
+        rng.integers(len(COMPANY_BASES), size=n_rows)]
+    suffix = pd.Series(np.arange(n_rows)).astype(str).to_numpy(dtype=object)
+    company = base + '_' + suffix
+    slug = pd.Series(company).str.lower().str.replace(' ', '', regex=False).to_numpy(dtype=object)
+    tld = np.array(DOMAIN_SUFFIXES, dtype=object)[
+        rng.integers(len(DOMAIN_SUFFIXES), size=n_rows)]
+
+    df = pd.DataFrame({
+        'Company Name': company,
+        'Website': slug + tld,
+        'Email Domain': slug + '.com',
+    })
+
+    for column in ['Industry', 'Sub-Industry', 'Employee Count', 'Revenue', 'Region',
+                   'HQ Location', 'Solution Interest', 'Lead Source', 'Contact Role/Title']:
+        values, weights = VALUE_POOLS[column]
+        df[column] = _sample(rng, values, weights, n_rows)
+
+    tech_pool = _build_combo_pool(rng, TECH_TOOLS, TECH_DELIMITERS, 600, 3)
+    tech = np.array(tech_pool, dtype=object)[rng.integers(len(tech_pool), size=n_rows)]
+    tech[rng.random(n_rows) < 0.198] = None
+    df['Tech Stack Signals'] = tech
+
+    values, weights = VALUE_POOLS['Annual Board Meetings']
+    df['Annual Board Meetings'] = _sample(rng, values, weights, n_rows)
+
+    cert_pool = _build_combo_pool(rng, CERTIFICATIONS, [', '], 100, 2)
+    certs = np.array(cert_pool, dtype=object)[rng.integers(len(cert_pool), size=n_rows)]
+    certs[rng.random(n_rows) < 0.327] = None
+    df['Compliance Certifications'] = certs
+
+    values, weights = VALUE_POOLS['Intent Score']
+    df['Intent Score'] = _sample(rng, values, weights, n_rows)
+    df['Last Marketing Touch'] = _messy_dates(rng, n_rows)
+
+    values, weights = VALUE_POOLS['Lead Owner']
+    df['Lead Owner'] = _sample(rng, values, weights, n_rows)
+
+    parent_roll = rng.random(n_rows)
+    parent = np.where(parent_roll < 0.34, None, base + ' Holdings').astype(object)
+    parent[(parent_roll >= 0.34) & (parent_roll < 0.53)] = '—'
+    parent[(parent_roll >= 0.53) & (parent_roll < 0.68)] = 'Global Holdings Ltd'
+    parent[(parent_roll >= 0.68) & (parent_roll < 0.83)] = 'Private Equity HoldCo'
+    df['Parent Company'] = parent
+
+    values, weights = VALUE_POOLS['Account Tier']
+    df['Account Tier'] = _sample(rng, values, weights, n_rows)
+
+    sfdc = rng.integers(1_000_000, 9_999_999, size=n_rows).astype(float)
+    sfdc[rng.random(n_rows) < 0.036] = np.nan
+    df['SFDC Account ID'] = sfdc
+
+    values, weights = VALUE_POOLS['Status']
+    df['Status'] = _sample(rng, values, weights, n_rows)
+
+    return df
+
+
+def _validator_records(scored_df):
+    """Map cleaned columns onto the DataQualityValidator field names"""
+    return scored_df[['Employee_Count_Clean', 'Revenue_Clean', 'Industry',
+                      'Website_Clean', 'Email Domain']].rename(columns={
+                          'Employee_Count_Clean': 'employee_count',
+                          'Revenue_Clean': 'revenue',
+                          'Industry': 'industry',
+                          'Website_Clean': 'website',
+                          'Email Domain': 'email_domain'
+                      }).to_dict('records')
+
+
+def run_benchmark(n_rows, seed=42):
+    """Benchmark cleaning, scoring and validation for one dataset size"""
+    profiling = importlib.import_module('pipeline_profiler')
+    cleaning = importlib.import_module('02_data_cleaning')
+    scoring = importlib.import_module('03_icp_scoring')
+    qa = importlib.import_module('enrichment_qa_example')
+
+    profiler = profiling.StageProfiler(run_name=f'benchmark_{n_rows}')
+
+    # Silence the pipeline's progress prints while timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        with profiler.stage('generate', rows=n_rows):
+            raw_df = generate_synthetic_leads(n_rows, seed)
+
+        cleaner = cleaning.DiligentDataCleaner(None, profiler=profiler)
+        cleaner.load_data(raw_df)
+        with profiler.stage('clean_data', rows=n_rows):
+            cleaned_df = cleaner.clean_data()
+
+        scorer = scoring.ICPScorer(cleaned_df, profiler=profiler)
+        with profiler.stage('calculate_total_icp_score', rows=n_rows):
+            scored_df = scorer.calculate_total_icp_score()
+
+        validator = qa.DataQualityValidator()
+        with profiler.stage('validate_records', rows=n_rows):
+            for record in _validator_records(scored_df):
+                validator.validate_record(record)
+
+    report = profiler.get_report()
+    report['rows'] = n_rows
+    report['seed'] = seed
+    return report
+
+
+def _git_commit():
+    """Current git commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+            stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_isolated(n_rows, seed):
+    """Run one size in a fresh interpreter so peak RSS is per-size"""
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--child',
+         '--sizes', str(n_rows), '--seed', str(seed)], text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_comparison(result, results_path):
+    """Compare stage throughput against the latest run from another commit"""
+    previous = None
+    if os.path.exists(results_path):
+        with open(results_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                if (entry['rows'] == result['rows'] and
+                        entry.get('git_commit') != result.get('git_commit')):
+                    previous = entry
+
+    print(f"\n{result['rows']:,} rows (peak RSS {result['peak_rss_mb']} MB)")
+    previous_stages = ({s['stage']: s for s in previous['stages']}
+                       if previous else {})
+    for stage in result['stages']:
+        line = f"  {stage['stage']:<50} {stage['wall_s']:>9.3f}s"
+        if stage['rows_per_s']:
+            line += f" {stage['rows_per_s']:>14,.0f} rows/s"
+        old = previous_stages.get(stage['stage'])
+        if old and old['wall_s'] > 0:
+            change = (stage['wall_s'] / old['wall_s'] - 1) * 100
+            line += f"  ({change:+.1f}% vs {previous['git_commit']})"
+        print(line)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark the GTM pipeline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Row counts to benchmark')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--results', default=DEFAULT_RESULTS_PATH,
+                        help='JSON Lines file the results are appended to')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Run all sizes in this interpreter')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_benchmark(args.sizes[0], args.seed)))
+        return
+
+    print("GTM Engineer Pipeline Benchmark")
+    print("="*50)
+
+    commit = _git_commit()
+    for n_rows in args.sizes:
+        if args.in_process:
+            result = run_benchmark(n_rows, args.seed)
+        else:
+            result = _run_isolated(n_rows, args.seed)
+        result['git_commit'] = commit
+        result['recorded_at'] = datetime.now().isoformat(timespec='seconds')
+
+        print_comparison(result, args.results)
+        with open(args.results, 'a') as f:
+            f.write(json.dumps(result) + '\n')
+
+    print(f"\nBenchmark results appended to: {args.results}")
+
+
+if __name__ == "__main__":
+    main()
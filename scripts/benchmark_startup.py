@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Entry Point Startup Benchmark
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Measures how long each entry point takes to import in a fresh interpreter
+and checks that the scoring and cleaning entry points do not pull in the
+heavy visualization/reporting libraries. Exits non-zero when a headless
+entry point loads one of them or exceeds its startup budget, so it can run
+as a CI guard.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must only be imported when charts or slides are produced
+HEAVY_MODULES = ['matplotlib', 'matplotlib.pyplot', 'seaborn', 'pptx']
+
+# Entry points that must start without the heavy modules
+HEADLESS_ENTRY_POINTS = ['score_headless', '03_icp_scoring', '02_data_cleaning',
+                         'generate_ppt']
+
+PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, {script_dir!r})
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'import_s': elapsed,
+    'heavy_loaded': sorted(m for m in {heavy!r} if m in sys.modules)
+}}))
+"""
+
+
+def measure_startup(module, repeats=5):
+    """Median wall time to start an interpreter and import `module`"""
+    code = PROBE.format(script_dir=SCRIPT_DIR, module=module, heavy=HEAVY_MODULES)
+    import_times = []
+    heavy_loaded = []
+
+    for _ in range(repeats):
+        output = subprocess.check_output([sys.executable, '-c', code], text=True)
+        result = json.loads(output.strip().splitlines()[-1])
+        import_times.append(result['import_s'])
+        heavy_loaded = result['heavy_loaded']
+
+    return {
+        'module': module,
+        'median_import_s': round(statistics.median(import_times), 4),
+        'heavy_loaded': heavy_loaded
+    }
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark entry point startup time')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--budget-s', type=float, default=1.0,
+                        help='Maximum median import time for headless entry points')
+    args = parser.parse_args()
+
+    print("GTM Engineer Startup Benchmark")
+    print("="*50)
+
+    failures = []
+    print(f"\n{'Entry point':<25} {'Import (s)':>10}  Heavy modules loaded")
+    for module in HEADLESS_ENTRY_POINTS:
+        result = measure_startup(module, args.repeats)
+        heavy = ', '.join(result['heavy_loaded']) or '-'
+        print(f"{module:<25} {result['median_import_s']:>10.3f}  {heavy}")
+
+        if result['heavy_loaded']:
+            failures.append(f"{module} imports {heavy} at load time")
+        if result['median_import_s'] > args.budget_s:
+            failures.append(f"{module} took {result['median_import_s']:.3f}s "
+                            f"(budget {args.budget_s:.3f}s)")
+
+    if failures:
+        print("\n✗ Startup checks failed:")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+
+    print("\n✓ All entry points start within budget")
+
+
+if __name__ == "__main__":
+    main()
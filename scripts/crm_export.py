@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - CRM Bulk Export
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Streams the scored dataset in chunks and writes only the accounts whose
+ICP fields changed since the last export, mapped to the Salesforce custom
+fields and keyed by SFDC Account ID, as row- and size-capped CSV batches
+ready for a bulk-API upsert. Rows without an SFDC Account ID ('Missing')
+go to separate files for account matching instead of the upsert.
+"""
+
+import argparse
+import glob
+import io
+import os
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_INPUT = 'deliverables/prioritized_accounts.csv'
+DEFAULT_OUTPUT_DIR = 'deliverables/crm_export'
+DEFAULT_STATE_PATH = 'analysis/crm_export_state.npz'
+
+ID_COLUMN = 'SFDC_Account_ID_Clean'
+MISSING_ID = 'Missing'
+
+# Scored column -> Salesforce field
+CRM_FIELDS = {
+    ID_COLUMN: 'Id',
+    'Total_ICP_Score': 'ICP_Score__c',
+    'ICP_Archetype': 'ICP_Archetype__c',
+    'Priority_Tier': 'Priority_Tier__c'
+}
+
+# Extra columns kept for rows without an ID so they can be matched manually
+MISSING_ID_CONTEXT = ['Company Name', 'Website_Clean', 'Lead_Owner_Clean']
+
+# Salesforce Bulk API 2.0 accepts up to 150 MB per upload; stay well below
+DEFAULT_MAX_ROWS = 10_000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+
+class BatchWriter:
+    """Writes CSV batches that roll over at a row or byte cap"""
+
+    def __init__(self, output_dir, prefix, max_rows=DEFAULT_MAX_ROWS,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+        self.paths = []
+        self.rows_written = 0
+        self._file = None
+        self._rows = 0
+        self._bytes = 0
+        self._header = None
+
+    def _open_batch(self):
+        self.close()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir,
+                            f'{self.prefix}_{len(self.paths) + 1:04d}.csv')
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._file.write(self._header)
+        self._rows = 0
+        self._bytes = len(self._header.encode('utf-8'))
+        self.paths.append(path)
+
+    def write(self, df):
+        """Append rows, starting a new batch file whenever a cap is reached"""
+        if df.empty:
+            return
+        if self._header is None:
+            self._header = ','.join(df.columns) + '\n'
+
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False)
+        lines = buffer.getvalue().splitlines(keepends=True)
+
+        for line in lines:
+            size = len(line.encode('utf-8'))
+            if (self._file is None or self._rows >= self.max_rows or
+                    (self._rows and self._bytes + size > self.max_bytes)):
+                self._open_batch()
+            self._file.write(line)
+            self._rows += 1
+            self._bytes += size
+            self.rows_written += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ExportState:
+    """
+    Row hashes of the last successful export, stored as two sorted numpy
+    arrays (IDs and uint64 hashes) so lookups are vectorized searchsorted.
+    """
+
+    def __init__(self, ids=None, hashes=None):
+        self.ids = np.array([] if ids is None else ids, dtype=str)
+        self.hashes = np.array([] if hashes is None else hashes, dtype=np.uint64)
+
+    @classmethod
+    def load(cls, path):
+        if not path or not os.path.exists(path):
+            return cls()
+        with np.load(path) as state:
+            return cls(state['ids'], state['hashes'])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, ids=self.ids, hashes=self.hashes)
+        os.replace(tmp_path, path)
+
+    def changed(self, ids, hashes):
+        """Boolean mask of rows that are new or whose hash differs"""
+        if len(self.ids) == 0:
+            return np.ones(len(ids), dtype=bool)
+        pos = np.searchsorted(self.ids, ids)
+        pos = np.minimum(pos, len(self.ids) - 1)
+        known = self.ids[pos] == ids
+        return ~known | (self.hashes[pos] != hashes)
+
+    @classmethod
+    def from_chunks(cls, id_chunks, hash_chunks):
+        """Build the next state; the last occurrence of a duplicated ID wins"""
+        if not id_chunks:
+            return cls()
+        ids = np.concatenate(id_chunks)[::-1]
+        hashes = np.concatenate(hash_chunks)[::-1]
+        ids, first = np.unique(ids, return_index=True)
+        return cls(ids, hashes[first])
+
+
+def _normalize_ids(series):
+    """SFDC IDs as text ('1186826.0' and '1186826' are the same account)"""
+    ids = series.astype(str).str.strip()
+    return ids.str.replace(r'\.0$', '', regex=True)
+
+
+def export_changes(input_path=DEFAULT_INPUT, output_dir=DEFAULT_OUTPUT_DIR,
+                   state_path=DEFAULT_STATE_PATH, chunksize=100_000,
+                   max_rows=DEFAULT_MAX_ROWS, max_bytes=DEFAULT_MAX_BYTES,
+                   full=False):
+    """
+    Write changed rows as upsert batches and Missing-ID rows as separate
+    batches. Returns (result dict, next ExportState); the state is only
+    persisted by the caller once the batches have been delivered.
+    """
+    previous = ExportState() if full else ExportState.load(state_path)
+
+    # Clear batches from an earlier run so stale files are never uploaded
+    for path in glob.glob(os.path.join(output_dir, '*.csv')):
+        os.remove(path)
+
+    # Positions of each ID's last row across the whole export, so an account
+    # duplicated across chunks is upserted once (last row wins, as in
+    # score_snapshots.account_state)
+    all_ids = _normalize_ids(pd.read_csv(input_path, usecols=[ID_COLUMN],
+                                         dtype={ID_COLUMN: str})[ID_COLUMN]
+                             .fillna(MISSING_ID))
+    keep = ((all_ids == MISSING_ID) | ~all_ids.duplicated(keep='last')).to_numpy()
+
+    upserts = BatchWriter(output_dir, 'upsert', max_rows, max_bytes)
+    missing = BatchWriter(output_dir, 'missing_id', max_rows, max_bytes)
+    id_chunks, hash_chunks = [], []
+    rows_read = 0
+
+    usecols = list(CRM_FIELDS) + MISSING_ID_CONTEXT
+    for chunk in pd.read_csv(input_path, usecols=lambda c: c in usecols,
+                             dtype={ID_COLUMN: str}, chunksize=chunksize):
+        chunk_keep = keep[rows_read:rows_read + len(chunk)]
+        rows_read += len(chunk)
+        ids = _normalize_ids(chunk[ID_COLUMN].fillna(MISSING_ID))
+        has_id = (ids != MISSING_ID).to_numpy()
+
+        missing_rows = chunk.loc[~has_id, [c for c in usecols if c in chunk.columns]]
+        missing.write(missing_rows.drop(columns=ID_COLUMN).rename(columns=CRM_FIELDS))
+
+        records = chunk.loc[has_id & chunk_keep, list(CRM_FIELDS)].copy()
+        records[ID_COLUMN] = ids[has_id & chunk_keep]
+        record_ids = records[ID_COLUMN].to_numpy(dtype=str)
+        hashes = pd.util.hash_pandas_object(records, index=False).to_numpy()
+
+        changed = previous.changed(record_ids, hashes)
+        upserts.write(records.loc[changed].rename(columns=CRM_FIELDS))
+
+        id_chunks.append(record_ids)
+        hash_chunks.append(hashes)
+
+    upserts.close()
+    missing.close()
+
+    result = {
+        'rows_read': rows_read,
+        'changed_rows': upserts.rows_written,
+        'missing_id_rows': missing.rows_written,
+        'upsert_batches': upserts.paths,
+        'missing_id_batches': missing.paths
+    }
+    return result, ExportState.from_chunks(id_chunks, hash_chunks)
+
+
+def upload_batches(paths, endpoint_url, timeout=30):
+    """POST each CSV batch to a bulk upsert endpoint; returns HTTP statuses"""
+    statuses = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            request = urllib.request.Request(
+                endpoint_url, data=f.read(), method='PUT',
+                headers={'Content-Type': 'text/csv',
+                         'X-Batch-Name': os.path.basename(path)})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            statuses.append(response.status)
+    return statuses
+
+
+class StubBulkEndpoint:
+    """Local stand-in for the bulk API: records every uploaded batch"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.batches = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                stub.batches.append((self.headers.get('X-Batch-Name'), body))
+                self.send_response(201)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f'http://{host}:{self.server.server_port}/ingest'
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def uploaded_rows(self):
+        """Number of data rows received across all batches"""
+        return sum(body.count(b'\n') - 1 for _, body in self.batches)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Export changed ICP scores for CRM upsert')
+    parser.add_argument('--input', default=DEFAULT_INPUT)
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--state',
+                        help='Row hashes of the last successful export '
+                             f'(default: {DEFAULT_STATE_PATH})')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_MAX_ROWS)
+    parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the saved state and export every row')
+    parser.add_argument('--upload', help='Bulk upsert endpoint URL')
+    parser.add_argument('--stub', action='store_true',
+                        help='Dry run against a local stub endpoint; the state '
+                             'is only advanced when --state names a test path')
+    args = parser.parse_args()
+    state_path = args.state or DEFAULT_STATE_PATH
+
+    print("GTM Engineer CRM Export")
+    print("="*50)
+
+    result, state = export_changes(args.input, args.output_dir, state_path,
+                                   args.chunksize, args.max_rows, args.max_bytes,
+                                   args.full)
+    print(f"Rows read: {result['rows_read']}")
+    print(f"Changed rows for upsert: {result['changed_rows']} "
+          f"in {len(result['upsert_batches'])} batches")
+    print(f"Rows without SFDC Account ID: {result['missing_id_rows']} "
+          f"in {len(result['missing_id_batches'])} batches")
+
+    if args.stub:
+        with StubBulkEndpoint() as stub:
+            upload_batches(result['upsert_batches'], stub.url)
+            print(f"Stub endpoint received {stub.uploaded_rows()} rows "
+                  f"in {len(stub.batches)} batches")
+    elif args.upload:
+        upload_batches(result['upsert_batches'], args.upload)
+        print(f"Uploaded {len(result['upsert_batches'])} batches to {args.upload}")
+
+    # Only a delivery advances the state; otherwise the next run re-exports
+    # the same changes instead of treating them as sent. A stub run never
+    # touches the default state, only an explicitly given test path
+    if (args.upload and not args.stub) or (args.stub and args.state):
+        state.save(state_path)
+        print(f"Export state saved to: {state_path}")
+    else:
+        print(f"Batches not delivered; export state left unchanged: {state_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Concurrent Enrichment and Rescoring
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Streams accounts whose Employee_Count_Clean or Revenue_Clean is Unknown
+through a bounded queue to a pool of enrichment workers. The main thread
+consumes enriched records as they arrive, re-normalizes the filled fields
+with DiligentDataCleaner and rescores them in small batches through the
+resident score store, so waiting on the enrichment API overlaps with
+scoring instead of running before it.
+"""
+
+import argparse
+import importlib
+import os
+import queue
+import sys
+import threading
+import time
+
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(SCRIPT_DIR, '..', 'deliverables'))
+
+rescoring = importlib.import_module('event_rescoring')
+
+# Enrichment response key -> raw field it fills, and the clean column
+# whose 'Unknown' value makes the row a candidate
+ENRICHMENT_FIELDS = {
+    'estimated_employees': ('Employee Count', 'Employee_Count_Clean'),
+    'estimated_revenue': ('Revenue', 'Revenue_Clean')
+}
+
+_DONE = object()
+
+
+class _WorkerError:
+    """An exception raised in a worker thread, passed to run() via results"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def default_engine_factory():
+    """One DataEnrichmentEngine per worker thread (its stats are not shared)"""
+    qa = importlib.import_module('enrichment_qa_example')
+    return qa.DataEnrichmentEngine()
+
+
+class EnrichmentPipeline:
+    """Bounded producer/consumer pipeline from enrichment workers to the scorer"""
+
+    def __init__(self, scored_df, engine_factory=default_engine_factory,
+                 workers=8, queue_size=64, batch_size=32, tier_thresholds='infer'):
+        self.store = rescoring.ResidentScoreStore(scored_df, tier_thresholds)
+        self.engine_factory = engine_factory
+        self.workers = workers
+        self.batch_size = batch_size
+
+        self.requests = queue.Queue(maxsize=queue_size)
+        self.results = queue.Queue(maxsize=queue_size)
+        self.engines = []
+        self._stop = threading.Event()
+        self.transitions = []
+        self.rows_enriched = 0
+        self.batches_rescored = 0
+
+    def gap_positions(self, limit=None):
+        """Row positions with an Unknown employee count or revenue"""
+        df = self.store.df
+        gaps = pd.Series(False, index=df.index)
+        for _, clean_column in ENRICHMENT_FIELDS.values():
+            gaps |= df[clean_column].astype(str).eq('Unknown')
+        positions = df.index[gaps].to_numpy()
+        return positions[:limit] if limit else positions
+
+    def _put(self, item):
+        """Blocking put that gives up once the pipeline is stopping"""
+        while not self._stop.is_set():
+            try:
+                self.requests.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, positions):
+        df = self.store.df
+        for position in positions:
+            # Blocks when workers fall behind, bounding memory
+            if not self._put((position, df.at[position, 'Company Name'],
+                              df.at[position, 'Website_Clean'])):
+                return
+        for _ in range(self.workers):
+            self._put(_DONE)
+
+    def _work(self):
+        # Always post _DONE, so run() never waits on a dead worker; errors
+        # are handed to the main thread and re-raised there
+        try:
+            engine = self.engine_factory()
+            self.engines.append(engine)
+            while not self._stop.is_set():
+                try:
+                    item = self.requests.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    return
+                position, company, website = item
+                website = website if isinstance(website, str) else None
+                self.results.put((position, engine.enrich_company_data(company, website)))
+        except Exception as error:
+            self.results.put(_WorkerError(error))
+        finally:
+            self.results.put(_DONE)
+
+    def _updates_for(self, position, enriched):
+        """Raw-field updates that fill this row's Unknown firmographics"""
+        updates = []
+        for key, (raw_field, clean_column) in ENRICHMENT_FIELDS.items():
+            if enriched.get(key) and self.store.df.at[position, clean_column] == 'Unknown':
+                updates.append(([position], raw_field, enriched[key]))
+        return updates
+
+    def _rescore(self, updates):
+        if updates:
+            self.transitions.extend(self.store.apply_row_updates(updates))
+            self.batches_rescored += 1
+
+    def run(self, limit=None, positions=None):
+        """Enrich and rescore the gap rows (or the given row positions)"""
+        if positions is None:
+            positions = self.gap_positions(limit)
+        threads = [threading.Thread(target=self._produce, args=(positions,), daemon=True)]
+        threads += [threading.Thread(target=self._work, daemon=True)
+                    for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        batch = []
+        error = None
+        while finished < self.workers:
+            try:
+                item = self.results.get(timeout=0.05)
+            except queue.Empty:
+                # Nothing new arrived; score what we have instead of idling
+                self._rescore(batch)
+                batch = []
+                continue
+            if item is _DONE:
+                finished += 1
+                continue
+            if isinstance(item, _WorkerError):
+                # Stop the producer and the other workers, then re-raise
+                error = error or item.error
+                self._stop.set()
+                continue
+
+            position, enriched = item
+            if enriched:
+                updates = self._updates_for(position, enriched)
+                self.rows_enriched += bool(updates)
+                batch.extend(updates)
+            if len(batch) >= self.batch_size:
+                self._rescore(batch)
+                batch = []
+
+        self._rescore(batch)
+        for thread in threads:
+            thread.join()
+        if error is not None:
+            raise error
+        return self.store.df
+
+    def enrichment_stats(self):
+        """Engine statistics summed across workers"""
+        totals = {}
+        for engine in self.engines:
+            for key, value in engine.enrichment_stats.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Enrich Unknown firmographics and rescore')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--output', help='Write the enriched, rescored accounts here')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--queue-size', type=int, default=64)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--limit', type=int, help='Enrich at most this many rows')
+    args = parser.parse_args()
+
+    print("GTM Engineer Enrichment Pipeline")
+    print("="*50)
+
+    scored_df = pd.read_csv(args.input, dtype={rescoring.ID_COLUMN: str})
+    pipeline = EnrichmentPipeline(scored_df, workers=args.workers,
+                                  queue_size=args.queue_size, batch_size=args.batch_size)
+
+    start = time.perf_counter()
+    enriched_df = pipeline.run(args.limit)
+    elapsed = time.perf_counter() - start
+
+    print(f"Rows enriched: {pipeline.rows_enriched} in {elapsed:.1f}s "
+          f"({args.workers} workers, {pipeline.batches_rescored} rescoring batches)")
+    print(f"Enrichment stats: {pipeline.enrichment_stats()}")
+    print(f"Tier transitions: {len(pipeline.transitions)}")
+    print(f"Mean ICP score: {scored_df['Total_ICP_Score'].mean():.1f} -> "
+          f"{enriched_df['Total_ICP_Score'].mean():.1f}")
+
+    if args.output:
+        enriched_df.to_csv(args.output, index=False)
+        print(f"Enriched accounts saved to: {args.output}")
+    return enriched_df
+
+
+if __name__ == "__main__":
+    main()
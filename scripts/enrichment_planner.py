@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Budgeted Enrichment Planner
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Ranks accounts with missing firmographics by how much enriching them could
+move their Total_ICP_Score and Priority_Tier, using the scoring rule table
+in vectorized form, and spends a fixed enrichment budget (API calls) only
+on the top-K rows. Rows whose tier cannot change are never sent.
+"""
+
+import argparse
+import importlib
+import time
+
+import numpy as np
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+enrichment = importlib.import_module('enrichment_pipeline')
+
+# Clean column filled by enrichment -> SCORING_RULES factor it unlocks
+ENRICHMENT_FACTORS = {
+    'Employee_Count_Clean': 'employee_count',
+    'Revenue_Clean': 'revenue'
+}
+
+
+def _tier_index(scores, thresholds):
+    return scoring.assign_priority_tiers(scores, thresholds).codes.astype(np.int8)
+
+
+def plan_enrichment(scored_df, now=None, tier_thresholds='infer'):
+    """
+    Score-gain estimates for every row with missing firmographics:
+    - Max_Score_Gain: best-case points from the missing factors
+    - Expected_Score_Gain: points if the missing values follow the
+      distribution of the rows where they are known
+    and the tier jumps they imply, under the frame's own tier thresholds
+    (inferred unless given, as in event_rescoring). Sorted best first.
+    """
+    df = scored_df.reset_index(drop=True)
+    if tier_thresholds == 'infer':
+        tier_thresholds = scoring.infer_tier_thresholds(df)
+    scorer = scoring.ICPScorer(df.iloc[:0])
+    _, codes = scorer.score_components(df, ['Firmographic_Score'], now)
+
+    max_gain = np.zeros(len(df))
+    expected_gain = np.zeros(len(df))
+    missing_any = np.zeros(len(df), dtype=bool)
+    for column, factor in ENRICHMENT_FACTORS.items():
+        points = scorer._rule_points(factor)
+        current = points[codes[factor]]
+        missing = df[column].astype(str).eq('Unknown').to_numpy()
+        known_points = current[~missing]
+        expected = known_points.mean() if len(known_points) else points.max()
+
+        max_gain += np.where(missing, points.max() - current, 0)
+        expected_gain += np.where(missing, np.maximum(expected - current, 0), 0)
+        missing_any |= missing
+
+    total = df['Total_ICP_Score'].to_numpy(dtype=np.float64)
+    current_tier = _tier_index(total, tier_thresholds)
+    max_tier = _tier_index(np.minimum(total + max_gain, 100), tier_thresholds)
+    expected_tier = _tier_index(np.minimum(total + expected_gain, 100), tier_thresholds)
+    plan = pd.DataFrame({
+        'Company Name': df['Company Name'],
+        'Total_ICP_Score': total,
+        'Priority_Tier': df['Priority_Tier'],
+        'Max_Score_Gain': max_gain,
+        'Expected_Score_Gain': expected_gain.round(1),
+        'Max_Tier_Jump': max_tier - current_tier,
+        'Expected_Tier_Jump': expected_tier - current_tier
+    })[missing_any]
+
+    return plan.sort_values(
+        ['Expected_Tier_Jump', 'Max_Tier_Jump', 'Expected_Score_Gain', 'Total_ICP_Score'],
+        ascending=False, kind='stable')
+
+
+def select_budget(plan, budget):
+    """Top-`budget` rows whose tier can still change"""
+    return plan[plan['Max_Tier_Jump'] > 0].head(budget)
+
+
+def run_budgeted_enrichment(scored_df, budget, workers=8, tier_thresholds='infer'):
+    """Enrich only the planned rows; returns (pipeline, selected plan rows)"""
+    if tier_thresholds == 'infer':
+        tier_thresholds = scoring.infer_tier_thresholds(scored_df)
+    selected = select_budget(plan_enrichment(scored_df, tier_thresholds=tier_thresholds), budget)
+    pipeline = enrichment.EnrichmentPipeline(scored_df, workers=workers,
+                                             tier_thresholds=tier_thresholds)
+    pipeline.run(positions=selected.index.to_numpy())
+    return pipeline, selected
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Plan enrichment under an API budget')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--budget', type=int, default=50,
+                        help='Maximum number of enrichment API calls')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--plan-only', action='store_true',
+                        help='Print the plan without calling the enrichment engine')
+    parser.add_argument('--output', help='Write the enriched, rescored accounts here')
+    args = parser.parse_args()
+
+    print("GTM Engineer Enrichment Planner")
+    print("="*50)
+
+    scored_df = pd.read_csv(args.input, dtype={enrichment.rescoring.ID_COLUMN: str})
+    tier_thresholds = scoring.infer_tier_thresholds(scored_df)
+    plan = plan_enrichment(scored_df, tier_thresholds=tier_thresholds)
+    selected = select_budget(plan, args.budget)
+
+    print(f"Rows with missing firmographics: {len(plan)}")
+    print(f"Rows whose tier can change: {(plan['Max_Tier_Jump'] > 0).sum()}")
+    print(f"Selected for enrichment (budget {args.budget}): {len(selected)}")
+    print(f"Expected tier upgrades: {(selected['Expected_Tier_Jump'] > 0).sum()}")
+    print("\nTOP 10 ENRICHMENT TARGETS:")
+    print(selected.head(10).to_string(max_colwidth=20))
+
+    if args.plan_only:
+        return plan
+
+    start = time.perf_counter()
+    pipeline = enrichment.EnrichmentPipeline(scored_df, workers=args.workers,
+                                             tier_thresholds=tier_thresholds)
+    enriched_df = pipeline.run(positions=selected.index.to_numpy())
+    print(f"\nEnriched {pipeline.rows_enriched} rows in "
+          f"{time.perf_counter() - start:.1f}s, {len(pipeline.transitions)} tier transitions")
+
+    if args.output:
+        enriched_df.to_csv(args.output, index=False)
+        print(f"Enriched accounts saved to: {args.output}")
+    return plan
+
+
+if __name__ == "__main__":
+    main()
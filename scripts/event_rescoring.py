@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Event-Driven Rescoring
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Keeps scored accounts resident in memory, keyed by SFDC Account ID, and
+applies field-level change events (account ID, field, new value). Each
+field maps to the scoring components that read it, so a new Intent Score
+or Last Marketing Touch only recomputes Intent_Signals_Score. The total,
+priority tier and archetype are updated in place and tier transitions are
+published to subscribers (e.g. a CRM sync or a rep alert).
+"""
+
+import argparse
+import importlib
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+cleaning = importlib.import_module('02_data_cleaning')
+crm_export = importlib.import_module('crm_export')
+
+ID_COLUMN = crm_export.ID_COLUMN
+
+# Raw CRM field -> (cleaned column, DiligentDataCleaner normalizer)
+RAW_FIELD_NORMALIZERS = {
+    'Employee Count': ('Employee_Count_Clean', 'normalize_employee_count'),
+    'Revenue': ('Revenue_Clean', 'normalize_revenue'),
+    'Region': ('Region_Clean', 'normalize_region'),
+    'Last Marketing Touch': ('Last_Marketing_Touch_Clean', 'normalize_date'),
+    'Tech Stack Signals': ('Tech_Stack_Clean', 'standardize_tech_stack'),
+    'Intent Score': ('Intent_Score_Clean', None)
+}
+
+
+def build_field_dependencies():
+    """Scored column -> components (and 'ICP_Archetype') that depend on it"""
+    dependencies = defaultdict(set)
+    for spec in scoring.SCORING_RULES.values():
+        dependencies[spec['column']].add(spec['component'])
+    for column in scoring.ARCHETYPE_FIELDS:
+        dependencies[column].add('ICP_Archetype')
+    # Clean strings also feed the numeric columns derived from them
+    for numeric_column, source in cleaning.NUMERIC_FIRMOGRAPHIC_SOURCES.items():
+        dependencies[source] |= dependencies.get(numeric_column, set())
+    return dict(dependencies)
+
+
+FIELD_DEPENDENCIES = build_field_dependencies()
+
+
+class ResidentScoreStore:
+    """
+    Scored accounts held in memory and rescored by change events.
+
+    Rescored rows are tiered with the thresholds the frame was scored with:
+    pass ICPScorer.tier_thresholds, or leave `tier_thresholds` unset to
+    infer them from the frame (see scoring.infer_tier_thresholds).
+    """
+
+    def __init__(self, scored_df, tier_thresholds='infer'):
+        self.df = cleaning.with_numeric_firmographics(scored_df.reset_index(drop=True))
+        # A CSV round trip turns the Int32/float32 columns into float64
+        for column, dtype in cleaning.numeric_firmographics(self.df.iloc[:0]).dtypes.items():
+            self.df[column] = self.df[column].astype(dtype)
+        self.df['Priority_Tier'] = self.df['Priority_Tier'].astype(
+            pd.CategoricalDtype(scoring.PRIORITY_TIER_LABELS, ordered=True))
+        self.tier_thresholds = (scoring.infer_tier_thresholds(self.df)
+                                if tier_thresholds == 'infer' else tier_thresholds)
+
+        self.scorer = scoring.ICPScorer(self.df.iloc[:0])
+        self.cleaner = cleaning.DiligentDataCleaner(None)
+        self.subscribers = []
+        self.components_recomputed = 0
+
+        # One ID can appear on several rows; events update all of them.
+        # 'Missing' is a placeholder shared by unrelated rows, not an account.
+        # IDs are normalized like the CRM export ('1186826.0' -> '1186826')
+        ids = crm_export._normalize_ids(self.df[ID_COLUMN].fillna(crm_export.MISSING_ID))
+        self.account_ids = ids.to_numpy()
+        self.positions = {account_id: rows for account_id, rows in
+                          ids.groupby(ids).indices.items()
+                          if account_id != crm_export.MISSING_ID}
+
+    def subscribe(self, callback):
+        """Call callback(transition) for every priority tier change"""
+        self.subscribers.append(callback)
+
+    def resolve_field(self, field, value):
+        """Map a raw CRM field to its cleaned column and normalized value"""
+        if field in RAW_FIELD_NORMALIZERS:
+            column, normalizer = RAW_FIELD_NORMALIZERS[field]
+            if normalizer is None:
+                return column, pd.to_numeric(value, errors='coerce')
+            return column, getattr(self.cleaner, normalizer)(value)
+        if field in self.df.columns:
+            return field, value
+        raise KeyError(f"Unknown field: {field}")
+
+    def apply_event(self, account_id, field, value):
+        """Apply one change event; returns the tier transitions it caused"""
+        return self.apply_events([(account_id, field, value)])
+
+    def apply_events(self, events, now=None):
+        """
+        Apply a batch of (account_id, field, value) events. Fields are set
+        first, then only the dependent components of the touched rows are
+        recomputed in one vectorized pass per component.
+        """
+        events = list(events)
+        account_ids = crm_export._normalize_ids(
+            pd.Series([account_id for account_id, _, _ in events], dtype=object))
+        updates = []
+        for account_id, (_, field, value) in zip(account_ids, events):
+            rows = self.positions.get(account_id)
+            if rows is not None:
+                updates.append((rows, field, value))
+        return self.apply_row_updates(updates, now)
+
+    def apply_row_updates(self, updates, now=None):
+        """Like apply_events, keyed by row positions instead of account ID"""
+        touched = defaultdict(set)
+        for rows, field, value in updates:
+            if field in RAW_FIELD_NORMALIZERS and field in self.df.columns:
+                self.df.loc[rows, field] = value
+                if field == 'Revenue' and 'Revenue_Currency' in self.df.columns:
+                    self.df.loc[rows, 'Revenue_Currency'] = cleaning.fx_rates.detect_currency(
+                        pd.Series([value])).iloc[0]
+            column, value = self.resolve_field(field, value)
+            self.df.loc[rows, column] = value
+            if column in cleaning.NUMERIC_FIRMOGRAPHIC_SOURCES.values():
+                numeric = cleaning.numeric_firmographics(self.df.loc[rows])
+                for numeric_column in cleaning.NUMERIC_FIRMOGRAPHIC_SOURCES:
+                    self.df.loc[rows, numeric_column] = numeric[numeric_column]
+            for position in rows:
+                touched[position] |= FIELD_DEPENDENCIES.get(column, set())
+
+        # Group rows by the set of components they need
+        groups = defaultdict(list)
+        for position, dependents in touched.items():
+            if dependents:
+                groups[frozenset(dependents)].append(position)
+
+        transitions = []
+        for dependents, rows in groups.items():
+            transitions.extend(self._rescore(np.array(sorted(rows)), dependents, now))
+
+        for transition in transitions:
+            for callback in self.subscribers:
+                callback(transition)
+        return transitions
+
+    def _rescore(self, rows, dependents, now):
+        subset = self.df.loc[rows]
+        components = [c for c in scoring.SCORE_COMPONENTS if c in dependents]
+
+        if components:
+            scores, _ = self.scorer.score_components(subset, components, now)
+            self.df.loc[rows, components] = scores[components].to_numpy()
+            self.components_recomputed += len(rows) * len(components)
+
+        if 'ICP_Archetype' in dependents:
+            self.df.loc[rows, 'ICP_Archetype'] = self.scorer.assign_icp_archetypes(
+                subset).to_numpy()
+
+        old_scores = subset['Total_ICP_Score'].to_numpy()
+        old_tiers = subset['Priority_Tier'].astype(object).to_numpy()
+        new_scores = self.df.loc[rows, scoring.SCORE_COMPONENTS].sum(axis=1).to_numpy()
+        new_tiers = scoring.assign_priority_tiers(new_scores, self.tier_thresholds)
+
+        self.df.loc[rows, 'Total_ICP_Score'] = new_scores
+        self.df.loc[rows, 'Priority_Tier'] = new_tiers
+
+        new_tiers = np.asarray(new_tiers, dtype=object)
+        changed = np.flatnonzero(new_tiers != old_tiers)
+        return [{
+            'account_id': self.account_ids[rows[i]],
+            'company': self.df.at[rows[i], 'Company Name'],
+            'old_tier': old_tiers[i],
+            'new_tier': new_tiers[i],
+            'old_score': int(old_scores[i]),
+            'new_score': int(new_scores[i])
+        } for i in changed]
+
+    def get_account(self, account_id):
+        """Current scored rows for an account"""
+        account_id = crm_export._normalize_ids(pd.Series([account_id], dtype=object)).iloc[0]
+        return self.df.loc[self.positions[account_id]]
+
+
+def print_transition(transition):
+    """Print a tier transition in the report style"""
+    print(f"{transition['company']} ({transition['account_id']}): "
+          f"{transition['old_tier']} -> {transition['new_tier']} "
+          f"({transition['old_score']} -> {transition['new_score']})")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Apply change events to scored accounts')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--events', required=True,
+                        help='CSV of change events with account_id, field, value columns')
+    parser.add_argument('--output', help='Write the rescored accounts here')
+    args = parser.parse_args()
+
+    print("GTM Engineer Event-Driven Rescoring")
+    print("="*50)
+
+    store = ResidentScoreStore(pd.read_csv(args.input, dtype={ID_COLUMN: str}))
+    store.subscribe(print_transition)
+
+    events = pd.read_csv(args.events, dtype=str)
+    transitions = store.apply_events(
+        events[['account_id', 'field', 'value']].itertuples(index=False, name=None))
+
+    print(f"\nApplied {len(events)} events, {len(transitions)} tier transitions")
+    print(f"Component recomputations: {store.components_recomputed}")
+
+    if args.output:
+        store.df.to_csv(args.output, index=False)
+        print(f"Rescored accounts saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - FX Rates for Revenue Normalization
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Detects the currency of raw revenue values and converts amounts to USD
+with a local, dated rate table (data/fx_rates.csv). The table is read
+once per process and rates are applied per currency group, so a
+multi-million-row load pays one lookup per currency, not per cell.
+"""
+
+import re
+
+import pandas as pd
+
+DEFAULT_FX_PATH = 'data/fx_rates.csv'
+
+# Checked in order; values with no marker are USD
+CURRENCY_PATTERNS = [
+    ('EUR', r'€|\bEUR\b'),
+    ('GBP', r'£|\bGBP\b'),
+    ('JPY', r'¥|\bJPY\b'),
+    ('CHF', r'\bCHF\b'),
+    ('CAD', r'\bCAD\b|C\$'),
+    ('AUD', r'\bAUD\b|A\$'),
+]
+
+_fx_tables = {}
+
+
+def load_fx_table(path=DEFAULT_FX_PATH):
+    """Dated rate table (effective_date, currency, usd_per_unit), cached per path"""
+    if path not in _fx_tables:
+        table = pd.read_csv(path, parse_dates=['effective_date'])
+        _fx_tables[path] = table.sort_values('effective_date')
+    return _fx_tables[path]
+
+
+def rates_as_of(as_of=None, path=DEFAULT_FX_PATH):
+    """USD per unit for each currency, from the latest rates on or before
+    as_of. USD is always 1.0, whatever the table covers."""
+    table = load_fx_table(path)
+    if as_of is not None:
+        table = table[table['effective_date'] <= pd.Timestamp(as_of)]
+    rates = table.groupby('currency')['usd_per_unit'].last().to_dict()
+    rates['USD'] = 1.0
+    return rates
+
+
+def detect_currency(values):
+    """Currency code per raw revenue value (vectorized; missing -> USD)"""
+    # Match each distinct raw value once, then broadcast back to rows
+    codes, uniques = pd.factorize(values.astype(object).where(values.notna(), ''))
+    text = pd.Series(uniques, dtype=object).astype(str).str.upper()
+    currency = pd.Series('USD', index=text.index, dtype=object)
+    undecided = pd.Series(True, index=text.index)
+    for code, pattern in CURRENCY_PATTERNS:
+        match = undecided & text.str.contains(pattern, regex=True)
+        currency[match] = code
+        undecided &= ~match
+    return pd.Series(currency.to_numpy()[codes], index=values.index, dtype=object)
+
+
+def currency_of(value):
+    """Currency code of a single raw revenue value (missing -> USD)"""
+    text = '' if pd.isna(value) else str(value).upper()
+    for code, pattern in CURRENCY_PATTERNS:
+        if re.search(pattern, text):
+            return code
+    return 'USD'
+
+
+def convert_to_usd(amounts, currencies, as_of=None, path=DEFAULT_FX_PATH):
+    """
+    Multiply amounts by their currency's USD rate. Raises ValueError when a
+    currency with amounts to convert has no rate on or before as_of, rather
+    than returning NaN that would read as an unparseable revenue.
+    """
+    rates = rates_as_of(as_of, path)
+    usd = pd.Series(float('nan'), index=amounts.index, dtype='float64')
+    for currency, index in currencies.groupby(currencies, sort=False).groups.items():
+        values = amounts[index].astype('float64')
+        if currency not in rates:
+            if values.notna().any():
+                raise ValueError(f"No {currency} rate in {path} on or before "
+                                 f"{as_of or 'the latest date'}")
+            continue
+        usd[index] = values * rates[currency]
+    return usd
@@ -1,108 +1,124 @@
-from pptx import Presentation
-from pptx.util import Inches
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Project Presentation Generator
 
-# Create a presentation object
-prs = Presentation()
+Builds the summary slide deck. python-pptx is imported only when the deck
+is generated so importing this module stays cheap.
+"""
 
-# Slide 1: Title Slide
-slide = prs.slides.add_slide(prs.slide_layouts[0])
-title = slide.shapes.title
-subtitle = slide.placeholders[1]
-title.text = "Diligent GTM Engineer Analysis Project"
-subtitle.text = "Building a Data-Driven ICP Framework and Account Prioritization System\nDate: September 15, 2025"
 
-# Slide 2: Project Overview
-slide = prs.slides.add_slide(prs.slide_layouts[1])
-shapes = slide.shapes
-title_shape = shapes.title
-body_shape = shapes.placeholders[1]
-title_shape.text = "Project Overview"
-tf = body_shape.text_frame
-tf.text = "Objectives:"
-p = tf.add_paragraph()
-p.text = "• Data Processing & Cleaning"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Pipeline/Script Development"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• ICP Definition & Prioritization"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Systems Integration Plan"
-p.level = 1
+def generate_presentation(output_path='deliverables/project_presentation.pptx'):
+    """Build the project presentation and save it to output_path"""
+    from pptx import Presentation
 
-# Slide 3: Data Cleaning Approach
-slide = prs.slides.add_slide(prs.slide_layouts[1])
-shapes = slide.shapes
-title_shape = shapes.title
-body_shape = shapes.placeholders[1]
-title_shape.text = "Data Cleaning Approach"
-tf = body_shape.text_frame
-tf.text = "Key Cleaning Tasks:"
-p = tf.add_paragraph()
-p.text = "• Employee Count Normalization: Standardized ranges and formats"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Revenue Standardization: Universal USD format"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Region Mapping: Consistent labels and expansions"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Date Normalization: YYYY-MM-DD format"
-p.level = 1
+    # Create a presentation object
+    prs = Presentation()
 
-# Slide 4: ICP Scoring Framework
-slide = prs.slides.add_slide(prs.slide_layouts[1])
-shapes = slide.shapes
-title_shape = shapes.title
-body_shape = shapes.placeholders[1]
-title_shape.text = "ICP Scoring Framework"
-tf = body_shape.text_frame
-tf.text = "ICP Archetypes:"
-p = tf.add_paragraph()
-p.text = "• Enterprise Risk Management: Large companies focused on risk"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Mid-Market Compliance: Growing companies needing compliance"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Board Governance: Organizations managing board processes"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "Scoring: 0-100 points across firmographic, solution, intent, and tech dimensions"
-p.level = 0
+    # Slide 1: Title Slide
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    title = slide.shapes.title
+    subtitle = slide.placeholders[1]
+    title.text = "Diligent GTM Engineer Analysis Project"
+    subtitle.text = "Building a Data-Driven ICP Framework and Account Prioritization System\nDate: September 15, 2025"
 
-# Slide 5: Key Results and Next Steps
-slide = prs.slides.add_slide(prs.slide_layouts[1])
-shapes = slide.shapes
-title_shape = shapes.title
-body_shape = shapes.placeholders[1]
-title_shape.text = "Key Results and Next Steps"
-tf = body_shape.text_frame
-tf.text = "Results:"
-p = tf.add_paragraph()
-p.text = "• 20 Critical Accounts (90+ points) for immediate outreach"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Data quality improved from 80% to 95%+ completeness"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Clear prioritization framework for 1,000 prospects"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "Next Steps:"
-p.level = 0
-p = tf.add_paragraph()
-p.text = "• Import scored data into Salesforce"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Begin outreach to top 20 critical accounts"
-p.level = 1
-p = tf.add_paragraph()
-p.text = "• Build automated scoring pipeline"
-p.level = 1
+    # Slide 2: Project Overview
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Project Overview"
+    tf = body_shape.text_frame
+    tf.text = "Objectives:"
+    p = tf.add_paragraph()
+    p.text = "• Data Processing & Cleaning"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Pipeline/Script Development"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• ICP Definition & Prioritization"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Systems Integration Plan"
+    p.level = 1
 
-# Save the presentation
-prs.save('/Users/saipavankatineedi/Desktop/Diligent_project/deliverables/project_presentation.pptx')
+    # Slide 3: Data Cleaning Approach
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Data Cleaning Approach"
+    tf = body_shape.text_frame
+    tf.text = "Key Cleaning Tasks:"
+    p = tf.add_paragraph()
+    p.text = "• Employee Count Normalization: Standardized ranges and formats"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Revenue Standardization: Universal USD format"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Region Mapping: Consistent labels and expansions"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Date Normalization: YYYY-MM-DD format"
+    p.level = 1
+
+    # Slide 4: ICP Scoring Framework
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "ICP Scoring Framework"
+    tf = body_shape.text_frame
+    tf.text = "ICP Archetypes:"
+    p = tf.add_paragraph()
+    p.text = "• Enterprise Risk Management: Large companies focused on risk"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Mid-Market Compliance: Growing companies needing compliance"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Board Governance: Organizations managing board processes"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "Scoring: 0-100 points across firmographic, solution, intent, and tech dimensions"
+    p.level = 0
+
+    # Slide 5: Key Results and Next Steps
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Key Results and Next Steps"
+    tf = body_shape.text_frame
+    tf.text = "Results:"
+    p = tf.add_paragraph()
+    p.text = "• 20 Critical Accounts (90+ points) for immediate outreach"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Data quality improved from 80% to 95%+ completeness"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Clear prioritization framework for 1,000 prospects"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "Next Steps:"
+    p.level = 0
+    p = tf.add_paragraph()
+    p.text = "• Import scored data into Salesforce"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Begin outreach to top 20 critical accounts"
+    p.level = 1
+    p = tf.add_paragraph()
+    p.text = "• Build automated scoring pipeline"
+    p.level = 1
+
+    # Save the presentation
+    prs.save(output_path)
+    print(f"Presentation saved to: {output_path}")
+    return output_path
+
+
+if __name__ == "__main__":
+    generate_presentation()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Time-Decayed Intent Signal Store
+Author: GTM Engineer Candidate
+Date: September 2025
+
+An append-only SQLite log of intent events (account, timestamp, source,
+score) plus one exponentially decayed aggregate per account that is
+updated as events arrive. Reading an account's current intent is a single
+row lookup decayed to the read time, so scoring never re-aggregates the
+event history.
+"""
+
+import argparse
+import importlib
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+crm_export = importlib.import_module('crm_export')
+
+DEFAULT_STORE_PATH = 'data/intent_events.sqlite'
+DEFAULT_HALF_LIFE_DAYS = 30.0
+SECONDS_PER_DAY = 86_400.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intent_events (
+    account_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    source TEXT,
+    score REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS intent_aggregates (
+    account_id TEXT PRIMARY KEY,
+    decayed_sum REAL NOT NULL,
+    decayed_weight REAL NOT NULL,
+    last_ts REAL NOT NULL,
+    event_count INTEGER NOT NULL
+);
+"""
+
+
+def _to_epoch(timestamps):
+    """Datetimes/strings -> epoch seconds (float array)"""
+    ts = pd.to_datetime(pd.Series(timestamps), errors='coerce', format='mixed')
+    return (ts - pd.Timestamp('1970-01-01')).dt.total_seconds().to_numpy()
+
+
+class IntentStore:
+    """
+    Per account the aggregate keeps a decayed sum of scores and a decayed
+    event weight, both as of last_ts. The current intent is their ratio
+    decayed to the read time with the weight floored at 1, so it is the
+    recent average while an account is active and fades toward 0 when
+    the signals go quiet.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, half_life_days=DEFAULT_HALF_LIFE_DAYS):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.half_life_s = half_life_days * SECONDS_PER_DAY
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _decay(self, elapsed_s):
+        return np.power(0.5, np.asarray(elapsed_s, dtype=np.float64) / self.half_life_s)
+
+    def append_events(self, events):
+        """
+        Append events (DataFrame with account_id, timestamp, source, score)
+        and fold them into the aggregates in one transaction. Account IDs
+        are normalized like the CRM export ('1186826.0' -> '1186826').
+        """
+        events = pd.DataFrame({
+            'account_id': crm_export._normalize_ids(events['account_id']).to_numpy(),
+            'ts': _to_epoch(events['timestamp']),
+            'source': events['source'].to_numpy() if 'source' in events else None,
+            'score': pd.to_numeric(events['score'], errors='coerce').to_numpy()
+        }).dropna(subset=['ts', 'score']).sort_values('ts', kind='stable')
+        if events.empty:
+            return 0
+
+        accounts = events['account_id'].unique().tolist()
+        current = self._load_aggregates(accounts)
+
+        updates = {}
+        for account_id, ts, score in events[['account_id', 'ts', 'score']].itertuples(
+                index=False, name=None):
+            total, weight, last_ts, count = updates.get(
+                account_id, current.get(account_id, (0.0, 0.0, ts, 0)))
+            if ts >= last_ts:
+                factor = float(self._decay(ts - last_ts))
+                total, weight, last_ts = total * factor + score, weight * factor + 1.0, ts
+            else:
+                # Late event: decay it to the aggregate's timestamp instead
+                factor = float(self._decay(last_ts - ts))
+                total, weight = total + score * factor, weight + factor
+            updates[account_id] = (total, weight, last_ts, count + 1)
+
+        with self.conn:
+            self.conn.executemany(
+                'INSERT INTO intent_events (account_id, ts, source, score) VALUES (?, ?, ?, ?)',
+                events[['account_id', 'ts', 'source', 'score']].itertuples(index=False, name=None))
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO intent_aggregates VALUES (?, ?, ?, ?, ?)',
+                [(account_id,) + values for account_id, values in updates.items()])
+        return len(events)
+
+    def _load_aggregates(self, accounts):
+        current = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(accounts), 900):
+            batch = accounts[start:start + 900]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                'SELECT account_id, decayed_sum, decayed_weight, last_ts, event_count '
+                f'FROM intent_aggregates WHERE account_id IN ({placeholders})', batch)
+            current.update({row[0]: row[1:] for row in rows})
+        return current
+
+    def current_intent(self, now=None):
+        """Decayed intent (0-100) per account as of `now`, from the aggregates only"""
+        now_s = _to_epoch([now or datetime.now()])[0]
+        aggregates = pd.read_sql_query(
+            'SELECT account_id, decayed_sum, decayed_weight, last_ts, event_count '
+            'FROM intent_aggregates', self.conn, index_col='account_id')
+        factor = self._decay(np.maximum(now_s - aggregates['last_ts'].to_numpy(), 0))
+        weight = np.maximum(aggregates['decayed_weight'].to_numpy() * factor, 1.0)
+        return pd.Series(aggregates['decayed_sum'].to_numpy() * factor / weight,
+                         index=aggregates.index, name='Decayed_Intent')
+
+    def seed_from_snapshot(self, cleaned_df, id_column=crm_export.ID_COLUMN):
+        """Record each account's static Intent_Score_Clean as one 'snapshot' event"""
+        ids = crm_export._normalize_ids(cleaned_df[id_column].fillna(crm_export.MISSING_ID))
+        has_id = (ids != crm_export.MISSING_ID).to_numpy()
+        snapshot = cleaned_df[has_id]
+        return self.append_events(pd.DataFrame({
+            'account_id': ids[has_id],
+            'timestamp': snapshot['Last_Marketing_Touch_Clean'],
+            'source': 'snapshot',
+            'score': snapshot['Intent_Score_Clean']
+        }))
+
+
+def apply_decayed_intent(df, store, now=None, id_column=crm_export.ID_COLUMN):
+    """
+    Replace Intent_Score_Clean with the store's decayed value where the
+    account has events; other rows keep their snapshot value.
+    """
+    decayed = crm_export._normalize_ids(df[id_column]).map(store.current_intent(now))
+    df = df.copy()
+    df['Intent_Score_Clean'] = decayed.where(decayed.notna(), df['Intent_Score_Clean'])
+    return df
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Maintain the decayed intent store')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH)
+    parser.add_argument('--half-life-days', type=float, default=DEFAULT_HALF_LIFE_DAYS)
+    parser.add_argument('--seed', help='Cleaned dataset whose intent snapshot seeds the store')
+    parser.add_argument('--events', help='CSV of events: account_id, timestamp, source, score')
+    args = parser.parse_args()
+
+    print("GTM Engineer Intent Signal Store")
+    print("="*50)
+
+    store = IntentStore(args.store, args.half_life_days)
+    if args.seed:
+        seeded = store.seed_from_snapshot(pd.read_csv(
+            args.seed, dtype={crm_export.ID_COLUMN: str}))
+        print(f"Seeded {seeded} snapshot events from {args.seed}")
+    if args.events:
+        added = store.append_events(pd.read_csv(args.events, dtype={'account_id': str}))
+        print(f"Appended {added} events from {args.events}")
+
+    intent = store.current_intent()
+    print(f"\nAccounts with intent history: {len(intent)}")
+    if len(intent):
+        print(f"Mean decayed intent: {intent.mean():.1f}")
+        print("\nTOP 10 ACCOUNTS BY DECAYED INTENT:")
+        print(intent.nlargest(10).round(1).to_string())
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Capacity-Aware Lead Routing
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Assigns unowned accounts (Lead_Owner_Clean 'Unassigned' or a placeholder)
+to reps from a roster by region, ICP archetype and priority tier, within
+each rep's capacity. Critical accounts need a senior rep and High accounts
+at least an AE, per the Systems Integration Plan. Accounts are taken in
+priority order (tier, then score) and each goes to the least-loaded
+eligible rep via a priority queue per eligibility group. Existing owners
+and earlier routings count against capacity and are never reshuffled, so
+new leads can be routed incrementally. With buying groups (account
+hierarchy rollup), accounts are routed by their group's tier and score and
+siblings follow the group's owner while that rep is eligible for them and
+has capacity.
+"""
+
+import argparse
+import heapq
+import importlib
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_ROSTER_PATH = 'data/rep_roster.csv'
+DEFAULT_INPUT = 'deliverables/prioritized_accounts.csv'
+DEFAULT_OUTPUT = 'deliverables/routed_accounts.csv'
+
+UNASSIGNED_OWNERS = ['Unassigned', '—', '-', '']
+ANY = 'Any'
+
+SENIORITY_RANK = {'SDR': 0, 'AE': 1, 'Senior': 2}
+
+# Minimum rep seniority per priority tier
+TIER_MIN_SENIORITY = {'Critical': 'Senior', 'High': 'AE', 'Medium': 'SDR', 'Low': 'SDR'}
+TIER_ORDER = ['Critical', 'High', 'Medium', 'Low']
+
+# Eligibility rules tried in order; later rules relax the archetype match
+ROUTING_RULES = ['region_archetype_tier', 'region_tier']
+
+# Columns added by account_hierarchy.AccountHierarchy.attach_to_accounts()
+BUYING_GROUP_COLUMNS = ['Buying_Group', 'Buying_Group_Priority_Tier', 'Buying_Group_Max_Score']
+
+
+def load_roster(path=DEFAULT_ROSTER_PATH):
+    """Rep roster with ';'-separated Regions and Archetypes ('Any' = all)"""
+    roster = pd.read_csv(path)
+    for column in ['Regions', 'Archetypes']:
+        roster[column] = roster[column].fillna(ANY).str.split(';').apply(
+            lambda values: {value.strip() for value in values})
+    return roster
+
+
+class LeadRouter:
+    """Greedy least-loaded assignment of accounts to reps under capacity"""
+
+    def __init__(self, roster):
+        self.roster = roster.reset_index(drop=True)
+        self.reps = self.roster['Rep'].to_numpy(dtype=object)
+        self.rep_index = {rep: i for i, rep in enumerate(self.reps)}
+        self.capacity = self.roster['Capacity'].to_numpy(dtype=np.int64)
+        self.seniority = self.roster['Seniority'].map(SENIORITY_RANK).to_numpy()
+        self._eligibility = {}
+
+    def eligible_reps(self, region, archetype, tier, rule):
+        """Boolean mask over reps for one eligibility group (cached)"""
+        key = (region, archetype, tier, rule)
+        if key not in self._eligibility:
+            min_rank = SENIORITY_RANK[TIER_MIN_SENIORITY.get(tier, 'SDR')]
+            mask = self.seniority >= min_rank
+            mask &= self.roster['Regions'].apply(
+                lambda regions: ANY in regions or region in regions).to_numpy()
+            if rule == 'region_archetype_tier':
+                mask &= self.roster['Archetypes'].apply(
+                    lambda archetypes: ANY in archetypes or archetype in archetypes).to_numpy()
+            self._eligibility[key] = mask
+        return self._eligibility[key]
+
+    def current_owners(self, df):
+        """Existing owner per account: an earlier routing, else the CRM owner"""
+        owners = df['Lead_Owner_Clean'].astype(object).where(
+            ~df['Lead_Owner_Clean'].isin(UNASSIGNED_OWNERS) & df['Lead_Owner_Clean'].notna())
+        if 'Routed_Owner' in df.columns:
+            owners = df['Routed_Owner'].astype(object).where(
+                df['Routed_Owner'].notna(), owners)
+        return owners
+
+    def route(self, df, by_buying_group=False):
+        """
+        Return a copy of df with Routed_Owner and Routing_Rule columns.
+        Accounts that already have an owner keep it and count toward load.
+
+        With by_buying_group, df needs the BUYING_GROUP_COLUMNS: tier
+        eligibility and priority order come from the buying group, and an
+        account goes to its group's owner (an existing owner of a sibling,
+        else the rep its highest-priority account was routed to) when that
+        rep passes a routing rule for the account and has capacity.
+        """
+        routed = df.copy()
+        owners = self.current_owners(routed)
+        if by_buying_group:
+            missing = [c for c in BUYING_GROUP_COLUMNS if c not in routed.columns]
+            if missing:
+                raise ValueError(f"Buying-group routing needs {missing} "
+                                 "(see account_hierarchy.attach_to_accounts)")
+            tiers = routed['Buying_Group_Priority_Tier'].astype(str)
+            scores = routed['Buying_Group_Max_Score'].to_numpy()
+            groups = routed['Buying_Group'].astype(str)
+        else:
+            tiers = routed['Priority_Tier'].astype(str)
+            scores = routed['Total_ICP_Score'].to_numpy()
+            groups = None
+
+        load = np.zeros(len(self.reps), dtype=np.int64)
+        known = owners.map(self.rep_index).dropna().astype(np.int64).to_numpy()
+        np.add.at(load, known, 1)
+
+        todo = np.flatnonzero(owners.isna().to_numpy())
+
+        # Highest tier first, then highest score: one sort for the whole run.
+        # Buying groups stay contiguous, best account first
+        tier_rank = tiers.map(
+            {tier: rank for rank, tier in enumerate(TIER_ORDER)}).fillna(len(TIER_ORDER))
+        sort_keys = [-routed['Total_ICP_Score'].to_numpy()[todo]]
+        if groups is not None:
+            sort_keys.append(pd.factorize(groups)[0][todo])
+        sort_keys += [-scores[todo], tier_rank.to_numpy()[todo]]
+        todo = todo[np.lexsort(sort_keys)]
+
+        # Each buying group's owner: the owner of its best already-owned
+        # account, else whichever rep gets its first routed account
+        group_owner = {}
+        if groups is not None:
+            owned = owners.notna().to_numpy() & owners.map(self.rep_index).notna().to_numpy()
+            by_score = np.flatnonzero(owned)[
+                np.argsort(-routed['Total_ICP_Score'].to_numpy()[owned], kind='stable')]
+            for position in by_score:
+                group_owner.setdefault(groups.iat[position], self.rep_index[owners.iat[position]])
+
+        # One priority queue of (load ratio, rep) per eligibility group
+        group_keys = list(zip(routed['Region_Clean'].astype(str).to_numpy()[todo],
+                              routed['ICP_Archetype'].astype(str).to_numpy()[todo],
+                              tiers.to_numpy()[todo]))
+        heaps = {}
+
+        def next_rep(key, rule):
+            heap_key = key + (rule,)
+            if heap_key not in heaps:
+                mask = self.eligible_reps(*key, rule)
+                heaps[heap_key] = [(load[i] / self.capacity[i], i)
+                                   for i in np.flatnonzero(mask)]
+                heapq.heapify(heaps[heap_key])
+            heap = heaps[heap_key]
+            while heap:
+                ratio, i = heap[0]
+                if load[i] >= self.capacity[i]:
+                    heapq.heappop(heap)
+                elif ratio != load[i] / self.capacity[i]:
+                    # Stale entry: the rep took accounts from another group
+                    heapq.heapreplace(heap, (load[i] / self.capacity[i], i))
+                else:
+                    return i, heap
+            return None, heap
+
+        assigned = np.full(len(routed), None, dtype=object)
+        assigned[owners.notna().to_numpy()] = owners.dropna().to_numpy()
+        rule_values = np.full(len(routed), 'existing_owner', dtype=object)
+
+        for position, key in zip(todo, group_keys):
+            rule_values[position] = 'unrouted'
+            group = groups.iat[position] if groups is not None else None
+            i = group_owner.get(group)
+            if (i is not None and load[i] < self.capacity[i]
+                    and any(self.eligible_reps(*key, rule)[i] for rule in ROUTING_RULES)):
+                load[i] += 1
+                assigned[position] = self.reps[i]
+                rule_values[position] = 'buying_group'
+                continue
+            for rule in ROUTING_RULES:
+                i, heap = next_rep(key, rule)
+                if i is not None:
+                    load[i] += 1
+                    heapq.heapreplace(heap, (load[i] / self.capacity[i], i))
+                    assigned[position] = self.reps[i]
+                    rule_values[position] = rule
+                    if group is not None:
+                        group_owner.setdefault(group, i)
+                    break
+
+        routed['Routed_Owner'] = assigned
+        routed['Routing_Rule'] = rule_values
+        self.load = pd.Series(load, index=self.reps)
+        return routed
+
+    def capacity_report(self):
+        """Load against capacity per rep after the last route() call"""
+        report = self.roster[['Rep', 'Seniority', 'Capacity']].copy()
+        report['Load'] = self.load.to_numpy()
+        report['Utilization'] = (report['Load'] / report['Capacity']) * 100
+        return report
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Route unassigned accounts to reps')
+    parser.add_argument('--input', default=DEFAULT_INPUT,
+                        help='Scored accounts (earlier Routed_Owner values are kept)')
+    parser.add_argument('--roster', default=DEFAULT_ROSTER_PATH)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--by-buying-group', action='store_true',
+                        help='Route parent/child accounts together by their buying '
+                             'group (see account_hierarchy.py)')
+    args = parser.parse_args()
+
+    print("GTM Engineer Lead Routing")
+    print("="*50)
+
+    accounts = pd.read_csv(args.input)
+    if args.by_buying_group and 'Buying_Group' not in accounts.columns:
+        hierarchy = importlib.import_module('account_hierarchy')
+        accounts = hierarchy.AccountHierarchy(accounts).attach_to_accounts()
+
+    router = LeadRouter(load_roster(args.roster))
+    routed = router.route(accounts, by_buying_group=args.by_buying_group)
+
+    print("\nROUTING RESULTS:")
+    for rule, count in routed['Routing_Rule'].value_counts().items():
+        print(f"{rule}: {count} accounts")
+
+    print("\nREP CAPACITY:")
+    print(router.capacity_report().to_string(index=False, float_format='%.1f'))
+
+    routed.to_csv(args.output, index=False)
+    print(f"\nRouted accounts saved to: {args.output}")
+    return routed
+
+
+if __name__ == "__main__":
+    main()
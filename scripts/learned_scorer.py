@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Learned Win-Probability Scorer
+Author: GTM Engineer Candidate
+Date: September 2025
+
+An optional model-based score next to the rule-based Total_ICP_Score. A
+logistic regression is trained offline on Won/Lost outcomes, using the
+same features the rules read: the one-hot scoring rule codes of every
+factor in SCORING_RULES. Training runs on the backtest's rule-code
+profiles (weighted Newton steps in numpy), so millions of historical
+leads cost a few thousand rows. The model is one coefficient per rule
+slot plus an intercept, saved as a small npz; inference is a gather-and-sum
+over the codes calculate_total_icp_score already computes.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+backtest = importlib.import_module('backtest')
+
+DEFAULT_MODEL_PATH = 'analysis/learned_scorer.npz'
+DEFAULT_BATCH_SIZE = 1_000_000
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class LogisticScorer:
+    """Logistic regression over one-hot rule codes"""
+
+    def __init__(self, coef, intercept, metadata=None):
+        self.coef = np.asarray(coef, dtype=np.float32)
+        self.intercept = np.float32(intercept)
+        self.metadata = metadata or {}
+        self.offsets = backtest._slot_offsets()
+        if len(self.coef) != self.offsets[-1]:
+            raise ValueError("Model does not match the current scoring rule slots")
+
+    @classmethod
+    def fit(cls, features, l2=1.0, max_iter=50, tol=1e-8):
+        """
+        Fit on backtest.BacktestFeatures by Newton's method. Each profile
+        contributes its Won count as positives and Lost count as negatives;
+        the coefficients (not the intercept) get an L2 penalty.
+        """
+        X = np.column_stack([np.ones(len(features.profile_codes)), features.one_hot()])
+        won = features.won.astype(np.float64)
+        total = won + features.lost
+        penalty = np.full(X.shape[1], float(l2))
+        penalty[0] = 0.0
+
+        w = np.zeros(X.shape[1])
+        w[0] = np.log(max(won.sum(), 1) / max(total.sum() - won.sum(), 1))
+        for iteration in range(max_iter):
+            p = _sigmoid(X @ w)
+            gradient = X.T @ (total * p - won) + penalty * w
+            hessian = (X * (total * p * (1 - p))[:, None]).T @ X + np.diag(penalty)
+            step = np.linalg.solve(hessian + 1e-9 * np.eye(len(w)), gradient)
+            w -= step
+            if np.abs(step).max() < tol:
+                break
+
+        metadata = {
+            'trained_at': datetime.now().isoformat(timespec='seconds'),
+            'accounts': features.n_accounts,
+            'profiles': len(features.profile_codes),
+            'l2': l2,
+            'iterations': iteration + 1,
+            'factors': backtest.FACTORS
+        }
+        return cls(w[1:], w[0], metadata)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        with np.load(path) as artifact:
+            metadata = json.loads(str(artifact['metadata']))
+            if metadata.get('factors') != backtest.FACTORS:
+                raise ValueError(f"{path} was trained on different scoring factors")
+            return cls(artifact['coef'], artifact['intercept'], metadata)
+
+    def save(self, path=DEFAULT_MODEL_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(tmp_path, coef=self.coef, intercept=self.intercept,
+                            metadata=np.array(json.dumps(self.metadata)))
+        os.replace(tmp_path, path)
+
+    def decision_function(self, codes, batch_size=DEFAULT_BATCH_SIZE):
+        """Log-odds for {factor: uint8 rule codes}, computed in row batches"""
+        n_rows = len(codes[backtest.FACTORS[0]])
+        logits = np.empty(n_rows, dtype=np.float32)
+        for start in range(0, n_rows, batch_size):
+            stop = min(start + batch_size, n_rows)
+            batch = np.full(stop - start, self.intercept, dtype=np.float32)
+            for i, factor in enumerate(backtest.FACTORS):
+                batch += self.coef[self.offsets[i] + codes[factor][start:stop]]
+            logits[start:stop] = batch
+        return logits
+
+    def predict_proba(self, codes, batch_size=DEFAULT_BATCH_SIZE):
+        """Win probability per row"""
+        return _sigmoid(self.decision_function(codes, batch_size))
+
+    def score(self, codes, batch_size=DEFAULT_BATCH_SIZE):
+        """(win probability, 0-100 Model_ICP_Score) per row"""
+        probability = self.predict_proba(codes, batch_size)
+        return probability, np.rint(probability * 100).astype(np.int64)
+
+    def explain(self, top=5):
+        """Rule slots with the largest positive and negative coefficients"""
+        labels = [f"{factor}: {label}" for factor in backtest.FACTORS
+                  for label in scoring.ICPScorer._rule_labels(factor)]
+        weights = pd.Series(self.coef, index=labels).sort_values()
+        return weights.tail(top)[::-1], weights.head(top)
+
+
+def train_and_evaluate(df, holdout=0.2, l2=1.0, seed=42, now=None):
+    """
+    Train on a random split of the labeled accounts and compare holdout AUC
+    with the rule-based score. Returns (model trained on all rows, metrics).
+    """
+    rng = np.random.default_rng(seed)
+    test = rng.random(len(df)) < holdout
+    train_features = backtest.BacktestFeatures.from_frame(df[~test], now=now)
+    test_features = backtest.BacktestFeatures.from_frame(df[test], now=now)
+
+    model = LogisticScorer.fit(train_features, l2=l2)
+    test_logits = model.decision_function(
+        {factor: test_features.profile_codes[:, i] for i, factor in enumerate(backtest.FACTORS)})
+    rule_scores = test_features.scores(backtest.baseline_weights()[:, None])
+    metrics = {
+        'holdout_accounts': test_features.n_accounts,
+        'holdout_auc_model': float(backtest.auc(
+            test_logits[:, None].astype(np.float64), test_features.won, test_features.lost)[0]),
+        'holdout_auc_rules': float(backtest.auc(
+            rule_scores, test_features.won, test_features.lost)[0])
+    }
+
+    model = LogisticScorer.fit(backtest.BacktestFeatures.from_frame(df, now=now), l2=l2)
+    model.metadata.update(metrics)
+    return model, metrics
+
+
+def benchmark_inference(model, n_rows=1_000_000, seed=42):
+    """
+    Seconds per million rows for the rule engine (score_components) and for
+    model inference on the same rule codes, on synthetic cleaned leads.
+    """
+    benchmark_pipeline = importlib.import_module('benchmark_pipeline')
+    cleaning = importlib.import_module('02_data_cleaning')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner = cleaning.DiligentDataCleaner(None)
+        cleaner.load_data(benchmark_pipeline.generate_synthetic_leads(n_rows, seed))
+        cleaned_df = cleaner.clean_data()
+
+    scorer = scoring.ICPScorer(cleaned_df.iloc[:0])
+    start = time.perf_counter()
+    _, codes = scorer.score_components(cleaned_df, token_matrices=cleaner.token_matrices)
+    rules_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.score(codes)
+    model_s = time.perf_counter() - start
+
+    per_million = 1_000_000 / len(cleaned_df)
+    return {'rows': len(cleaned_df),
+            'rule_engine_s_per_million': round(rules_s * per_million, 3),
+            'model_inference_s_per_million': round(model_s * per_million, 3)}
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Train and benchmark the learned scorer')
+    parser.add_argument('--input', default='data/cleaned_diligent_dataset.csv')
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH)
+    parser.add_argument('--l2', type=float, default=1.0, help='L2 penalty on the coefficients')
+    parser.add_argument('--holdout', type=float, default=0.2)
+    parser.add_argument('--as-of', help='Scoring date for the recency rule (default: now)')
+    parser.add_argument('--fx-as-of',
+                        help='Re-convert revenue with the FX rates as of this date')
+    parser.add_argument('--benchmark-rows', type=int,
+                        help='Also time inference against the rule engine on N synthetic rows')
+    args = parser.parse_args()
+
+    print("GTM Engineer Learned Scorer")
+    print("="*50)
+
+    now = datetime.fromisoformat(args.as_of) if args.as_of else None
+    df = backtest.cleaning.with_numeric_firmographics(pd.read_csv(args.input), args.fx_as_of)
+    model, metrics = train_and_evaluate(df, args.holdout, args.l2, now=now)
+    model.save(args.model)
+
+    print(f"Trained on {model.metadata['accounts']} labeled accounts "
+          f"({model.metadata['profiles']} profiles, {model.metadata['iterations']} iterations)")
+    print(f"Holdout AUC ({metrics['holdout_accounts']} accounts): "
+          f"model {metrics['holdout_auc_model']:.3f} vs rules {metrics['holdout_auc_rules']:.3f}")
+    positive, negative = model.explain()
+    print("\nSTRONGEST WIN SIGNALS:")
+    print(positive.round(3).to_string())
+    print("\nSTRONGEST LOSS SIGNALS:")
+    print(negative.round(3).to_string())
+    print(f"\nModel saved to: {args.model}")
+
+    if args.benchmark_rows:
+        result = benchmark_inference(model, args.benchmark_rows)
+        print(f"\nINFERENCE BENCHMARK ({result['rows']:,} rows):")
+        print(f"Rule engine:     {result['rule_engine_s_per_million']:.3f}s per million rows")
+        print(f"Model inference: {result['model_inference_s_per_million']:.3f}s per million rows "
+              "(on the rule codes)")
+    return model
+
+
+if __name__ == "__main__":
+    main()
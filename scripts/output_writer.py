@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Bulk Output Writer
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Writes the scored deliverables from one ranking pass: the score order is
+computed once and every output (the full dataset, the top-N list) is a
+slice of it, written in chunks to CSV (optionally gzip-compressed),
+Parquet or JSON Lines. Each file is written to a temporary name in the
+target directory and renamed into place, so readers only ever see the
+previous complete file or the new complete file.
+"""
+
+import argparse
+import gzip
+import os
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temp path next to `path`; rename it over `path` on success"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f'.{os.path.basename(path)}.tmp-{os.getpid()}')
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def output_format(path):
+    """Sink format from the file extension"""
+    name = path.lower()
+    if name.endswith(('.csv', '.csv.gz')):
+        return 'csv'
+    if name.endswith(('.jsonl', '.jsonl.gz')):
+        return 'jsonl'
+    if name.endswith('.parquet'):
+        return 'parquet'
+    raise ValueError(f"Unsupported output format: {path}")
+
+
+def _open_text(path, final_path):
+    if final_path.lower().endswith('.gz'):
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def _chunks(df, chunksize):
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def _write_csv(df, tmp_path, path, chunksize):
+    with _open_text(tmp_path, path) as f:
+        if df.empty:
+            df.to_csv(f, index=False)
+        for i, chunk in enumerate(_chunks(df, chunksize)):
+            chunk.to_csv(f, index=False, header=(i == 0))
+
+
+def _write_jsonl(df, tmp_path, path, chunksize):
+    with _open_text(tmp_path, path) as f:
+        for chunk in _chunks(df, chunksize):
+            text = chunk.to_json(orient='records', lines=True, date_format='iso')
+            f.write(text if text.endswith('\n') else text + '\n')
+
+
+def _write_parquet(df, tmp_path, path, chunksize):
+    # Optional dependency, only needed when a .parquet output is requested
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(tmp_path, schema, compression='snappy') as writer:
+        for chunk in _chunks(df, chunksize):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema,
+                                                    preserve_index=False))
+
+
+WRITERS = {'csv': _write_csv, 'jsonl': _write_jsonl, 'parquet': _write_parquet}
+
+
+def write_frame(df, path, chunksize=DEFAULT_CHUNKSIZE):
+    """Write df to path in chunks and publish it atomically"""
+    with atomic_path(path) as tmp_path:
+        WRITERS[output_format(path)](df, tmp_path, path, chunksize)
+    return path
+
+
+def score_order(scored_df, column='Total_ICP_Score'):
+    """Row positions by descending score, ties in original order (like nlargest)"""
+    return np.argsort(-scored_df[column].to_numpy(dtype=np.float64), kind='stable')
+
+
+def write_deliverables(scored_df, outputs, chunksize=DEFAULT_CHUNKSIZE, order=None):
+    """
+    Write several outputs from one ranking pass. `outputs` maps a path to
+    None (the full dataset, in its original row order) or N (the top N
+    rows by Total_ICP_Score). Pass `order` to reuse an existing ranking.
+    """
+    written = []
+    for path, top_n in outputs.items():
+        if top_n is None:
+            frame = scored_df
+        else:
+            order = score_order(scored_df) if order is None else order
+            frame = scored_df.take(order[:top_n])
+        written.append(write_frame(frame, path, chunksize))
+    return written
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Write scored deliverables in bulk formats')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--output', nargs='+', required=True,
+                        help='Output paths (.csv, .csv.gz, .jsonl, .jsonl.gz, .parquet)')
+    parser.add_argument('--top', type=int, help='Only write the top N accounts by score')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    print("GTM Engineer Output Writer")
+    print("="*50)
+
+    scored_df = pd.read_csv(args.input)
+    for path in write_deliverables(scored_df, {path: args.top for path in args.output},
+                                   args.chunksize):
+        print(f"Saved: {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Pipeline Stage Profiler
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Records wall time, CPU time, rows per second and memory for each pipeline
+stage (cleaning steps, scoring components, validation) and writes a
+machine-readable JSON run report. Stage memory is the RSS change over the
+stage and, with allocation tracking on, the stage's own peak of Python
+allocations (tracemalloc, peak reset per stage); the process-wide peak RSS
+is reported once for the run. Optionally captures a cProfile or
+pyinstrument profile of the whole run.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def current_rss_mb():
+    """
+    Current resident set size of this process in MB. Without /proc (e.g.
+    macOS) this falls back to getrusage's peak RSS, so stage deltas then
+    show growth of the peak rather than of the current RSS.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+    return round(pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+
+
+class StageProfiler:
+    """
+    Collects per-stage timings. Stages can be nested; nested stage names
+    are recorded as 'parent/child'.
+
+    With track_allocations, tracemalloc runs for the profiler's lifetime
+    and each stage records peak_alloc_mb, the most traced memory above
+    the stage's starting point (including its nested stages). Tracing
+    slows allocation-heavy code, so it is off by default.
+    """
+
+    def __init__(self, run_name='pipeline', capture=None, track_allocations=False):
+        self.run_name = run_name
+        self.capture = capture
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.stages = []
+        self._stack = []
+        self._alloc_stack = []  # [traced bytes at start, running peak] per open stage
+        self._profiler = None
+        self._started_at = datetime.now()
+        self._run_start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """Time a block of work; `rows` is used for throughput"""
+        self._stack.append(name)
+        full_name = '/'.join(self._stack)
+        self._start_allocations()
+        rss_start = current_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            rss_end = current_rss_mb()
+            peak_alloc = self._end_allocations()
+            self._stack.pop()
+            self.stages.append({
+                'stage': full_name,
+                'wall_s': round(wall, 6),
+                'cpu_s': round(cpu, 6),
+                'rows': rows,
+                'rows_per_s': round(rows / wall, 1) if rows and wall > 0 else None,
+                'rss_start_mb': rss_start,
+                'rss_delta_mb': (round(rss_end - rss_start, 1)
+                                 if rss_start is not None and rss_end is not None else None),
+                'peak_alloc_mb': peak_alloc
+            })
+
+    def _start_allocations(self):
+        """Fold the peak so far into the open stages, then reset it for this one"""
+        if not self.track_allocations:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._alloc_stack:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        self._alloc_stack.append([current, current])
+
+    def _end_allocations(self):
+        """Peak traced MB above the stage's start; passed on to the parent stage"""
+        if not self.track_allocations:
+            return None
+        start, running_peak = self._alloc_stack.pop()
+        peak = max(running_peak, tracemalloc.get_traced_memory()[1])
+        if self._alloc_stack:
+            self._alloc_stack[-1][1] = max(self._alloc_stack[-1][1], peak)
+        return round((peak - start) / (1024 * 1024), 1)
+
+    def start_capture(self):
+        """Start the optional cProfile/pyinstrument capture"""
+        if self.capture == 'cprofile':
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.capture == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("pyinstrument is not installed - skipping capture")
+                self.capture = None
+                return
+            self._profiler = Profiler()
+            self._profiler.start()
+
+    def stop_capture(self, output_dir):
+        """Stop the capture and write it next to the run report"""
+        if self._profiler is None:
+            return None
+
+        if self.capture == 'cprofile':
+            self._profiler.disable()
+            capture_path = os.path.join(output_dir, f'{self.run_name}_profile.prof')
+            self._profiler.dump_stats(capture_path)
+        else:
+            self._profiler.stop()
+            capture_path = os.path.join(output_dir, f'{self.run_name}_profile.html')
+            with open(capture_path, 'w') as f:
+                f.write(self._profiler.output_html())
+
+        self._profiler = None
+        return capture_path
+
+    def get_report(self):
+        """Return the run report as a dict"""
+        return {
+            'run_name': self.run_name,
+            'started_at': self._started_at.isoformat(timespec='seconds'),
+            'total_wall_s': round(time.perf_counter() - self._run_start, 6),
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': self.stages
+        }
+
+    def write_report(self, output_path):
+        """Write the JSON run report"""
+        report = self.get_report()
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def print_summary(self):
+        """Print a human-readable timing table"""
+        print("\n" + "="*60)
+        print("PIPELINE TIMING REPORT")
+        print("="*60)
+        print(f"{'Stage':<40} {'Wall (s)':>9} {'CPU (s)':>9} {'Rows/s':>12} "
+              f"{'RSS +MB':>8} {'Peak MB':>8}")
+        if not self.track_allocations:
+            print("(Peak MB is opt-in: run with --track-allocations to trace "
+                  "per-stage allocation peaks)")
+        for stage in self.stages:
+            rows_per_s = (f"{stage['rows_per_s']:,.0f}"
+                          if stage['rows_per_s'] is not None else '-')
+            rss_delta = (f"{stage['rss_delta_mb']:+.1f}"
+                         if stage['rss_delta_mb'] is not None else '-')
+            peak_alloc = (f"{stage['peak_alloc_mb']:.1f}"
+                          if stage['peak_alloc_mb'] is not None else '-')
+            print(f"{stage['stage']:<40} {stage['wall_s']:>9.3f} "
+                  f"{stage['cpu_s']:>9.3f} {rows_per_s:>12} {rss_delta:>8} {peak_alloc:>8}")
+        print(f"Peak RSS: {peak_rss_mb()} MB")
+
+
+def profile_pipeline(capture=None, report_path='analysis/pipeline_run_report.json',
+                     with_visuals=False, with_exploration=False, track_allocations=False):
+    """Run cleaning, scoring and validation under the stage profiler"""
+    exploration = importlib.import_module('01_data_exploration')
+    cleaning = importlib.import_module('02_data_cleaning')
+    scoring = importlib.import_module('03_icp_scoring')
+    validation = importlib.import_module('04_validation')
+
+    profiler = StageProfiler(run_name='pipeline', capture=capture,
+                             track_allocations=track_allocations)
+    profiler.start_capture()
+
+    if with_exploration:
+        with profiler.stage('exploration'):
+            with profiler.stage('load_and_explore'):
+                raw_df, _ = exploration.load_and_explore_data()
+            if raw_df is not None:
+                with profiler.stage('key_fields', rows=len(raw_df)):
+                    exploration.analyze_key_fields(raw_df)
+
+    with profiler.stage('cleaning'):
+        cleaner = cleaning.DiligentDataCleaner(
+            'data/Diligent_GTM_Engineer_Exercise_with_Instructions.xlsx',
+            profiler=profiler)
+        with profiler.stage('load'):
+            cleaner.load_data()
+        cleaner.clean_data()
+        with profiler.stage('report', rows=len(cleaner.cleaned_df)):
+            cleaner.generate_cleaning_report()
+
+    with profiler.stage('scoring'):
+        with profiler.stage('load'):
+            scorer = scoring.ICPScorer(
+                'data/cleaned_diligent_dataset.csv', profiler=profiler)
+        scorer.calculate_total_icp_score()
+        with profiler.stage('report', rows=len(scorer.scored_df)):
+            scorer.generate_prioritization_report()
+        if with_visuals:
+            with profiler.stage('visualization', rows=len(scorer.scored_df)):
+                scorer.create_scoring_visualization()
+
+    with profiler.stage('validation'):
+        validation.validate_deliverables()
+
+    output_dir = os.path.dirname(report_path) or '.'
+    capture_path = profiler.stop_capture(output_dir)
+
+    profiler.print_summary()
+    profiler.write_report(report_path)
+    print(f"\nRun report saved to: {report_path}")
+    if capture_path:
+        print(f"Profile capture saved to: {capture_path}")
+
+    return profiler
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Profile the GTM pipeline')
+    parser.add_argument('--capture', choices=['cprofile', 'pyinstrument'],
+                        help='Also capture a full profile of the run')
+    parser.add_argument('--report', default='analysis/pipeline_run_report.json',
+                        help='Path of the JSON run report')
+    parser.add_argument('--with-visuals', action='store_true',
+                        help='Include dashboard rendering in the run')
+    parser.add_argument('--with-exploration', action='store_true',
+                        help='Include the exploration script in the run')
+    parser.add_argument('--track-allocations', action='store_true',
+                        help='Record each stage\'s peak Python allocations (tracemalloc; slower)')
+    args = parser.parse_args()
+
+    print("GTM Engineer Pipeline Profiler")
+    print("="*50)
+    return profile_pipeline(args.capture, args.report, args.with_visuals,
+                            args.with_exploration, args.track_allocations)
+
+
+if __name__ == "__main__":
+    main()
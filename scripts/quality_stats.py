@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Incremental Data Quality Statistics
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Builds mergeable per-column quality statistics (counts, unknown counts,
+HyperLogLog and top-K sketches, fixed-bin histograms) per chunk or
+partition, persists one summary per run and flags drift against earlier
+runs - e.g. a spike in the Employee_Count_Clean Unknown rate - without
+rescanning old loads.
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+streaming = importlib.import_module('streaming_profiler')
+
+DEFAULT_HISTORY_DIR = 'analysis/quality_history'
+
+# Fixed bin edges keep histograms mergeable across runs
+HISTOGRAM_BINS = {
+    'Intent_Score_Clean': list(range(0, 101, 10)),
+    'Total_ICP_Score': list(range(0, 101, 10)),
+}
+
+# Columns whose unknown rate is watched for drift
+DRIFT_WATCH_COLUMNS = ['Employee_Count_Clean', 'Revenue_Clean', 'Region_Clean',
+                       'Intent_Score_Clean', 'Lead_Owner_Clean']
+
+
+def compute_stats(df, chunksize=100_000):
+    """Quality statistics for a DataFrame, accumulated chunk by chunk"""
+    stats = streaming.StreamingProfiler(histogram_bins=HISTOGRAM_BINS)
+    for start in range(0, len(df), chunksize):
+        stats.update(df.iloc[start:start + chunksize])
+    return stats
+
+
+def compute_stats_csv(path, chunksize=100_000):
+    """Quality statistics for a CSV file without loading it whole"""
+    stats = streaming.StreamingProfiler(histogram_bins=HISTOGRAM_BINS)
+    return stats.profile_csv(path, chunksize=chunksize)
+
+
+def merge_stats(partitions):
+    """Combine statistics computed over separate partitions"""
+    combined = streaming.StreamingProfiler(histogram_bins=HISTOGRAM_BINS)
+    for stats in partitions:
+        combined.merge(stats)
+    return combined
+
+
+def summarize(stats):
+    """Per-column rates used for reporting and drift checks"""
+    rows = []
+    for name, column in stats.columns.items():
+        rows.append({
+            'Column': name,
+            'Rows': column.rows,
+            'Missing_Count': column.missing,
+            'Unknown_Count': column.unknown,
+            'Unknown_Rate': (column.unknown / column.rows) * 100 if column.rows else 0.0,
+            'Unique_Values': column.distinct.count()
+        })
+    return pd.DataFrame(rows)
+
+
+class QualityHistory:
+    """One persisted statistics file per run, with drift checks against them"""
+
+    def __init__(self, history_dir=DEFAULT_HISTORY_DIR):
+        self.history_dir = history_dir
+
+    def save_run(self, stats, run_id=None, source=None):
+        """Persist a run's statistics and return the file path"""
+        os.makedirs(self.history_dir, exist_ok=True)
+        run_id = run_id or datetime.now().strftime('%Y%m%dT%H%M%S')
+        record = {
+            'run_id': run_id,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'source': source,
+            'stats': stats.to_dict()
+        }
+        path = os.path.join(self.history_dir, f'quality_stats_{run_id}.json')
+        with open(path, 'w') as f:
+            json.dump(record, f)
+        return path
+
+    def load_runs(self, limit=None):
+        """Previously saved runs, oldest first, as (record, stats) pairs"""
+        paths = sorted(glob.glob(os.path.join(self.history_dir, 'quality_stats_*.json')))
+        if limit:
+            paths = paths[-limit:]
+
+        runs = []
+        for path in paths:
+            with open(path) as f:
+                record = json.load(f)
+            runs.append((record, streaming.StreamingProfiler.from_dict(record['stats'])))
+        return runs
+
+    def combine(self, limit=None):
+        """Merge the saved runs, e.g. a week of daily loads, without rescanning"""
+        return merge_stats(stats for _, stats in self.load_runs(limit))
+
+    def rate_history(self, column, limit=None):
+        """Unknown rate of a column across saved runs"""
+        rows = []
+        for record, stats in self.load_runs(limit):
+            if column in stats.columns:
+                profile = stats.columns[column]
+                rows.append({'run_id': record['run_id'],
+                             'Unknown_Rate': (profile.unknown / profile.rows) * 100})
+        return pd.DataFrame(rows, columns=['run_id', 'Unknown_Rate'])
+
+    def check_drift(self, stats, columns=None, window=7, min_increase=5.0, z_score=3.0):
+        """
+        Compare the current unknown rates with the trailing `window` runs.
+        A column alerts when its rate rises by at least `min_increase`
+        percentage points and by more than `z_score` standard deviations.
+        """
+        columns = columns or DRIFT_WATCH_COLUMNS
+        current = summarize(stats).set_index('Column')
+        alerts = []
+
+        for column in columns:
+            if column not in current.index:
+                continue
+            history = self.rate_history(column, limit=window)['Unknown_Rate']
+            if history.empty:
+                continue
+
+            baseline = history.mean()
+            spread = history.std(ddof=0) if len(history) > 1 else 0.0
+            rate = current.loc[column, 'Unknown_Rate']
+            increase = rate - baseline
+
+            if increase >= min_increase and increase > z_score * spread:
+                alerts.append({
+                    'column': column,
+                    'unknown_rate': round(float(rate), 2),
+                    'baseline_rate': round(float(baseline), 2),
+                    'increase': round(float(increase), 2)
+                })
+
+        return alerts
+
+
+def print_alerts(alerts):
+    """Print drift alerts in the QA report style"""
+    if alerts:
+        print("\n⚠️  Data Quality Drift Detected:")
+        for alert in alerts:
+            print(f"   - {alert['column']}: {alert['unknown_rate']:.1f}% unknown "
+                  f"(baseline {alert['baseline_rate']:.1f}%, "
+                  f"+{alert['increase']:.1f} pts)")
+    else:
+        print("\n✅ No data quality drift detected")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Persist quality statistics and check drift')
+    parser.add_argument('--input', default='data/cleaned_diligent_dataset.csv')
+    parser.add_argument('--history-dir', default=DEFAULT_HISTORY_DIR)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--no-save', action='store_true',
+                        help='Check drift without recording this run')
+    parser.add_argument('--fail-on-drift', action='store_true',
+                        help='Exit non-zero when a drift alert fires')
+    args = parser.parse_args()
+
+    print("GTM Engineer Data Quality Statistics")
+    print("="*50)
+
+    stats = compute_stats_csv(args.input, args.chunksize)
+    print(summarize(stats).to_string(index=False))
+
+    history = QualityHistory(args.history_dir)
+    alerts = history.check_drift(stats)
+    print_alerts(alerts)
+
+    if not args.no_save:
+        path = history.save_run(stats, source=args.input)
+        print(f"\nQuality statistics saved to: {path}")
+
+    if alerts and args.fail_on_drift:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
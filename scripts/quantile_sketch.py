@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Streaming Quantile Sketch for Priority Tiers
+Author: GTM Engineer Candidate
+Date: September 2025
+
+A KLL quantile sketch over Total_ICP_Score. Chunks or worker partitions
+each update (or build and merge) a sketch, so percentile tier thresholds
+- e.g. the top 2% are Critical - come from bounded memory without sorting
+the full dataset. The sketch is persisted to JSON and carried forward so
+daily runs keep their thresholds stable.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SKETCH_PATH = 'analysis/icp_score_sketch.json'
+
+# Share of accounts in each tier, from the top down; the rest are Low
+QUANTILE_TIER_SHARES = [('Critical', 0.02), ('High', 0.10), ('Medium', 0.30)]
+
+
+class KLLSketch:
+    """
+    KLL sketch: a stack of compactors where level h items weigh 2**h.
+    A full level is sorted and every other item (random offset) is
+    promoted, keeping roughly k items per level near the top.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _size(self):
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _compress(self):
+        # Compact the lowest over-full level until the sketch fits again
+        while self._size() >= self._max_size():
+            level = next(h for h, items in enumerate(self.levels)
+                         if len(items) >= self._capacity(h))
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            items = np.sort(self.levels[level])
+            # An odd leftover stays at this level so weight is conserved
+            keep = items[:len(items) % 2]
+            pairs = items[len(items) % 2:]
+            promoted = pairs[self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+    def update(self, values):
+        """Add an array of values (NaNs are ignored)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        # Feed in slices so level 0 never holds more than a few k items
+        for start in range(0, len(values), self.k):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + self.k]])
+            self._compress()
+        self.count += len(values)
+        return self
+
+    def merge(self, other):
+        """Fold another sketch (e.g. from a parallel worker) into this one"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Approximate value at quantile(s) q in [0, 1]"""
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        weights = np.concatenate([np.full(len(items), 2.0 ** level)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(q, dtype=np.float64) * cumulative[-1]
+        pos = np.minimum(np.searchsorted(cumulative, targets, side='left'),
+                         len(values) - 1)
+        return values[order][pos]
+
+    def to_dict(self):
+        return {'k': self.k, 'count': self.count,
+                'levels': [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(k=data['k'])
+        sketch.count = data['count']
+        sketch.levels = [np.array(items, dtype=np.float64) for items in data['levels']]
+        return sketch
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, k=200):
+        """Load a saved sketch, or start an empty one if none exists yet"""
+        if not path or not os.path.exists(path):
+            return cls(k=k)
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def tier_thresholds(sketch, shares=QUANTILE_TIER_SHARES):
+    """Minimum score for each tier, highest tier first"""
+    thresholds = {}
+    cumulative = 0.0
+    for tier, share in shares:
+        cumulative += share
+        thresholds[tier] = float(sketch.quantile(1 - cumulative))
+    return thresholds
+
+
+def assign_tiers(scores, thresholds, default='Low'):
+    """Vectorized tier assignment; scores tied with a threshold go up"""
+    scores = np.asarray(scores, dtype=np.float64)
+    tiers = list(thresholds)
+    conditions = [scores >= thresholds[tier] for tier in tiers]
+    labels = np.select(conditions, tiers, default=default)
+    return pd.Categorical(labels, categories=[default] + tiers[::-1], ordered=True)
+
+
+def sketch_csv(path, column='Total_ICP_Score', chunksize=100_000, sketch=None):
+    """Update a sketch from one column of a CSV, chunk by chunk"""
+    sketch = sketch or KLLSketch()
+    for chunk in pd.read_csv(path, usecols=[column], chunksize=chunksize):
+        sketch.update(chunk[column].to_numpy())
+    return sketch
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Build ICP score tier thresholds')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--sketch', default=DEFAULT_SKETCH_PATH,
+                        help='Persisted sketch carried over from earlier runs')
+    parser.add_argument('--reset', action='store_true',
+                        help='Start a new sketch instead of extending the saved one')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("GTM Engineer Quantile Tier Thresholds")
+    print("="*50)
+
+    sketch = KLLSketch() if args.reset else KLLSketch.load(args.sketch)
+    sketch = sketch_csv(args.input, chunksize=args.chunksize, sketch=sketch)
+    sketch.save(args.sketch)
+
+    print(f"Scores in sketch: {sketch.count}")
+    for tier, threshold in tier_thresholds(sketch).items():
+        print(f"{tier}: score >= {threshold:.0f}")
+    print(f"\nSketch saved to: {args.sketch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - End-to-End Pipeline Runner
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Runs exploration, cleaning, ICP scoring, the buying-group rollup, QA and
+validation as stages of a single process. Stages hand DataFrames to each other in memory; the CSV
+deliverables are optional sinks written only when requested, so the
+dataset is parsed once and no stage re-reads a previous stage's output.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(SCRIPT_DIR, '..', 'deliverables'))
+
+DEFAULT_INPUT = 'data/Diligent_GTM_Engineer_Exercise_with_Instructions.xlsx'
+DASHBOARD_PATH = 'deliverables/icp_scoring_dashboard.png'
+
+
+class GTMPipeline:
+    """
+    Single-process pipeline. Each stage reads the previous stage's frame
+    from memory and optionally writes its deliverable to disk.
+    """
+
+    def __init__(self, input_path=DEFAULT_INPUT, write_outputs=False,
+                 profiler=None, quality_history_dir=None, score_history_dir=None,
+                 fx_as_of=None, render_dashboard=True):
+        self.input_path = input_path
+        self.write_outputs = write_outputs
+        # The dashboard PNG is a file sink, so it is only rendered with write_outputs
+        self.render_dashboard = render_dashboard and write_outputs
+        self.fx_as_of = fx_as_of
+        self.quality_history_dir = quality_history_dir
+        self.score_history_dir = score_history_dir
+
+        profiling = importlib.import_module('pipeline_profiler')
+        self.profiler = profiler or profiling.StageProfiler(run_name='pipeline')
+
+        self.raw_df = None
+        self.quality_df = None
+        self.cleaned_df = None
+        self.token_matrices = None
+        self.scored_df = None
+        self.tier_thresholds = None
+        self.rollup_df = None
+        self.grouped_df = None
+        self.qa_results = None
+        self.validation_passed = None
+
+    def run_exploration(self):
+        """Load the raw dataset once and build the quality assessment"""
+        exploration = importlib.import_module('01_data_exploration')
+        cleaning = importlib.import_module('02_data_cleaning')
+
+        with self.profiler.stage('load'):
+            self.raw_df = cleaning.DiligentDataCleaner(
+                self.input_path).load_data()
+
+        with self.profiler.stage('exploration', rows=len(self.raw_df)):
+            self.quality_df = exploration.build_quality_assessment(self.raw_df)
+            exploration.analyze_key_fields(self.raw_df)
+
+            if self.write_outputs:
+                quality_path = 'analysis/data_quality_assessment.csv'
+                self.quality_df.to_csv(quality_path, index=False)
+                self.raw_df.head(20).to_csv(
+                    'analysis/sample_raw_data.csv', index=False)
+                print(f"Data quality assessment saved to {quality_path}")
+
+        return self.quality_df
+
+    def run_cleaning(self):
+        """Clean the in-memory raw frame"""
+        cleaning = importlib.import_module('02_data_cleaning')
+
+        with self.profiler.stage('cleaning', rows=len(self.raw_df)):
+            cleaner = cleaning.DiligentDataCleaner(
+                self.input_path, profiler=self.profiler)
+            cleaner.load_data(self.raw_df)
+            self.cleaned_df = cleaner.clean_data(fx_as_of=self.fx_as_of)
+            self.token_matrices = cleaner.token_matrices
+            cleaner.generate_cleaning_report(
+                'data/cleaned_diligent_dataset.csv' if self.write_outputs else None,
+                quality_history_dir=self.quality_history_dir)
+
+        return self.cleaned_df
+
+    def run_scoring(self):
+        """Score the cleaned frame without a CSV round trip"""
+        scoring = importlib.import_module('03_icp_scoring')
+
+        with self.profiler.stage('scoring', rows=len(self.cleaned_df)):
+            scorer = scoring.ICPScorer(self.cleaned_df, profiler=self.profiler,
+                                       token_matrices=self.token_matrices)
+            self.scored_df = scorer.calculate_total_icp_score()
+            self.tier_thresholds = scorer.tier_thresholds
+            scorer.generate_prioritization_report(
+                write_outputs=self.write_outputs)
+
+        if self.render_dashboard:
+            scoring_dashboard = importlib.import_module('scoring_dashboard')
+            with self.profiler.stage('dashboard', rows=len(self.scored_df)):
+                scoring_dashboard.render_dashboard(scorer.get_summary(), DASHBOARD_PATH)
+                print(f"Scoring dashboard saved to: {DASHBOARD_PATH}")
+
+        if self.write_outputs:
+            account_store = importlib.import_module('account_store')
+            with self.profiler.stage('account_store', rows=len(self.scored_df)):
+                account_store.load_scored(self.scored_df)
+                print(f"Account store saved to: {account_store.DEFAULT_STORE_PATH}")
+
+        if self.score_history_dir is not None:
+            score_snapshots = importlib.import_module('score_snapshots')
+            with self.profiler.stage('score_snapshot', rows=len(self.scored_df)):
+                summary = score_snapshots.ScoreSnapshots(
+                    self.score_history_dir).record_run(self.scored_df)
+                print(f"Score snapshot ({summary['kind']}, {summary['rows_written']} "
+                      f"accounts written) saved to: {summary['path']}")
+
+        return self.scored_df
+
+    def run_hierarchy(self):
+        """Roll the scored accounts up to parent/child buying groups"""
+        account_hierarchy = importlib.import_module('account_hierarchy')
+
+        with self.profiler.stage('hierarchy', rows=len(self.scored_df)):
+            hierarchy = account_hierarchy.AccountHierarchy(
+                self.scored_df, tier_thresholds=self.tier_thresholds)
+            self.rollup_df = hierarchy.get_rollup()
+            # Scored rows with their buying group, for lead_routing --by-buying-group
+            self.grouped_df = hierarchy.attach_to_accounts()
+
+            if self.write_outputs:
+                rollup_path = 'deliverables/account_hierarchy_rollup.csv'
+                self.rollup_df.to_csv(rollup_path)
+                print(f"Account rollup saved to: {rollup_path}")
+
+        return self.rollup_df
+
+    def run_qa(self):
+        """Run the automated QA checks on the scored frame"""
+        qa = importlib.import_module('enrichment_qa_example')
+
+        with self.profiler.stage('qa', rows=len(self.scored_df)):
+            self.qa_results = qa.qa_validation_example(self.scored_df)
+
+        return self.qa_results
+
+    def run_validation(self):
+        """Validate the scored frame (and the files, if they were written)"""
+        validation = importlib.import_module('04_validation')
+
+        with self.profiler.stage('validation', rows=len(self.scored_df)):
+            self.validation_passed = validation.validate_deliverables(
+                self.scored_df, check_files=self.write_outputs,
+                check_dashboard=self.render_dashboard)
+
+        return self.validation_passed
+
+    def run(self):
+        """Run every stage in order"""
+        self.run_exploration()
+        self.run_cleaning()
+        self.run_scoring()
+        self.run_hierarchy()
+        self.run_qa()
+        self.run_validation()
+        return self.scored_df
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Run the GTM pipeline end to end')
+    parser.add_argument('--input', default=DEFAULT_INPUT,
+                        help='Path to the raw Excel dataset')
+    parser.add_argument('--write-outputs', action='store_true',
+                        help='Write the CSV deliverables to data/, analysis/ '
+                             'and deliverables/')
+    parser.add_argument('--no-dashboard', action='store_true',
+                        help='Skip rendering the scoring dashboard PNG with --write-outputs')
+    parser.add_argument('--report', help='Write a JSON stage timing report')
+    parser.add_argument('--quality-history',
+                        help='Directory of per-run quality statistics used '
+                             'for drift alerts (e.g. analysis/quality_history)')
+    parser.add_argument('--score-history',
+                        help='Directory of per-run score snapshots used for '
+                             'score movement history (e.g. analysis/score_snapshots)')
+    parser.add_argument('--fx-as-of',
+                        help='Convert revenue with the FX rates as of this date '
+                             '(default: latest)')
+    args = parser.parse_args()
+
+    print("GTM Engineer End-to-End Pipeline")
+    print("="*50)
+
+    pipeline = GTMPipeline(args.input, write_outputs=args.write_outputs,
+                           quality_history_dir=args.quality_history,
+                           score_history_dir=args.score_history,
+                           fx_as_of=args.fx_as_of,
+                           render_dashboard=not args.no_dashboard)
+    scored_df = pipeline.run()
+
+    pipeline.profiler.print_summary()
+    if args.report:
+        pipeline.profiler.write_report(args.report)
+        print(f"Run report saved to: {args.report}")
+
+    print("\nPipeline completed successfully!")
+    return scored_df
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Headless ICP Scoring Entry Point
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Scores a cleaned dataset and writes the scored CSV without printing the
+prioritization report or rendering the dashboard. Only pandas/numpy are
+imported, so short-lived workers start quickly.
+"""
+
+import argparse
+import importlib
+
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+output_writer = importlib.import_module('output_writer')
+
+
+def score_file(input_path, output_path, tiering='fixed', sketch_path=None,
+               intent_store_path=None, model_path=None, fx_as_of=None):
+    """Score a cleaned CSV and write the scored rows to output_path
+
+    With tiering='quantile' the persisted score sketch at sketch_path is
+    loaded, extended with this run's scores and saved back. With an
+    intent store, Intent_Score_Clean is replaced by the decayed intent of
+    accounts that have event history. With a learned_scorer model artifact,
+    Model_Win_Probability and Model_ICP_Score are added. With fx_as_of,
+    Revenue_USD is re-converted with the FX rates as of that date.
+    """
+    cleaned_data = input_path
+    if intent_store_path or fx_as_of:
+        cleaned_data = pd.read_csv(input_path, dtype={'SFDC_Account_ID_Clean': str})
+    if fx_as_of:
+        cleaned_data = scoring.cleaning.with_numeric_firmographics(cleaned_data, fx_as_of)
+    if intent_store_path:
+        intent_store = importlib.import_module('intent_store')
+        store = intent_store.IntentStore(intent_store_path)
+        cleaned_data = intent_store.apply_decayed_intent(cleaned_data, store)
+        store.close()
+
+    scorer = scoring.ICPScorer(cleaned_data)
+    sketch = None
+    if tiering == 'quantile':
+        sketch = scoring.quantile_sketch.KLLSketch.load(sketch_path)
+    model = None
+    if model_path:
+        model = importlib.import_module('learned_scorer').LogisticScorer.load(model_path)
+    scored_df = scorer.calculate_total_icp_score(tiering=tiering, sketch=sketch, model=model)
+    output_writer.write_frame(scored_df, output_path)
+    print(f"Scored {len(scored_df)} accounts -> {output_path}")
+
+    if tiering == 'quantile':
+        scorer.score_sketch.save(sketch_path)
+        thresholds = ', '.join(f"{tier} >= {threshold:.0f}"
+                               for tier, threshold in scorer.tier_thresholds.items())
+        print(f"Quantile tier thresholds: {thresholds}")
+    return scored_df
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Score accounts without reports or charts')
+    parser.add_argument('--input', default='data/cleaned_diligent_dataset.csv',
+                        help='Cleaned dataset produced by 02_data_cleaning.py')
+    parser.add_argument('--output', default='deliverables/prioritized_accounts.csv',
+                        help='Where to write the scored dataset')
+    parser.add_argument('--tiering', choices=['fixed', 'quantile'], default='fixed',
+                        help='Fixed 0/40/60/80/100 bins or score percentiles')
+    parser.add_argument('--sketch', default=scoring.quantile_sketch.DEFAULT_SKETCH_PATH,
+                        help='Persisted score sketch used by quantile tiering')
+    parser.add_argument('--intent-store',
+                        help='Read decayed intent from this store (see intent_store.py)')
+    parser.add_argument('--model',
+                        help='Add learned win-probability scores from this model '
+                             '(see learned_scorer.py)')
+    parser.add_argument('--fx-as-of',
+                        help='Re-convert revenue with the FX rates as of this date')
+    args = parser.parse_args()
+
+    return score_file(args.input, args.output, args.tiering, args.sketch,
+                      args.intent_store, args.model, args.fx_as_of)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Score Snapshot History
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Keeps the history of Total_ICP_Score, Priority_Tier and ICP_Archetype per
+SFDC account across runs without storing a full copy each time. A run
+records only the accounts whose score, tier or archetype changed (plus
+tombstones for accounts that disappeared) as compressed numpy columns;
+a full checkpoint is written on the first run and every
+`checkpoint_every` runs, so reconstructing the state as of any date reads
+one checkpoint and the deltas after it.
+"""
+
+import argparse
+import glob
+import importlib
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+scoring = importlib.import_module('03_icp_scoring')
+crm_export = importlib.import_module('crm_export')
+
+DEFAULT_HISTORY_DIR = 'analysis/score_snapshots'
+DEFAULT_CHECKPOINT_EVERY = 30
+RUN_ID_FORMAT = '%Y%m%dT%H%M%S%f'
+
+# Tier codes follow PRIORITY_TIER_LABELS order, so a higher code is a
+# better tier; REMOVED marks an account that left the dataset
+TIER_CODES = {tier: code for code, tier in enumerate(scoring.PRIORITY_TIER_LABELS)}
+REMOVED = -1
+
+
+def account_state(scored_df):
+    """
+    One row per SFDC account (sorted by ID) with its score, tier code and
+    archetype. Rows without an ID are not tracked; for a duplicated ID the
+    last row wins, as in the CRM export.
+    """
+    ids = crm_export._normalize_ids(scored_df[crm_export.ID_COLUMN].fillna(crm_export.MISSING_ID))
+    has_id = (ids != crm_export.MISSING_ID).to_numpy()
+    ids = ids.to_numpy(dtype=str)[has_id][::-1]
+    ids, first = np.unique(ids, return_index=True)
+
+    tiers = scored_df['Priority_Tier'].astype(object).map(TIER_CODES)
+    return {
+        'ids': ids,
+        'score': scored_df['Total_ICP_Score'].to_numpy(dtype=np.float32)[has_id][::-1][first],
+        'tier': tiers.fillna(REMOVED).to_numpy(dtype=np.int8)[has_id][::-1][first],
+        'archetype': scored_df['ICP_Archetype'].astype(str).to_numpy(dtype=str)[has_id][::-1][first]
+    }
+
+
+def _lookup(sorted_ids, ids):
+    """(found mask, positions) of ids in a sorted ID array"""
+    if len(sorted_ids) == 0:
+        return np.zeros(len(ids), dtype=bool), np.zeros(len(ids), dtype=np.intp)
+    pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+    return sorted_ids[pos] == ids, pos
+
+
+def _run_id(when):
+    """Run ID (sortable timestamp) for a datetime or date string; a bare
+    date means the end of that day"""
+    if isinstance(when, str) and len(when) <= 10:
+        when = pd.Timestamp(when) + timedelta(days=1, seconds=-1)
+    return pd.Timestamp(when).strftime(RUN_ID_FORMAT)
+
+
+class ScoreSnapshots:
+    """Per-run score deltas with periodic full checkpoints"""
+
+    def __init__(self, history_dir=DEFAULT_HISTORY_DIR,
+                 checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+        self.history_dir = history_dir
+        self.checkpoint_every = checkpoint_every
+
+    def runs(self):
+        """Recorded runs, oldest first, as (run_id, kind, path)"""
+        runs = []
+        for path in sorted(glob.glob(os.path.join(self.history_dir, 'score_snapshot_*.npz'))):
+            run_id, kind = os.path.basename(path)[len('score_snapshot_'):-len('.npz')].split('_')
+            runs.append((run_id, kind, path))
+        return runs
+
+    @staticmethod
+    def _load(path):
+        with np.load(path) as snapshot:
+            labels = snapshot['archetype_labels']
+            return {'ids': snapshot['ids'], 'score': snapshot['score'],
+                    'tier': snapshot['tier'], 'archetype': labels[snapshot['archetype_codes']]}
+
+    def state_as_of(self, as_of=None):
+        """
+        Account state after the last run at or before `as_of` (default:
+        latest), rebuilt from the preceding checkpoint and its deltas.
+        Returns a DataFrame indexed by account ID.
+        """
+        runs = self.runs()
+        if as_of is not None:
+            cutoff = _run_id(as_of)
+            runs = [run for run in runs if run[0] <= cutoff]
+        checkpoints = [i for i, (_, kind, _) in enumerate(runs) if kind == 'full']
+        runs = runs[checkpoints[-1]:] if checkpoints else []
+
+        columns = ['score', 'tier', 'archetype']
+        if not runs:
+            return pd.DataFrame(columns=columns).rename_axis('account_id')
+
+        parts = [self._load(path) for _, _, path in runs]
+        # Latest run first, so np.unique's first index is the newest value
+        merged = {key: np.concatenate([part[key] for part in reversed(parts)])
+                  for key in ['ids'] + columns}
+        ids, first = np.unique(merged['ids'], return_index=True)
+        state = pd.DataFrame({key: merged[key][first] for key in columns},
+                             index=pd.Index(ids, name='account_id'))
+        return state[state['tier'] != REMOVED]
+
+    def record_run(self, scored_df, run_id=None):
+        """
+        Record a run: the accounts whose score, tier or archetype changed
+        since the latest state, or a full checkpoint when one is due.
+        Returns a summary dict.
+        """
+        run_id = run_id or datetime.now().strftime(RUN_ID_FORMAT)
+        current = account_state(scored_df)
+        runs = self.runs()
+        deltas_since_checkpoint = 0
+        for _, kind, _ in reversed(runs):
+            if kind == 'full':
+                break
+            deltas_since_checkpoint += 1
+
+        full = not runs or deltas_since_checkpoint + 1 >= self.checkpoint_every
+        if full:
+            record = current
+        else:
+            previous = self.state_as_of()
+            prev_ids = previous.index.to_numpy(dtype=str)
+            # Both ID arrays are sorted, so matching is a searchsorted each way
+            known, pos = _lookup(prev_ids, current['ids'])
+            changed = ~known
+            for key in ['score', 'tier', 'archetype']:
+                changed[known] |= previous[key].to_numpy()[pos[known]] != current[key][known]
+            removed = prev_ids[~_lookup(current['ids'], prev_ids)[0]]
+            record = {
+                'ids': np.concatenate([current['ids'][changed], removed]),
+                'score': np.concatenate([current['score'][changed],
+                                         np.full(len(removed), np.nan, dtype=np.float32)]),
+                'tier': np.concatenate([current['tier'][changed],
+                                        np.full(len(removed), REMOVED, dtype=np.int8)]),
+                'archetype': np.concatenate([current['archetype'][changed],
+                                             np.full(len(removed), '', dtype=str)])
+            }
+
+        kind = 'full' if full else 'delta'
+        os.makedirs(self.history_dir, exist_ok=True)
+        path = os.path.join(self.history_dir, f'score_snapshot_{run_id}_{kind}.npz')
+        labels, codes = np.unique(record['archetype'], return_inverse=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(tmp_path, ids=record['ids'], score=record['score'],
+                            tier=record['tier'], archetype_labels=labels,
+                            archetype_codes=codes.astype(np.int16))
+        os.replace(tmp_path, path)
+        return {'run_id': run_id, 'kind': kind, 'accounts': len(current['ids']),
+                'rows_written': len(record['ids']), 'path': path}
+
+    def tier_movements(self, since, until=None, direction='up'):
+        """
+        Accounts whose tier changed between the state as of `since` and as
+        of `until` (default: latest). direction is 'up', 'down' or 'any';
+        accounts new since `since` are not counted as movements.
+        """
+        before = self.state_as_of(since)
+        after = self.state_as_of(until)
+        moved = before.join(after, how='inner', lsuffix='_before', rsuffix='_after')
+        delta = moved['tier_after'].astype(int) - moved['tier_before'].astype(int)
+        mask = {'up': delta > 0, 'down': delta < 0, 'any': delta != 0}[direction]
+        moved = moved[mask]
+
+        labels = np.array(scoring.PRIORITY_TIER_LABELS, dtype=object)
+        return pd.DataFrame({
+            'Tier_Before': labels[moved['tier_before'].astype(int)],
+            'Tier_After': labels[moved['tier_after'].astype(int)],
+            'Score_Before': moved['score_before'],
+            'Score_After': moved['score_after'],
+            'Archetype': moved['archetype_after']
+        }, index=moved.index).sort_values('Score_After', ascending=False, kind='stable')
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Record and query score history')
+    parser.add_argument('--history-dir', default=DEFAULT_HISTORY_DIR)
+    parser.add_argument('--record', nargs='?', const='deliverables/prioritized_accounts.csv',
+                        help='Record a run from this scored CSV')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY)
+    parser.add_argument('--as-of', help='Reconstruct the account state as of this date')
+    parser.add_argument('--output', help='Write the --as-of state here')
+    parser.add_argument('--moved-up-days', type=int,
+                        help='List accounts that moved up a tier in the last N days')
+    args = parser.parse_args()
+
+    print("GTM Engineer Score Snapshots")
+    print("="*50)
+
+    snapshots = ScoreSnapshots(args.history_dir, args.checkpoint_every)
+    if args.record:
+        summary = snapshots.record_run(pd.read_csv(
+            args.record, dtype={crm_export.ID_COLUMN: str}))
+        print(f"Recorded {summary['kind']} snapshot {summary['run_id']}: "
+              f"{summary['rows_written']} of {summary['accounts']} accounts -> {summary['path']}")
+
+    print(f"Runs recorded: {len(snapshots.runs())}")
+
+    if args.as_of:
+        state = snapshots.state_as_of(args.as_of)
+        print(f"\nState as of {args.as_of}: {len(state)} accounts")
+        if args.output:
+            state.to_csv(args.output)
+            print(f"Saved to: {args.output}")
+
+    if args.moved_up_days:
+        since = datetime.now() - timedelta(days=args.moved_up_days)
+        moved = snapshots.tier_movements(since)
+        print(f"\nACCOUNTS THAT MOVED UP A TIER IN THE LAST {args.moved_up_days} DAYS: {len(moved)}")
+        print(moved.head(20).to_string())
+
+
+if __name__ == "__main__":
+    main()
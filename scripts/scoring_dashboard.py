@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - ICP Scoring Dashboard Rendering
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Precomputes the aggregates behind the prioritization report and the
+four-panel scoring dashboard once (ScoringSummary), then renders them
+headlessly with the Agg backend at a configurable DPI. Per-territory or
+per-owner dashboards are summarized in one groupby pass and rendered in
+parallel worker processes.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+SCORE_COMPONENTS = ['Firmographic_Score', 'Solution_Fit_Score',
+                    'Intent_Signals_Score', 'Tech_Compliance_Score']
+
+
+class ScoringSummary:
+    """Aggregates shared by the prioritization report and the dashboard"""
+
+    def __init__(self, scored_df, title='ICP Scoring Analysis Dashboard', bins=20):
+        scores = scored_df['Total_ICP_Score']
+
+        self.title = title
+        self.total_accounts = len(scored_df)
+        self.mean_score = scores.mean()
+        self.median_score = scores.median()
+        self.top_decile_threshold = scores.quantile(0.9)
+
+        self.histogram_counts, self.histogram_edges = np.histogram(
+            scores.to_numpy(dtype=np.float64), bins=bins)
+
+        self.tier_counts = scored_df['Priority_Tier'].value_counts()
+        self.archetype_counts = scored_df['ICP_Archetype'].value_counts()
+        self.archetype_mean_scores = scored_df.groupby(
+            'ICP_Archetype')['Total_ICP_Score'].mean().sort_values(ascending=False)
+        self.component_means = scored_df[SCORE_COMPONENTS].mean()
+
+
+def summarize_segments(scored_df, by):
+    """One ScoringSummary per value of `by` (e.g. Region_Clean, Lead_Owner_Clean)"""
+    return {
+        segment: ScoringSummary(group, title=f'ICP Scoring Dashboard - {segment}')
+        for segment, group in scored_df.groupby(by, observed=True, sort=True)
+    }
+
+
+def draw_dashboard(fig, summary):
+    """Draw the four dashboard panels onto a matplotlib Figure"""
+    axes = fig.subplots(2, 2)
+    fig.suptitle(summary.title, fontsize=16, fontweight='bold')
+
+    # 1. Score distribution histogram
+    edges = summary.histogram_edges
+    axes[0, 0].hist(edges[:-1], bins=edges, weights=summary.histogram_counts,
+                    alpha=0.7, color='skyblue', edgecolor='black')
+    axes[0, 0].axvline(summary.mean_score, color='red', linestyle='--', label='Mean')
+    axes[0, 0].set_title('Total ICP Score Distribution')
+    axes[0, 0].set_xlabel('ICP Score')
+    axes[0, 0].set_ylabel('Number of Accounts')
+    axes[0, 0].legend()
+
+    # 2. Priority tier distribution
+    priority_counts = summary.tier_counts[summary.tier_counts > 0]
+    axes[0, 1].pie(priority_counts.values,
+                   labels=priority_counts.index, autopct='%1.1f%%', startangle=90)
+    axes[0, 1].set_title('Priority Tier Distribution')
+
+    # 3. ICP Archetype vs Score
+    archetype_scores = summary.archetype_mean_scores
+    axes[1, 0].bar(range(len(archetype_scores)),
+                   archetype_scores.values, color='lightcoral')
+    axes[1, 0].set_title('Average Score by ICP Archetype')
+    axes[1, 0].set_xlabel('ICP Archetype')
+    axes[1, 0].set_ylabel('Average ICP Score')
+    axes[1, 0].set_xticks(range(len(archetype_scores)))
+    axes[1, 0].set_xticklabels(archetype_scores.index, rotation=45)
+
+    # 4. Score components breakdown
+    axes[1, 1].bar(range(len(SCORE_COMPONENTS)),
+                   summary.component_means.values, color='lightgreen')
+    axes[1, 1].set_title('Average Score by Component')
+    axes[1, 1].set_xlabel('Score Component')
+    axes[1, 1].set_ylabel('Average Score')
+    axes[1, 1].set_xticks(range(len(SCORE_COMPONENTS)))
+    axes[1, 1].set_xticklabels([comp.replace('_', '\n')
+                               for comp in SCORE_COMPONENTS], rotation=45)
+
+    fig.tight_layout()
+
+
+def render_dashboard(summary, output_path, dpi=150):
+    """Render a dashboard to a PNG with the Agg backend (no GUI, no pyplot state)"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(15, 12))
+    FigureCanvasAgg(fig)
+    draw_dashboard(fig, summary)
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    return output_path
+
+
+def _segment_filename(segment):
+    slug = ''.join(c if c.isalnum() else '_' for c in str(segment)).strip('_')
+    return f'icp_scoring_dashboard_{slug or "unknown"}.png'
+
+
+def render_segment_dashboards(scored_df, by, output_dir, dpi=150, workers=None):
+    """Render one dashboard per segment of `by` in parallel processes"""
+    os.makedirs(output_dir, exist_ok=True)
+    summaries = summarize_segments(scored_df, by)
+    paths = [os.path.join(output_dir, _segment_filename(segment))
+             for segment in summaries]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rendered = list(pool.map(render_dashboard, summaries.values(),
+                                 paths, [dpi] * len(paths)))
+
+    return dict(zip(summaries, rendered))
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Render ICP scoring dashboards headlessly')
+    parser.add_argument('--input', default='deliverables/prioritized_accounts.csv')
+    parser.add_argument('--by', help='Render one dashboard per value of this column '
+                                     '(e.g. Region_Clean or Lead_Owner_Clean)')
+    parser.add_argument('--output-dir', default='deliverables/dashboards')
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    print("GTM Engineer Scoring Dashboards")
+    print("="*50)
+
+    scored_df = pd.read_csv(args.input)
+    if args.by:
+        rendered = render_segment_dashboards(
+            scored_df, args.by, args.output_dir, args.dpi, args.workers)
+        for segment, path in rendered.items():
+            print(f"{segment}: {path}")
+        print(f"\nRendered {len(rendered)} dashboards to {args.output_dir}")
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        path = render_dashboard(ScoringSummary(scored_df),
+                                os.path.join(args.output_dir, 'icp_scoring_dashboard.png'),
+                                args.dpi)
+        print(f"Dashboard saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
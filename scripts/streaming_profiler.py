@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Streaming Single-Pass Data Profiler
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Profiles every column of a dataset in one chunked pass with bounded memory:
+missing counts, approximate distinct counts (HyperLogLog), top-K frequent
+values (space-saving sketch) and type inference. Produces the same
+data_quality_assessment.csv layout as 01_data_exploration.py without
+loading the whole file into memory.
+"""
+
+import argparse
+import heapq
+import os
+
+import numpy as np
+import pandas as pd
+
+# Placeholder values that count as "unknown" on top of real missing values
+UNKNOWN_VALUES = ['unknown', 'missing', 'unassigned', 'n/a', 'tbd', '—']
+
+# Strings pandas reads as missing by default (kept in sync with read_csv/read_excel)
+NA_STRINGS = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+              '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+              'n/a', 'nan', 'null']
+
+
+def _to_builtin(value):
+    """Convert numpy scalars to plain Python values for JSON"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def hash_values(series):
+    """Stable 64-bit hashes of the non-null values of a Series"""
+    values = series.dropna()
+    if values.dtype.kind in 'iuf':
+        # Hash numbers as float so 5 and 5.0 from different chunks agree
+        values = values.astype(np.float64)
+    else:
+        values = values.astype(object)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes.
+
+    Counts are exact while fewer than `exact_limit` distinct hashes have
+    been seen; beyond that the sketch switches to 2**precision registers.
+    """
+
+    def __init__(self, precision=14, exact_limit=2048):
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.exact = np.empty(0, dtype=np.uint64)
+        self.registers = None
+
+    def _promote(self):
+        """Switch from exact hashes to HLL registers"""
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+        self._update_registers(self.exact)
+        self.exact = None
+
+    def _update_registers(self, hashes):
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining 64-p bits
+        bit_length = np.frexp(remainder.astype(np.float64))[1]
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add_hashes(self, hashes):
+        """Add a batch of uint64 hashes"""
+        if self.registers is None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) > self.exact_limit:
+                self._promote()
+        else:
+            self._update_registers(hashes)
+
+    def merge(self, other):
+        """Merge another sketch into this one"""
+        if other.registers is None:
+            self.add_hashes(other.exact)
+            return self
+        if self.registers is None:
+            self._promote()
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """Estimated number of distinct values"""
+        if self.registers is None:
+            return int(len(self.exact))
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self):
+        if self.registers is None:
+            return {'precision': self.precision, 'exact_limit': self.exact_limit,
+                    'exact': [int(h) for h in self.exact]}
+        return {'precision': self.precision, 'exact_limit': self.exact_limit,
+                'registers': self.registers.tobytes().hex()}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['precision'], data['exact_limit'])
+        if 'registers' in data:
+            sketch.exact = None
+            sketch.registers = np.frombuffer(
+                bytes.fromhex(data['registers']), dtype=np.uint8).copy()
+        else:
+            sketch.exact = np.array(data['exact'], dtype=np.uint64)
+        return sketch
+
+
+class SpaceSaving:
+    """
+    Space-saving top-K sketch. Keeps at most `capacity` counters; each
+    counter over-estimates its true count by at most its recorded error.
+    """
+
+    def __init__(self, capacity=50):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # Largest count evicted so far: an unseen value may have occurred up
+        # to this many times before it entered the sketch
+        self.floor = 0
+
+    def add_counts(self, value_counts):
+        """Add pre-aggregated (value -> count) pairs, e.g. a chunk's value_counts()"""
+        incoming = pd.Series(value_counts, dtype='int64')
+        if incoming.empty:
+            return
+        counts = pd.Series(self.counts, dtype='int64')
+        errors = pd.Series(self.errors, dtype='int64')
+
+        new = incoming.index.difference(counts.index, sort=False)
+        counts = counts.add(incoming, fill_value=0).astype('int64')
+        errors = errors.reindex(counts.index, fill_value=0)
+        counts[new] += self.floor
+        errors[new] = self.floor
+
+        if len(counts) > self.capacity:
+            kept = counts.nlargest(self.capacity)
+            self.floor = max(self.floor, int(counts.drop(kept.index).max()))
+            counts, errors = kept, errors[kept.index]
+        self.counts = {value: int(count) for value, count in counts.items()}
+        self.errors = {value: int(error) for value, error in errors.items()}
+
+    def merge(self, other):
+        """Merge another sketch into this one"""
+        self.add_counts(other.counts)
+        return self
+
+    def top(self, n=10):
+        """The n most frequent values as a Series (approximate counts)"""
+        top = heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+        return pd.Series(dict(top), name='count', dtype='int64')
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'floor': self.floor,
+                'items': [[_to_builtin(value), count, self.errors[value]]
+                          for value, count in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['capacity'])
+        sketch.floor = data.get('floor', 0)
+        for value, count, error in data['items']:
+            sketch.counts[value] = count
+            sketch.errors[value] = error
+        return sketch
+
+
+class ColumnProfile:
+    """
+    Running statistics for one column. Profiles built over separate chunks
+    or partitions can be merged and round-tripped through to_dict().
+    """
+
+    def __init__(self, name, top_k=50, histogram_bins=None):
+        self.name = name
+        self.rows = 0
+        self.missing = 0
+        self.unknown = 0
+        self.distinct = HyperLogLog()
+        self.frequent = SpaceSaving(top_k)
+        self.kinds = set()
+        self.histogram_bins = (np.asarray(histogram_bins, dtype=np.float64)
+                               if histogram_bins is not None else None)
+        self.histogram = (np.zeros(len(self.histogram_bins) - 1, dtype=np.int64)
+                          if histogram_bins is not None else None)
+
+    def update(self, series):
+        self.rows += len(series)
+        missing = int(series.isna().sum())
+        self.missing += missing
+        self.unknown += missing
+
+        non_null = series.dropna()
+        if len(non_null):
+            kind = non_null.infer_objects().dtype.kind
+            self.kinds.add(kind)
+            self.distinct.add_hashes(hash_values(non_null))
+            values = non_null.astype(np.float64) if non_null.dtype.kind in 'iuf' else non_null
+            self.frequent.add_counts(values.value_counts(sort=False))
+
+            if kind in 'iuf':
+                if self.histogram is not None:
+                    counts, _ = np.histogram(values.to_numpy(), bins=self.histogram_bins)
+                    self.histogram += counts
+            else:
+                self.unknown += int(non_null.astype(str).str.strip().str.lower()
+                                    .isin(UNKNOWN_VALUES).sum())
+
+    def merge(self, other):
+        """Merge another profile of the same column into this one"""
+        self.rows += other.rows
+        self.missing += other.missing
+        self.unknown += other.unknown
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        self.kinds |= other.kinds
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram += other.histogram
+        return self
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'rows': self.rows,
+            'missing': self.missing,
+            'unknown': self.unknown,
+            'kinds': sorted(self.kinds),
+            'distinct': self.distinct.to_dict(),
+            'frequent': self.frequent.to_dict(),
+            'histogram_bins': (self.histogram_bins.tolist()
+                               if self.histogram_bins is not None else None),
+            'histogram': (self.histogram.tolist()
+                          if self.histogram is not None else None)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls(data['name'], data['frequent']['capacity'], data['histogram_bins'])
+        profile.rows = data['rows']
+        profile.missing = data['missing']
+        profile.unknown = data['unknown']
+        profile.kinds = set(data['kinds'])
+        profile.distinct = HyperLogLog.from_dict(data['distinct'])
+        profile.frequent = SpaceSaving.from_dict(data['frequent'])
+        if data['histogram'] is not None:
+            profile.histogram = np.array(data['histogram'], dtype=np.int64)
+        return profile
+
+    def data_type(self):
+        """Dtype a full pandas load would have inferred for this column"""
+        if not self.kinds:
+            return 'float64'
+        if self.kinds <= {'i', 'u'}:
+            return 'float64' if self.missing else 'int64'
+        if self.kinds <= {'i', 'u', 'f'}:
+            return 'float64'
+        if self.kinds == {'b'}:
+            return 'object' if self.missing else 'bool'
+        if self.kinds == {'M'}:
+            return 'datetime64[ns]'
+        return 'object'
+
+
+class StreamingProfiler:
+    """Single-pass, chunked profiler over a whole dataset"""
+
+    def __init__(self, top_k=50, histogram_bins=None):
+        self.top_k = top_k
+        self.histogram_bins = histogram_bins or {}
+        self.columns = {}
+        self.rows = 0
+        self.sample = None
+
+    def update(self, chunk):
+        """Profile one chunk of rows"""
+        if self.sample is None:
+            self.sample = chunk.head(20).copy()
+
+        for column in chunk.columns:
+            if column not in self.columns:
+                self.columns[column] = ColumnProfile(
+                    column, self.top_k, self.histogram_bins.get(column))
+            self.columns[column].update(chunk[column])
+        self.rows += len(chunk)
+
+    def merge(self, other):
+        """Merge a profiler built over another chunk or partition"""
+        for column, profile in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(profile)
+            else:
+                self.columns[column] = profile
+        self.rows += other.rows
+        if self.sample is None:
+            self.sample = other.sample
+        return self
+
+    def to_dict(self):
+        return {'rows': self.rows,
+                'columns': {name: profile.to_dict()
+                            for name, profile in self.columns.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        profiler = cls()
+        profiler.rows = data['rows']
+        profiler.columns = {name: ColumnProfile.from_dict(profile)
+                            for name, profile in data['columns'].items()}
+        return profiler
+
+    def profile_csv(self, path, chunksize=100_000):
+        """Profile a CSV file chunk by chunk"""
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            self.update(chunk)
+        return self
+
+    def profile_excel(self, path, sheet_name='Dataset', chunksize=100_000):
+        """Profile an Excel sheet row by row using openpyxl's read-only mode"""
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = [str(h) for h in next(rows)]
+
+        buffer = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunksize:
+                self.update(self._excel_chunk(buffer, header))
+                buffer = []
+        if buffer:
+            self.update(self._excel_chunk(buffer, header))
+
+        workbook.close()
+        return self
+
+    @staticmethod
+    def _excel_chunk(rows, header):
+        chunk = pd.DataFrame.from_records(rows, columns=header)
+        # Mirror read_excel: default NA strings become missing and text
+        # columns that are entirely numeric are parsed as numbers
+        for column in chunk.columns:
+            if chunk[column].dtype.kind in 'OT':
+                values = chunk[column].where(~chunk[column].isin(NA_STRINGS))
+                numeric = pd.to_numeric(values, errors='coerce')
+                if numeric.notna().sum() == values.notna().sum():
+                    values = numeric
+                chunk[column] = values
+        return chunk
+
+    def profile_file(self, path, chunksize=100_000):
+        """Profile a CSV or Excel file based on its extension"""
+        if os.path.splitext(path)[1].lower() in ('.xlsx', '.xlsm'):
+            return self.profile_excel(path, chunksize=chunksize)
+        return self.profile_csv(path, chunksize=chunksize)
+
+    def quality_assessment(self):
+        """Quality table in the data_quality_assessment.csv format"""
+        profiles = list(self.columns.values())
+        quality_df = pd.DataFrame({
+            'Column': [p.name for p in profiles],
+            'Missing_Count': [p.missing for p in profiles],
+            'Missing_Percentage': [(p.missing / self.rows) * 100 if self.rows else 0.0
+                                   for p in profiles],
+            'Unique_Values': [p.distinct.count() for p in profiles],
+            'Data_Type': [p.data_type() for p in profiles]
+        })
+        return quality_df.sort_values('Missing_Percentage', ascending=False)
+
+    def top_values(self, column, n=10):
+        """Approximate most frequent values for a column"""
+        return self.columns[column].frequent.top(n).rename_axis(column)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Single-pass streaming data profiler')
+    parser.add_argument('--input', default='data/Diligent_GTM_Engineer_Exercise_with_Instructions.xlsx')
+    parser.add_argument('--output', default='analysis/data_quality_assessment.csv')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("GTM Engineer Streaming Data Profiler")
+    print("="*50)
+
+    profiler = StreamingProfiler().profile_file(args.input, args.chunksize)
+    quality_df = profiler.quality_assessment()
+    print(f"Profiled {profiler.rows} rows x {len(profiler.columns)} columns")
+    print(quality_df.to_string(index=False))
+
+    quality_df.to_csv(args.output, index=False)
+    print(f"\nData quality assessment saved to {args.output}")
+    return quality_df
+
+
+if __name__ == "__main__":
+    main()
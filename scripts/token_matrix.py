@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+GTM Engineer Analysis - Multi-Hot Token Matrices
+Author: GTM Engineer Candidate
+Date: September 2025
+
+Tokenizes Tech_Stack_Clean and Compliance Certifications once, into a
+shared lowercase vocabulary, and stores each field as a sparse multi-hot
+matrix in CSR form (numpy indptr/indices arrays). Keyword rules are
+resolved against the vocabulary once; per-row checks are then sparse
+matrix-vector products instead of string scans. scipy is optional and
+only used by to_scipy().
+"""
+
+import numpy as np
+import pandas as pd
+
+TOKEN_FIELDS = ['Tech_Stack_Clean', 'Compliance Certifications']
+
+# Same delimiters as DiligentDataCleaner.standardize_tech_stack
+TOKEN_DELIMITERS = r'[;,|&]'
+IGNORED_TOKENS = ['', 'unknown', 'n/a', 'nan', 'none']
+
+
+class TokenVocabulary:
+    """Lowercase token <-> column index, shared by all token fields"""
+
+    def __init__(self, tokens=None):
+        self.tokens = []
+        self.index = {}
+        for token in tokens or []:
+            self.add(token)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def add(self, token):
+        if token not in self.index:
+            self.index[token] = len(self.tokens)
+            self.tokens.append(token)
+        return self.index[token]
+
+    def encode(self, tokens):
+        """Column indices for a Series of tokens, growing the vocabulary"""
+        for token in pd.unique(tokens):
+            self.add(token)
+        return tokens.map(self.index).to_numpy(dtype=np.int32)
+
+    def keyword_mask(self, keyword):
+        """Vocabulary entries containing keyword (substring, lowercase)"""
+        keyword = keyword.lower()
+        return np.array([keyword in token for token in self.tokens], dtype=bool)
+
+
+class MultiHotMatrix:
+    """Binary CSR matrix: row i has ones at indices[indptr[i]:indptr[i + 1]]"""
+
+    def __init__(self, indptr, indices, n_cols):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.n_cols = n_cols
+
+    @property
+    def shape(self):
+        return (len(self.indptr) - 1, self.n_cols)
+
+    def row_ids(self):
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def dot(self, vector):
+        """Sparse matrix-vector product with a vocabulary-length vector"""
+        vector = np.asarray(vector, dtype=np.float64)
+        if len(vector) < self.n_cols:
+            raise ValueError("Vector is shorter than the vocabulary")
+        return np.bincount(self.row_ids(), weights=vector[self.indices],
+                           minlength=self.shape[0])
+
+    def any_of(self, token_mask):
+        """Rows containing at least one token where token_mask is True"""
+        token_mask = np.asarray(token_mask, dtype=bool)
+        padded = np.zeros(self.n_cols, dtype=np.float64)
+        padded[:len(token_mask)] = token_mask
+        return self.dot(padded) > 0
+
+    def to_scipy(self):
+        """Equivalent scipy.sparse.csr_matrix (requires scipy)"""
+        from scipy.sparse import csr_matrix
+        data = np.ones(len(self.indices), dtype=np.int8)
+        return csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+
+def tokenize(series):
+    """One row per (row position, lowercase token), duplicates removed"""
+    text = series.astype(object).where(series.notna(), '').astype(str).str.lower()
+    tokens = text.str.replace(TOKEN_DELIMITERS, ',', regex=True).str.split(',')
+    tokens = tokens.set_axis(np.arange(len(series))).explode().str.strip()
+    tokens = tokens[~tokens.isin(IGNORED_TOKENS)]
+    pairs = pd.DataFrame({'row': tokens.index.to_numpy(),
+                          'token': tokens.to_numpy(dtype=object)}).drop_duplicates()
+    return pd.Series(pairs['token'].to_numpy(), index=pairs['row'].to_numpy(), dtype=object)
+
+
+class TokenMatrices:
+    """Multi-hot matrices for the token fields over one shared vocabulary"""
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = vocabulary or TokenVocabulary()
+        self.matrices = {}
+
+    @classmethod
+    def from_frame(cls, df, fields=TOKEN_FIELDS, vocabulary=None):
+        token_matrices = cls(vocabulary)
+        for field in fields:
+            if field in df.columns:
+                token_matrices.add_field(field, df[field])
+        return token_matrices
+
+    def add_field(self, field, series):
+        # Tokenize each distinct value once, then expand to rows by code
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        tokens = tokenize(pd.Series(uniques, dtype=object))
+        unique_counts = np.bincount(tokens.index.to_numpy(), minlength=len(uniques))
+        unique_indptr = np.concatenate([[0], np.cumsum(unique_counts)])
+        unique_indices = self.vocabulary.encode(tokens)
+
+        counts = unique_counts[codes]
+        indptr = np.concatenate([[0], np.cumsum(counts)])
+        offsets = np.arange(indptr[-1]) - np.repeat(indptr[:-1], counts)
+        indices = unique_indices[np.repeat(unique_indptr[codes], counts) + offsets]
+        self.matrices[field] = (indptr, indices)
+
+    def __contains__(self, field):
+        return field in self.matrices
+
+    def matrix(self, field):
+        """CSR matrix for a field, sized to the current vocabulary"""
+        indptr, indices = self.matrices[field]
+        return MultiHotMatrix(indptr, indices, len(self.vocabulary))
+
+    def n_rows(self, field):
+        return len(self.matrices[field][0]) - 1
+
+    def contains_keyword(self, field, keyword):
+        """Rows of field with a token containing keyword"""
+        return self.matrix(field).any_of(self.vocabulary.keyword_mask(keyword))
+
+    def rows_with(self, field, token):
+        """Rows of field that have exactly this token"""
+        token_mask = np.zeros(len(self.vocabulary), dtype=bool)
+        if token.lower() in self.vocabulary.index:
+            token_mask[self.vocabulary.index[token.lower()]] = True
+        return self.matrix(field).any_of(token_mask)